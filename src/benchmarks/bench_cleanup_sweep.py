@@ -0,0 +1,89 @@
+"""
+AutoCleanUpActiveContacts sweep time against a stubbed Connect client.
+
+The stub answers describe_contact / stop_contact after a fixed delay that
+stands in for the API round trip; half of the contacts are stale and get
+stopped. Each row runs the full do_operation with CLEANUP_MAX_WORKERS set to
+the given worker count (1 is the previous sequential loop).
+
+Run from src/:
+    python benchmarks/bench_cleanup_sweep.py [--contacts 500] [--latency-ms 20]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SRC_PATH)
+os.environ.setdefault("INSTANCE_ID", "bench-instance")
+os.environ.setdefault("REGION", "us-east-1")
+
+from common.models.default_strategy import reset_warm_state  # noqa: E402
+from workflow.amazon_connect import auto_clean_up_active_contacts  # noqa: E402
+from workflow.amazon_connect.auto_clean_up_active_contacts import (  # noqa: E402
+    AutoCleanUpActiveContacts,
+)
+
+
+class StubConnectUtils:
+    """ConnectUtils stand-in sleeping latency seconds per API call."""
+
+    def __init__(self, region_name, instance_id, latency=0.02):
+        self.latency = latency
+        now = datetime.now(timezone.utc)
+        self.stale = now - timedelta(hours=3)
+        self.recent = now - timedelta(minutes=10)
+
+    def describe_contact(self, contact_id):
+        time.sleep(self.latency)
+        index = int(contact_id.rsplit("-", 1)[1])
+        ts = self.stale if index % 2 else self.recent
+        return {"Contact": {"Id": contact_id, "LastUpdateTimestamp": ts}}
+
+    def stop_contact(self, contact_id):
+        time.sleep(self.latency)
+        return {}
+
+
+def _sweep(contacts: int, workers: int, latency: float) -> tuple:
+    os.environ["CLEANUP_MAX_WORKERS"] = str(workers)
+    reset_warm_state()
+    strategy = AutoCleanUpActiveContacts({})
+    strategy.connect_utils = StubConnectUtils(None, None, latency)
+    contact_ids = [f"contact-{i}" for i in range(contacts)]
+    strategy._routing_profile_arn = lambda: ["rp-arn"]
+    strategy._active_contact_ids = lambda arns: contact_ids
+
+    start = time.perf_counter()
+    result = strategy.do_operation()
+    return time.perf_counter() - start, result["summary"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--contacts", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    auto_clean_up_active_contacts.ConnectUtils = StubConnectUtils
+
+    print(f"{'workers':>8}{'seconds':>10}{'contacts/s':>12}  summary")
+    baseline = None
+    for workers in args.workers:
+        elapsed, summary = _sweep(args.contacts, workers, args.latency_ms / 1000)
+        baseline = baseline or summary
+        assert summary == baseline, (summary, baseline)
+        print(
+            f"{workers:>8}{elapsed:>10.2f}{args.contacts / elapsed:>12.1f}  "
+            f"disconnected={summary['disconnected']} in_progress={summary['in_progress']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+EventSanitizer time on large Amazon Connect, API Gateway and S3 batch payloads.
+
+"legacy" reproduces the previous per-pattern re.sub loop with uncompiled
+patterns and the backtracking credit_card pattern; "recursive" is the original
+dict/list traversal with exact key matching; "current" walks dicts, lists and
+tuples with the single precompiled alternation and its pre-filter.
+
+Run from src/:
+    python benchmarks/bench_event_sanitizer.py [--repeat 20]
+"""
+
+import argparse
+import copy
+import json
+import os
+import re
+import sys
+import time
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SRC_PATH)
+
+from common.models.event_sanitizer import (  # noqa: E402
+    SENSITIVE_KEYS,
+    EventSanitizer,
+)
+
+CONNECT_EVENT_PATH = os.path.join(
+    SRC_PATH,
+    "test_data",
+    "amazon_connect_workflow",
+    "status_checker_connect_event_pass.json",
+)
+
+LEGACY_PATTERNS = {
+    "ssn": r"\b\d{3}-\d{2}-\d{4}\b",
+    "credit_card": r"\b(?:\d[ -]*?){13,16}\b",
+    "aws_key": r"AKIA[0-9A-Z]{16}",
+    "aws_secret": r"(?<![A-Za-z0-9])[A-Za-z0-9/+=]{40}(?![A-Za-z0-9])",
+}
+
+
+class LegacyEventSanitizer(EventSanitizer):
+    """Previous implementation: four re.sub calls per string."""
+
+    def _sanitize_value(self, value, key_name=None):
+        if isinstance(value, str):
+            sanitized_value = value
+            for name, pattern in LEGACY_PATTERNS.items():
+                mask = (
+                    self.custom_mask_text if self.custom_mask_text else f"***{name}***"
+                )
+                sanitized_value = re.sub(pattern, mask, sanitized_value)
+            return sanitized_value
+        return value
+
+
+class RecursiveEventSanitizer(EventSanitizer):
+    """Previous traversal: recursion per dict, isinstance chain per element."""
+
+    def _sanitize_dict(self, data, depth=0):
+        if data is None:
+            return {}
+        if isinstance(data, list):
+            return self._sanitize_list(data, depth)
+        if depth >= self.max_depth:
+            return "***max_depth_exceeded***"
+        sanitized = {}
+        for key, value in data.items():
+            lower_key = key.lower()
+            if lower_key in SENSITIVE_KEYS:
+                sanitized[key] = self._mask_value(value, lower_key)
+            elif isinstance(value, dict):
+                sanitized[key] = self._sanitize_dict(value, depth + 1)
+            elif isinstance(value, list):
+                sanitized[key] = self._sanitize_list(value, depth + 1)
+            else:
+                sanitized[key] = self._sanitize_value(value)
+        return sanitized
+
+    def _sanitize_list(self, data, depth):
+        return [
+            (
+                self._sanitize_dict(v, depth + 1)
+                if isinstance(v, dict)
+                else self._sanitize_value(v)
+            )
+            for v in data[: self.max_list_items]
+        ]
+
+
+def connect_payload(attributes: int = 500) -> dict:
+    """Contact flow event with many contact attributes."""
+    with open(CONNECT_EVENT_PATH) as event_file:
+        event = json.load(event_file)
+    contact_attributes = event["Details"]["ContactData"]["Attributes"]
+    for i in range(attributes):
+        contact_attributes[f"attribute_{i}"] = f"customer note {i} for queue transfer"
+        contact_attributes[f"reference_{i}"] = f"4a573372-1f28-4e26-b97b-{i:012d}"
+    contact_attributes["caller_ssn"] = "ssn on file 123-45-6789"
+    return event
+
+
+def api_gateway_payload(items: int = 2000) -> dict:
+    """API Gateway REST event with a large JSON body and long digit runs."""
+    body = {
+        "items": [
+            {
+                "id": f"item-{i}",
+                "description": "plain product description text",
+                "order_reference": "9" * 64,
+                "card": "4111 1111 1111 1111" if i % 100 == 0 else "n/a",
+            }
+            for i in range(items)
+        ]
+    }
+    return {
+        "resource": "/orders",
+        "httpMethod": "POST",
+        "headers": {"Content-Type": "application/json", "User-Agent": "bench"},
+        "requestContext": {"identity": {"sourceIp": "10.0.0.1"}, "stage": "prod"},
+        "body": json.dumps(body),
+        "parsed_body": body,
+    }
+
+
+def s3_batch_payload(records: int = 5000) -> list:
+    """Records list of an S3 notification batch, as returned by extract_event_data."""
+    return [
+        {
+            "eventVersion": "2.1",
+            "eventSource": "aws:s3",
+            "awsRegion": "eu-west-2",
+            "eventTime": "2024-01-01T00:00:00.000Z",
+            "eventName": "ObjectCreated:Put",
+            "userIdentity": {"principalId": "AWS:AIDAEXAMPLE"},
+            "requestParameters": {"sourceIPAddress": "10.0.0.1"},
+            "responseElements": {
+                "x-amz-request-id": f"C3D13FE58DE4C{i:03d}",
+                "x-amz-id-2": "FMyUVURIY8/IgAtTv8xRjskZQpcIZ9KG4V5Wp6S7S/JRWeUWerMUE5JgHvANOjpD",
+            },
+            "s3": {
+                "s3SchemaVersion": "1.0",
+                "configurationId": "upload-trigger",
+                "bucket": {
+                    "name": "upload-bucket",
+                    "ownerIdentity": {"principalId": "A3NL1KOZZKExample"},
+                    "arn": "arn:aws:s3:::upload-bucket",
+                },
+                "object": {
+                    "key": f"incoming/{i}/recording.wav",
+                    "size": 1024 + i,
+                    "eTag": "d41d8cd98f00b204e9800998ecf8427e",
+                    "sequencer": f"0055AED6DCD9028{i:05d}",
+                },
+            },
+        }
+        for i in range(records)
+    ]
+
+
+def _run(sanitizer_class, event: dict, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        sanitizer_class(event).get_sanitized_data()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = {
+        "amazon_connect": connect_payload(),
+        "api_gateway_rest": api_gateway_payload(),
+        "s3_batch": s3_batch_payload(),
+    }
+    implementations = {
+        "legacy": LegacyEventSanitizer,
+        "recursive": RecursiveEventSanitizer,
+        "current": EventSanitizer,
+    }
+
+    header = "".join(f"{name + ' ms':>14}" for name in implementations)
+    print(f"{'payload':<20}{header}")
+    for name, event in payloads.items():
+        timings = [
+            _run(sanitizer_class, copy.deepcopy(event), args.repeat)
+            for sanitizer_class in implementations.values()
+        ]
+        print(f"{name:<20}" + "".join(f"{timing:>14.2f}" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
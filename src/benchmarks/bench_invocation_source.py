@@ -0,0 +1,130 @@
+"""
+get_invocation_source classifications/sec over the sample events.
+
+Events are every JSON file under src/test_data plus one minimal event per
+source the detector knows. "legacy" reproduces the previous if-chain of
+predicate functions; "current" is the decision table with its top-level
+fast paths; "ratio" is current/legacy (above 1 is faster). Each rate is the
+best of --repeat runs. Events of sources the legacy chain did not know (SQS,
+Kinesis, DynamoDB Streams) are only timed with the current detector.
+
+Run from src/:
+    python benchmarks/bench_invocation_source.py [--rounds 20000] [--repeat 5]
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SRC_PATH)
+
+from common.models.find_invocation_source import (  # noqa: E402
+    _is_amazon_connect,
+    _is_api_gateway_http,
+    _is_api_gateway_rest,
+    _is_eventbridge,
+    _is_function_url,
+    _is_s3_event,
+    get_invocation_source,
+)
+
+SAMPLE_EVENTS = {
+    "api_gateway_rest": {
+        "resource": "/orders",
+        "headers": {"Host": "abc.execute-api.eu-west-2.amazonaws.com"},
+        "requestContext": {"apiId": "abc", "stage": "prod"},
+    },
+    "api_gateway_http": {
+        "routeKey": "POST /orders",
+        "headers": {"host": "abc.execute-api.eu-west-2.amazonaws.com"},
+        "requestContext": {"apiId": "abc", "http": {"method": "POST"}},
+    },
+    "function_url": {
+        "headers": {"host": "abc.lambda-url.eu-west-2.on.aws"},
+        "requestContext": {
+            "domainName": "abc.lambda-url.eu-west-2.on.aws",
+            "http": {"method": "GET"},
+        },
+    },
+    "s3": {"Records": [{"eventSource": "aws:s3", "s3": {"bucket": {"name": "b"}}}]},
+    "eventbridge": {"detail-type": "Contact Event", "source": "aws.connect"},
+}
+
+
+# sources the legacy if-chain could return
+LEGACY_SOURCES = {
+    "AMAZON_CONNECT",
+    "S3",
+    "EVENTBRIDGE",
+    "FUNCTION_URL",
+    "API_GATEWAY_HTTP",
+    "API_GATEWAY_REST",
+    "DIRECT_INVOKE",
+}
+
+
+def _legacy_get_invocation_source(event: dict) -> str:
+    """Previous implementation: predicate if-chain."""
+    if _is_amazon_connect(event):
+        return "AMAZON_CONNECT"
+    if _is_s3_event(event):
+        return "S3"
+    if _is_eventbridge(event):
+        return "EVENTBRIDGE"
+    if "headers" in event and "requestContext" in event:
+        request_context = event["requestContext"]
+        if _is_function_url(request_context):
+            return "FUNCTION_URL"
+        if _is_api_gateway_http(request_context):
+            return "API_GATEWAY_HTTP"
+        if _is_api_gateway_rest(request_context):
+            return "API_GATEWAY_REST"
+    return "DIRECT_INVOKE"
+
+
+def load_events() -> dict:
+    events = dict(SAMPLE_EVENTS)
+    pattern = os.path.join(SRC_PATH, "test_data", "**", "*.json")
+    for path in sorted(glob.glob(pattern, recursive=True)):
+        with open(path) as event_file:
+            events[os.path.basename(path)] = json.load(event_file)
+    return events
+
+
+def _rate(classify, event: dict, rounds: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            classify(event)
+        best = min(best, time.perf_counter() - start)
+    return rounds / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'event':<48}{'source':<18}{'legacy/s':>12}{'current/s':>12}{'ratio':>8}")
+    for name, event in load_events().items():
+        source = get_invocation_source(event)
+        current = _rate(get_invocation_source, event, args.rounds, args.repeat)
+        if source not in LEGACY_SOURCES:
+            print(f"{name:<48}{source:<18}{'-':>12}{current:>12.0f}{'-':>8}")
+            continue
+        assert source == _legacy_get_invocation_source(event), name
+        legacy = _rate(_legacy_get_invocation_source, event, args.rounds, args.repeat)
+        print(
+            f"{name:<48}{source:<18}{legacy:>12.0f}{current:>12.0f}"
+            f"{current / legacy:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
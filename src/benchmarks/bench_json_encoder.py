@@ -0,0 +1,79 @@
+"""
+Response serialization cost: LambdaResponse body plus the handler log record.
+
+"twice" serializes the response for the body and again for the log record,
+as the handler used to; "once" logs the serialized body as a RawJSON field.
+Each is run with the stdlib encoder and, when installed, orjson. The payload
+is a DynamoDB-style result (Decimal numbers, timestamps).
+
+Run from src/:
+    python benchmarks/bench_json_encoder.py [--calls 2000] [--items 200]
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import time
+from decimal import Decimal
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SRC_PATH)
+
+from common.models.json_encoder import (  # noqa: E402
+    RawJSON,
+    dumps,
+    encoder_name,
+    set_encoder,
+)
+from common.models.lambda_response import LambdaResponse  # noqa: E402
+
+
+def _payload(items: int) -> dict:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return {
+        "items": [
+            {
+                "contact_id": f"contact-{i}",
+                "duration": Decimal(i * 3),
+                "score": Decimal("0.75"),
+                "updated_at": now,
+                "queues": {"sales", "support"},
+            }
+            for i in range(items)
+        ]
+    }
+
+
+def _run(calls: int, payload: dict, once: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        response = LambdaResponse.success(message="ok", data=payload)
+        if once:
+            dumps({"message": "Strategy response", "response": RawJSON(response["body"])}, strict=False)
+        else:
+            dumps({"message": "Strategy response", "response": payload}, strict=False)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = _payload(args.items)
+    print(f"{'encoder':<10}{'twice us':>12}{'once us':>12}")
+    for encoder in ("stdlib", "orjson"):
+        os.environ["JSON_ENCODER"] = encoder
+        set_encoder()
+        if encoder not in encoder_name():
+            print(f"{encoder:<10}{'not installed':>24}")
+            continue
+        twice = _run(args.calls, payload, once=False)
+        once = _run(args.calls, payload, once=True)
+        print(f"{encoder:<10}{twice:>12.1f}{once:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Logger throughput: lines/sec for the caller-resolution strategies.
+
+"inspect" reproduces the previous inspect.getframeinfo lookup, "frame" is the
+current f_code/f_lineno fast path and "disabled" is LOG_CALLER_INFO=false.
+Records go to os.devnull so the numbers reflect Logger overhead plus a write.
+
+Run from src/:
+    python benchmarks/bench_logger.py [--lines 20000]
+"""
+
+import argparse
+import inspect
+import logging
+import os
+import sys
+import time
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SRC_PATH)
+
+from common.models.logger import Logger  # noqa: E402
+
+
+def _inspect_caller_info():
+    """Previous implementation: inspect.getframeinfo on the caller frame."""
+    frame = inspect.currentframe()
+    caller_frame = frame.f_back.f_back.f_back if frame else None
+    if caller_frame:
+        info = inspect.getframeinfo(caller_frame)
+        return info.function, os.path.basename(info.filename), info.lineno
+    return "unknown", "unknown", 0
+
+
+def _emit(logger: Logger, lines: int) -> float:
+    start = time.perf_counter()
+    for i in range(lines):
+        logger.info(f"Processing contact {i}/{lines}: contact-{i}")
+    return lines / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=20000)
+    args = parser.parse_args()
+
+    logger = Logger("bench_logger")
+    devnull = open(os.devnull, "w")
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.StreamHandler(devnull))
+
+    fast_caller_info = Logger._caller_info
+    results = {}
+    try:
+        Logger._caller_info = staticmethod(_inspect_caller_info)
+        results["inspect"] = _emit(logger, args.lines)
+        Logger._caller_info = fast_caller_info
+        results["frame"] = _emit(logger, args.lines)
+        logger.include_caller = False
+        results["disabled"] = _emit(logger, args.lines)
+    finally:
+        Logger._caller_info = fast_caller_info
+        logger.include_caller = True
+        devnull.close()
+
+    baseline = results["inspect"]
+    print(f"{'caller resolution':<20}{'lines/sec':>12}{'speedup':>10}")
+    for name, rate in results.items():
+        print(f"{name:<20}{rate:>12.0f}{rate / baseline:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Cold-start import cost per strategy.
+
+Every measurement runs in a fresh interpreter so nothing is already cached in
+sys.modules. "eager" imports every workflow module the way the factory used to
+(wildcard imports of all sources); each strategy row imports the factory and
+then loads only that strategy, which is what a cold start now pays.
+
+Run from src/:
+    python benchmarks/bench_strategy_import.py [--runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SRC_PATH)
+
+from common.models.strategy_registry import INVOCATION_SOURCE_STRATEGIES  # noqa: E402
+
+STRATEGY_SOURCES = {
+    request_type: (invocation_source, module_path)
+    for invocation_source, strategies in INVOCATION_SOURCE_STRATEGIES.items()
+    for request_type, module_path in strategies.items()
+}
+
+TIMER = "import time\n_start = time.perf_counter()\n{body}\nprint(time.perf_counter() - _start)\n"
+
+EAGER_BODY = "import common.models.strategy_factory\n" + "\n".join(
+    f"import {module}" for _, module in sorted(set(STRATEGY_SOURCES.values()))
+)
+
+LAZY_BODY = (
+    "import common.models.strategy_factory\n"
+    "from common.models.strategy_registry import get_strategy\n"
+    "get_strategy({invocation_source!r}, {request_type!r})"
+)
+
+
+def _measure(body: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(body=body)],
+            cwd=SRC_PATH,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="interpreters per row")
+    args = parser.parse_args()
+
+    print(f"{'strategy':<32}{'import ms (median)':>20}")
+    print(f"{'<eager: all workflows>':<32}{_measure(EAGER_BODY, args.runs):>20.1f}")
+    print(f"{'<factory only>':<32}{_measure('import common.models.strategy_factory', args.runs):>20.1f}")
+    for request_type, (invocation_source, _) in STRATEGY_SOURCES.items():
+        body = LAZY_BODY.format(
+            invocation_source=invocation_source, request_type=request_type
+        )
+        print(f"{request_type:<32}{_measure(body, args.runs):>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
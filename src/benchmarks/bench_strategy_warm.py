@@ -0,0 +1,84 @@
+"""
+Warm-invocation latency of DynamodbLookup through StrategyFactory.
+
+"cold state" drops the strategy warm state and the DynamoDB table cache
+(`dynamodb_utils_resource.table_utils`) before every call, which is what the
+factory paid when each call built its own DynamoDBUtilsResource (and boto3
+Table); "warm state" reuses the cached table utilities. The get_item
+lookup is replaced by a canned item, so the numbers are the in-process
+overhead only; the boto3 resource itself comes from the client registry in
+both rows.
+
+Run from src/:
+    python benchmarks/bench_strategy_warm.py [--calls 2000]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SRC_PATH)
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+from common.models.default_strategy import reset_warm_state  # noqa: E402
+from common.models.strategy_factory import StrategyFactory  # noqa: E402
+from common.utils_methods.dynamodb_utils_resource import (  # noqa: E402
+    DynamoDBUtilsResource,
+    reset_table_utils,
+)
+
+EVENT = {
+    "request_type": "DynamodbLookup",
+    "TABLE_NAME": "customers",
+    "KEY_NAME": "phone",
+    "KEY_VALUE": "+14155552671",
+}
+ITEM = {"phone": "+14155552671", "tier": "gold"}
+
+
+def _run(calls: int, keep_warm_state: bool) -> list:
+    samples = []
+    for _ in range(calls):
+        if not keep_warm_state:
+            reset_warm_state()
+            reset_table_utils()
+        start = time.perf_counter()
+        response = StrategyFactory(dict(EVENT), "AMAZON_CONNECT").execute()
+        samples.append(time.perf_counter() - start)
+        assert response == ITEM, response
+    return samples
+
+
+def _percentile(samples: list, fraction: float) -> float:
+    return sorted(samples)[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    DynamoDBUtilsResource.get_single_item_by_pk = lambda self, key_name, key_value: ITEM
+
+    # first call imports the strategy module; keep it out of both rows
+    _run(1, keep_warm_state=True)
+
+    print(f"{'mode':<14}{'p50 us':>10}{'p99 us':>10}{'mean us':>10}")
+    for label, keep_warm_state in (("cold state", False), ("warm state", True)):
+        samples = _run(args.calls, keep_warm_state)
+        print(
+            f"{label:<14}{_percentile(samples, 0.5) * 1e6:>10.1f}"
+            f"{_percentile(samples, 0.99) * 1e6:>10.1f}"
+            f"{statistics.mean(samples) * 1e6:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
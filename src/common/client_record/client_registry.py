@@ -0,0 +1,92 @@
+"""
+Process-wide registry of boto3 clients and resources.
+
+Lambda keeps the execution environment (and its module globals) alive between
+warm invocations, so clients created here are reused across invocations instead
+of paying for endpoint resolution and a new TLS handshake on every call.
+
+Clients are keyed by (kind, service, region, config). Creation is guarded by a
+lock because the default boto3 session is not thread-safe; the created clients
+themselves are safe to share between threads (resources should not be
+mutated concurrently). Tests should call `reset_clients()` to drop cached
+objects between cases.
+"""
+
+import threading
+from typing import Any, Optional
+
+import boto3
+from botocore.config import Config
+
+from common.models.logger import Logger
+
+logger = Logger(__name__)
+
+_REGISTRY: dict[tuple, Any] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _config_key(config: Optional[Config]) -> Optional[str]:
+    """Build a hashable, value-based key for a botocore Config."""
+    if config is None:
+        return None
+    options = getattr(config, "_user_provided_options", None) or {}
+    return repr(sorted(options.items()))
+
+
+def _get_or_create(kind: str, service_name: str, region_name: Optional[str], config):
+    key = (kind, service_name, region_name, _config_key(config))
+    cached = _REGISTRY.get(key)
+    if cached is not None:
+        return cached
+
+    with _REGISTRY_LOCK:
+        cached = _REGISTRY.get(key)
+        if cached is not None:
+            return cached
+
+        kwargs = {}
+        if region_name is not None:
+            kwargs["region_name"] = region_name
+        if config is not None:
+            kwargs["config"] = config
+
+        logger.debug(f"Creating boto3 {kind} for {service_name} in region:{region_name}")
+        factory = boto3.client if kind == "client" else boto3.resource
+        created = factory(service_name, **kwargs)
+        _REGISTRY[key] = created
+        return created
+
+
+def get_client(
+    service_name: str, region_name: Optional[str] = None, config: Optional[Config] = None
+):
+    """
+    arg:
+        service_name: boto3 service name (e.g. "connect", "s3")
+        region_name: AWS region name (default: boto3 resolution)
+        config: optional botocore Config
+    Return:
+        cached boto3 client shared by the whole process
+    """
+    return _get_or_create("client", service_name, region_name, config)
+
+
+def get_resource(
+    service_name: str, region_name: Optional[str] = None, config: Optional[Config] = None
+):
+    """
+    arg:
+        service_name: boto3 service name (e.g. "dynamodb")
+        region_name: AWS region name (default: boto3 resolution)
+        config: optional botocore Config
+    Return:
+        cached boto3 service resource shared by the whole process
+    """
+    return _get_or_create("resource", service_name, region_name, config)
+
+
+def reset_clients() -> None:
+    """Drop every cached client and resource (used by tests)."""
+    with _REGISTRY_LOCK:
+        _REGISTRY.clear()
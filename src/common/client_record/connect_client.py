@@ -1,8 +1,14 @@
-import boto3
+from botocore.config import Config
+
+from common.client_record.client_registry import get_client
 from common.models.logger import Logger
 
 logger = Logger(__name__)
 
+# ConnectUtils rate limits and retries every call itself; botocore retries
+# would hide throttles from its token bucket and multiply the attempts
+CONNECT_CLIENT_CONFIG = Config(retries={"total_max_attempts": 1, "mode": "standard"})
+
 
 def connect_client(region_name: str = "us-east-1"):
     """
@@ -12,4 +18,4 @@ def connect_client(region_name: str = "us-east-1"):
          amazon connect client
     """
     logger.info(f"Initating amazon connect client api with region:{region_name}")
-    return boto3.client("connect", region_name=region_name)
+    return get_client("connect", region_name=region_name, config=CONNECT_CLIENT_CONFIG)
@@ -1,4 +1,4 @@
-import boto3
+from common.client_record.client_registry import get_resource
 import boto3.dynamodb.conditions as dynamodb_conditions
 from common.models.logger import Logger
 
@@ -13,7 +13,7 @@ def dynamoDB_resource(region_name: str = "us-east-1"):
         dynamodb resource
     """
     logger.info(f"Initating dynamodb resource api region:{region_name}")
-    return boto3.resource("dynamodb", region_name=region_name)
+    return get_resource("dynamodb", region_name=region_name)
 
 
 def dynamoDB_condition_Expression():
@@ -1,4 +1,4 @@
-import boto3
+from common.client_record.client_registry import get_client
 from common.models.logger import Logger
 
 logger = Logger(__name__)
@@ -12,4 +12,4 @@ def s3_client():
         s3 client
     """
     logger.info(f"Initating s3 client api")
-    return boto3.client("s3")
+    return get_client("s3")
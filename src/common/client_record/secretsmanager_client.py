@@ -1,4 +1,4 @@
-import boto3
+from common.client_record.client_registry import get_client
 from common.models.logger import Logger
 
 logger = Logger(__name__)
@@ -12,4 +12,4 @@ def secretsmanager_client(region_name: str = "us-east-1"):
          amazon secretsmanager client
     """
     logger.info(f"Initating amazon secretsmanager client api with region:{region_name}")
-    return boto3.client("secretsmanager", region_name=region_name)
+    return get_client("secretsmanager", region_name=region_name)
@@ -1,4 +1,4 @@
-import boto3
+from common.client_record.client_registry import get_client
 from common.models.logger import Logger
 
 logger = Logger(__name__)
@@ -14,4 +14,4 @@ def sns_client(region_name: str = "us-east-1"):
     logger.info(
         f"Initating Amazon Simple Notification Service (SNS) client api with region:{region_name}"
     )
-    return boto3.client("sns", region_name=region_name)
+    return get_client("sns", region_name=region_name)
@@ -1,4 +1,4 @@
-import boto3
+from common.client_record.client_registry import get_client
 from common.models.logger import Logger
 
 logger = Logger(__name__)
@@ -14,4 +14,4 @@ def sqs_client(region_name: str = "us-east-1"):
     logger.info(
         f"Initating Amazon Simple Queue Service (SQS) api with region:{region_name}"
     )
-    return boto3.client("sqs", region_name=region_name)
+    return get_client("sqs", region_name=region_name)
@@ -1,4 +1,4 @@
-import boto3
+from common.client_record.client_registry import get_client
 from common.models.logger import Logger
 
 logger = Logger(__name__)
@@ -12,4 +12,4 @@ def transcribe_client(region_name: str = "us-east-1"):
         transcribe client
     """
     logger.info(f"Initating transcribe api with region:{region_name}")
-    return boto3.client("transcribe", region_name=region_name)
+    return get_client("transcribe", region_name=region_name)
@@ -0,0 +1,196 @@
+"""
+Runs a strategy once per record of a batched invocation (SQS, Kinesis,
+DynamoDB Streams, direct batch, ...).
+
+Each record is sanitized and dispatched through StrategyFactory on its own, so
+one bad message does not fail the rest of the batch. Failures are collected
+and returned as `batchItemFailures`, letting the event source mapping retry
+only the failed records.
+
+Unordered batches (standard SQS queues, direct batches) run on a bounded
+thread pool of BATCH_MAX_WORKERS threads, 4 by default, since the strategies
+spend most of their time waiting on AWS calls; the boto3 clients from the
+client registry are shared between the workers.
+Records are pulled from the (lazily decoding) record iterator in chunks of
+BATCH_CHUNK_SIZE per worker, so only a bounded slice of the batch is decoded
+and in flight at a time.
+Ordered batches (SQS FIFO, Kinesis, DynamoDB Streams) run sequentially and
+stop at the first failure: the failed record and every record after it are
+reported as failed, so the stream checkpoint is the first failed sequence
+number.
+
+Direct invokes carrying `{"batch": [...]}` go through `run`, which returns a
+result per item instead of the failure list.
+"""
+
+import json
+import os
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from common.models.event_sanitizer import EventSanitizer
+from common.models.lambda_response import LambdaResponse
+from common.models.logger import Logger
+from common.models.strategy_factory import StrategyFactory
+
+LOGGER = Logger(__name__)
+
+BATCH_MAX_WORKERS_ENV = "BATCH_MAX_WORKERS"
+DEFAULT_BATCH_MAX_WORKERS = 4
+
+# records submitted to the pool at a time, per worker
+BATCH_CHUNK_SIZE = 4
+
+# key of the item list in a direct invoke batch envelope
+DIRECT_BATCH_KEY = "batch"
+
+# reported when a record is not a JSON object; direct batch items are not
+# message bodies, so they get their own wording
+NOT_AN_OBJECT_MESSAGES = {"DIRECT_INVOKE": "Batch item is not a JSON object"}
+DEFAULT_NOT_AN_OBJECT_MESSAGE = "Record body is not a JSON object"
+
+
+def _is_error_response(response: Any) -> bool:
+    """StrategyFactory.execute reports failures as a LambdaResponse.error dict."""
+    return isinstance(response, dict) and response.get("result") == "error"
+
+
+def _error_message(response: Dict[str, Any]) -> Optional[str]:
+    try:
+        return json.loads(response["body"])["message"]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class BatchProcessor:
+    def __init__(
+        self,
+        invocation_source: str,
+        max_workers: Optional[int] = None,
+        ordered: bool = False,
+    ):
+        """
+        arg:
+            invocation_source: source the strategies are looked up for, e.g. "SQS"
+            max_workers: records processed concurrently (default BATCH_MAX_WORKERS, 4);
+                ignored when ordered
+            ordered: process sequentially and stop at the first failure
+        """
+        if max_workers is None:
+            try:
+                max_workers = int(
+                    os.environ.get(BATCH_MAX_WORKERS_ENV, DEFAULT_BATCH_MAX_WORKERS)
+                )
+            except ValueError:
+                max_workers = DEFAULT_BATCH_MAX_WORKERS
+        self.invocation_source = invocation_source
+        self.max_workers = max(1, max_workers)
+        self.ordered = ordered
+
+    def _process_record(self, item_identifier: Any, data: Any) -> Tuple[bool, Any]:
+        """
+        Run the strategy for one record.
+
+        Return:
+            (True, strategy response) on success, (False, error message) otherwise
+        """
+        with LOGGER.scoped_fields(item_identifier=item_identifier):
+            try:
+                if not isinstance(data, dict):
+                    message = NOT_AN_OBJECT_MESSAGES.get(
+                        self.invocation_source, DEFAULT_NOT_AN_OBJECT_MESSAGE
+                    )
+                    LOGGER.error(message)
+                    return False, message
+
+                event = EventSanitizer(
+                    data, invocation_source=self.invocation_source, lazy=True
+                ).get_sanitized_data()
+                response = StrategyFactory(event, self.invocation_source).execute()
+                if _is_error_response(response):
+                    LOGGER.error("Strategy failed for record")
+                    return False, _error_message(response)
+                return True, response
+            except Exception as e:
+                LOGGER.add_tempdata("error", str(e))
+                LOGGER.error("Error processing record: %s", e)
+                return False, str(e)
+
+    def _process_all(
+        self, records: Iterable[Tuple[Any, Any]]
+    ) -> Iterator[Tuple[Any, bool, Any]]:
+        """Yield (item identifier, succeeded, payload) in record order."""
+        if self.max_workers == 1:
+            for item_identifier, data in records:
+                yield (item_identifier, *self._process_record(item_identifier, data))
+            return
+
+        records = iter(records)
+        chunk_size = self.max_workers * BATCH_CHUNK_SIZE
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while chunk := list(islice(records, chunk_size)):
+                outcomes = executor.map(
+                    lambda record: self._process_record(*record), chunk
+                )
+                for (item_identifier, _), outcome in zip(chunk, outcomes):
+                    yield (item_identifier, *outcome)
+
+    def _process_ordered(self, records: Iterable[Tuple[Any, Any]]) -> List[Any]:
+        failed: List[Any] = []
+        for item_identifier, data in records:
+            if failed or not self._process_record(item_identifier, data)[0]:
+                failed.append(item_identifier)
+        return failed
+
+    def process(self, records: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+        """
+        arg:
+            records: (item identifier, data) pairs from extract_event_data
+        Return:
+            {"batchItemFailures": [{"itemIdentifier": ...}, ...]}
+        """
+        if self.ordered:
+            failed = self._process_ordered(records)
+        else:
+            failed = [
+                item_identifier
+                for item_identifier, succeeded, _ in self._process_all(records)
+                if not succeeded
+            ]
+
+        LOGGER.info(
+            "Batch processed",
+            invocation_source=self.invocation_source,
+            failed_count=len(failed),
+        )
+        return LambdaResponse.batch_item_failures(failed)
+
+    def run(self, records: Iterable[Tuple[Any, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run every record and return one result per record, in record order.
+
+        arg:
+            records: (item identifier, data) pairs, e.g. enumerate(event["batch"])
+        Return:
+            [{"item": id, "result": "success", "data": ...}
+             | {"item": id, "result": "error", "message": ...}, ...]
+        """
+        results = []
+        for item_identifier, succeeded, payload in self._process_all(records):
+            if succeeded:
+                results.append(
+                    {"item": item_identifier, "result": "success", "data": payload}
+                )
+            else:
+                results.append(
+                    {"item": item_identifier, "result": "error", "message": payload}
+                )
+
+        LOGGER.info(
+            "Batch executed",
+            invocation_source=self.invocation_source,
+            item_count=len(results),
+            failed_count=sum(1 for result in results if result["result"] == "error"),
+        )
+        return results
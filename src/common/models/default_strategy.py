@@ -1,11 +1,39 @@
+import threading
 from abc import ABC, abstractmethod
 from common.models.lambda_response import LambdaResponse
 
+# strategy class -> state built by its warm_init, kept for the container lifetime
+_WARM_STATE: dict[type, dict] = {}
+_WARM_LOCK = threading.Lock()
+
 
 class DefaultStrategy(ABC):
     def __init__(self, event):
         self.event = event
 
+    @classmethod
+    def warm_init(cls) -> dict:
+        """
+        Build state shared by every invocation of the strategy (clients, tables,
+        compiled data, ...). Runs once per container, on first use; override in
+        strategies with expensive setup and keep per-invocation state in __init__.
+        """
+        return {}
+
+    @classmethod
+    def warm_state(cls) -> dict:
+        """Return the warm_init state of this class, building it on first call."""
+        state = _WARM_STATE.get(cls)
+        if state is not None:
+            return state
+
+        with _WARM_LOCK:
+            state = _WARM_STATE.get(cls)
+            if state is None:
+                state = cls.warm_init()
+                _WARM_STATE[cls] = state
+        return state
+
     @abstractmethod
     def do_validate(self) -> tuple[bool, list]:
         """
@@ -19,3 +47,9 @@ class DefaultStrategy(ABC):
         Abstract method to perform the main operation of the strategy.
         Must be implemented by concrete strategy classes.
         """
+
+
+def reset_warm_state() -> None:
+    """Drop the warm state of every strategy (used by tests)."""
+    with _WARM_LOCK:
+        _WARM_STATE.clear()
@@ -1,6 +1,7 @@
+import os
 import re
-from typing import Any, Dict
-
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 SENSITIVE_KEYS = {
     "password",
@@ -26,18 +27,244 @@ SENSITIVE_KEYS = {
     "x-amz-security-token",
 }
 
+# Key names are compared after normalization (lowercase, "-" and "_" removed),
+# so "X-Api-Key", "apiKey" and "API_KEY" all match "api_key". SENSITIVE_KEYS
+# must match the whole normalized name; SENSITIVE_KEY_FRAGMENTS match anywhere
+# in it ("clientSecret", "user_password"). Short names such as "ssn", "dob" or
+# "auth" stay exact-only, as they occur inside unrelated words ("classname").
+SENSITIVE_KEY_FRAGMENTS = {
+    "password",
+    "passwd",
+    "secret",
+    "apikey",
+    "token",
+    "cardnumber",
+    "creditcard",
+    "authorization",
+    "accesskeyid",
+    "aadhar",
+}
+
+# per-process cache of classified key names: key -> mask label or None
+SENSITIVE_KEY_CACHE_SIZE = 4096
+
+
+def _normalize_key(key: str) -> str:
+    return key.lower().replace("-", "").replace("_", "")
+
+
+_NORMALIZED_SENSITIVE_KEYS = frozenset(_normalize_key(key) for key in SENSITIVE_KEYS)
+_SENSITIVE_FRAGMENT_SEARCH = re.compile(
+    "|".join(sorted(SENSITIVE_KEY_FRAGMENTS, key=len, reverse=True))
+).search
+_KEY_LABELS: Dict[Any, Optional[str]] = {}
+
+
+def sensitive_key_label(key: Any) -> Optional[str]:
+    """
+    Return the mask label for a sensitive key name, or None if it is not sensitive.
+
+    Results are memoized per process (bounded by SENSITIVE_KEY_CACHE_SIZE), so
+    key names repeated across records and warm invocations cost one dict hit.
+    """
+    try:
+        return _KEY_LABELS[key]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable key
+        return None
+
+    label = None
+    if isinstance(key, str):
+        normalized = _normalize_key(key)
+        if normalized in _NORMALIZED_SENSITIVE_KEYS or _SENSITIVE_FRAGMENT_SEARCH(
+            normalized
+        ):
+            label = key.lower()
+
+    if len(_KEY_LABELS) >= SENSITIVE_KEY_CACHE_SIZE:
+        _KEY_LABELS.clear()
+    _KEY_LABELS[key] = label
+    return label
+
+
 SENSITIVE_PATTERNS = {
     "ssn": r"\b\d{3}-\d{2}-\d{4}\b",
-    "credit_card": r"\b(?:\d[ -]*?){13,16}\b",
+    # every repetition must consume a digit, so long digit runs fail fast
+    "credit_card": r"\b\d(?:[ -]*\d){12,15}\b",
     "aws_key": r"AKIA[0-9A-Z]{16}",
     "aws_secret": r"(?<![A-Za-z0-9])[A-Za-z0-9/+=]{40}(?![A-Za-z0-9])",
 }
 
+# Single pass over each string: one alternation with a named group per
+# SENSITIVE_PATTERNS entry, the matching group name picking the mask. Branches
+# sharing the "not preceded by a letter/digit" guard are factored under one
+# lookbehind so most positions inside words are rejected by a single check.
+SENSITIVE_REGEX = re.compile(
+    r"(?<![A-Za-z0-9])(?:"
+    r"\b(?:(?P<ssn>\d{3}-\d{2}-\d{4}\b)|(?P<credit_card>\d(?:[ -]*\d){12,15}\b))"
+    r"|(?P<aws_secret>[A-Za-z0-9/+=]{40}(?![A-Za-z0-9]))"
+    r")"
+    r"|(?P<aws_key>AKIA[0-9A-Z]{16})"
+)
+
+# shortest string any pattern can match (ssn: "123-45-6789")
+_MIN_MATCH_LENGTH = 11
+# length of the only pattern (aws_secret) that can match without a digit or "AKIA"
+_SECRET_LENGTH = 40
+_HAS_DIGIT = re.compile(r"\d").search
+
+# containers traversed by the sanitizer; anything else is a leaf value
+_CONTAINER_TYPES = (dict, list, tuple)
+
+
+# Size limits keeping sanitization cost bounded on multi-MB payloads; each can be
+# overridden per instance or with the environment variable of the same name.
+SANITIZER_MAX_DEPTH_ENV = "SANITIZER_MAX_DEPTH"
+SANITIZER_MAX_STRING_LENGTH_ENV = "SANITIZER_MAX_STRING_LENGTH"
+SANITIZER_MAX_LIST_ITEMS_ENV = "SANITIZER_MAX_LIST_ITEMS"
+DEFAULT_MAX_DEPTH = 32
+DEFAULT_MAX_STRING_LENGTH = 256 * 1024
+DEFAULT_MAX_LIST_ITEMS = 10000
+# upper bound for max_depth. The traversal is plain recursion, one frame per
+# nesting level, not an explicit-stack walk; capping the depth keeps it well
+# under the interpreter recursion limit, and anything nested deeper is
+# replaced by MAX_DEPTH_MARKER rather than sanitized.
+MAX_DEPTH_LIMIT = 200
+
+# Truncation markers left in place of the data that was dropped
+MAX_DEPTH_MARKER = "***max_depth_exceeded***"
+STRING_TRUNCATED_MARKER = "...***truncated {count} chars***"
+LIST_TRUNCATED_MARKER = "***truncated {count} items***"
+
+# Known-safe values per invocation source, as key paths relative to the data
+# returned by `extract_event_data`; "*" matches any key or list index. They are
+# passed through as-is, without being scanned. Only leaf keys are listed, either
+# with a format AWS fixes or identifying a resource the strategy must address;
+# paths, headers and whole objects can carry caller data and are always scanned.
+SAFE_PATHS: Dict[str, List[Tuple[str, ...]]] = {
+    "API_GATEWAY_REST": [
+        ("identity", "sourceIp"),
+        ("identity", "userAgent"),
+        ("requestId",),
+        ("requestTimeEpoch",),
+        ("httpMethod",),
+        ("stage",),
+        ("apiId",),
+    ],
+    "API_GATEWAY_HTTP": [
+        ("http", "method"),
+        ("http", "protocol"),
+        ("http", "sourceIp"),
+        ("requestId",),
+        ("timeEpoch",),
+        ("routeKey",),
+        ("stage",),
+        ("apiId",),
+    ],
+    "FUNCTION_URL": [
+        ("http", "method"),
+        ("http", "protocol"),
+        ("http", "sourceIp"),
+        ("requestId",),
+        ("timeEpoch",),
+        ("domainName",),
+    ],
+    # S3 data is {"request_type", "Records"} (see S3_REQUEST_TYPE); bucket
+    # names and object keys locate the object, so they must reach the strategy
+    # unmasked even when a key contains a digit run or a 40 character segment
+    "S3": [
+        ("Records", "*", "eventTime"),
+        ("Records", "*", "eventName"),
+        ("Records", "*", "awsRegion"),
+        ("Records", "*", "responseElements", "x-amz-request-id"),
+        ("Records", "*", "responseElements", "x-amz-id-2"),
+        ("Records", "*", "s3", "bucket", "name"),
+        ("Records", "*", "s3", "bucket", "arn"),
+        ("Records", "*", "s3", "object", "key"),
+        ("Records", "*", "s3", "object", "versionId"),
+    ],
+    # EventBridge data is the event "detail"
+    "EVENTBRIDGE": [
+        ("bucket", "name"),
+        ("object", "key"),
+        ("object", "version-id"),
+    ],
+}
+
+
+def _build_path_trie(paths: List[Tuple[str, ...]]) -> Dict:
+    """Nest key paths into a trie whose leaves are True (safe subtree)."""
+    trie: Dict = {}
+    for path in paths:
+        node = trie
+        for key in path[:-1]:
+            child = node.setdefault(key, {})
+            if child is True:
+                break
+            node = child
+        else:
+            node[path[-1]] = True
+    return trie
+
+
+_SAFE_PATH_TRIES = {
+    source: _build_path_trie(paths) for source, paths in SAFE_PATHS.items()
+}
+
+
+def _limit(value: Optional[int], env_name: str, default: int) -> int:
+    if value is None:
+        try:
+            value = int(os.environ.get(env_name, default))
+        except ValueError:
+            value = default
+    return max(1, value)
+
 
 class EventSanitizer:
 
-    def __init__(self, event: Dict = None, mask_text: str = None):
+    def __init__(
+        self,
+        event: Dict = None,
+        mask_text: str = None,
+        invocation_source: str = None,
+        max_depth: int = None,
+        max_string_length: int = None,
+        max_list_items: int = None,
+        lazy: bool = False,
+    ):
+        """
+        arg:
+            event: data to sanitize (usually the output of extract_event_data)
+            mask_text: replaces every masked value instead of "***<name>***"
+            invocation_source: selects the SAFE_PATHS passed through unchanged
+            max_depth: containers nested deeper are replaced by MAX_DEPTH_MARKER
+                (at most MAX_DEPTH_LIMIT)
+            max_string_length: longer strings are cut to this length before scanning
+            max_list_items: longer lists keep this many items plus a marker
+            lazy: return a SanitizedView that sanitizes values on first access
+                instead of copying the whole event up front
+        """
+        self.lazy = lazy
         self.custom_mask_text = mask_text
+        self.max_depth = min(
+            _limit(max_depth, SANITIZER_MAX_DEPTH_ENV, DEFAULT_MAX_DEPTH),
+            MAX_DEPTH_LIMIT,
+        )
+        self.max_string_length = _limit(
+            max_string_length,
+            SANITIZER_MAX_STRING_LENGTH_ENV,
+            DEFAULT_MAX_STRING_LENGTH,
+        )
+        self.max_list_items = _limit(
+            max_list_items, SANITIZER_MAX_LIST_ITEMS_ENV, DEFAULT_MAX_LIST_ITEMS
+        )
+        self._safe_paths = _SAFE_PATH_TRIES.get(invocation_source)
+        self._pattern_masks = {
+            name: mask_text if mask_text else f"***{name}***"
+            for name in SENSITIVE_PATTERNS
+        }
         self.sanitized_data = self._sanitize_dict(event)
 
     def _mask_value(self, value: Any, key_name: str) -> Any:
@@ -47,41 +274,159 @@ class EventSanitizer:
             return self.custom_mask_text
         return f"***{key_name}***"
 
+    @staticmethod
+    def _may_contain_sensitive(value: str) -> bool:
+        """Cheap pre-filter: False if no pattern can possibly match the string."""
+        if len(value) < _MIN_MATCH_LENGTH:
+            return False
+        if len(value) >= _SECRET_LENGTH or "AKIA" in value:
+            return True
+        return _HAS_DIGIT(value) is not None
+
+    def _replace_match(self, match: re.Match) -> str:
+        return self._pattern_masks[match.lastgroup]
+
     def _sanitize_value(self, value: Any, key_name: str = None) -> Any:
         if isinstance(value, str):
-            sanitized_value = value
-            for name, pattern in SENSITIVE_PATTERNS.items():
-                mask = (
-                    self.custom_mask_text if self.custom_mask_text else f"***{name}***"
-                )
-                sanitized_value = re.sub(pattern, mask, sanitized_value)
-            return sanitized_value
+            truncated = len(value) - self.max_string_length
+            if truncated > 0:
+                value = value[: self.max_string_length]
+            if self._may_contain_sensitive(value):
+                value = SENSITIVE_REGEX.sub(self._replace_match, value)
+            if truncated > 0:
+                value += STRING_TRUNCATED_MARKER.format(count=truncated)
+            return value
         return value
 
-    def _sanitize_dict(self, data: Dict) -> Dict:
+    @staticmethod
+    def _safe_child(safe_paths: Optional[Dict], key: Any) -> Any:
+        """Trie node for key: True if the subtree is safe, None if no path matches."""
+        if not safe_paths:
+            return None
+        child = safe_paths.get(key)
+        return child if child is not None else safe_paths.get("*")
 
-        if data is None:
-            return {}
+    def _sanitize_item(
+        self, key: Any, value: Any, depth: int, safe_paths: Optional[Dict]
+    ) -> Any:
+        """Sanitize the value stored under key in a mapping at the given depth."""
+        safe_child = self._safe_child(safe_paths, key) if safe_paths else None
+        if safe_child is True:
+            return value
+
+        label = sensitive_key_label(key)
+        if label is not None:
+            return self._mask_value(value, label)
+        if isinstance(value, str):
+            return self._sanitize_value(value)
+        if isinstance(value, _CONTAINER_TYPES):
+            return self._sanitize_container(value, depth + 1, safe_child)
+        return value
 
-        sanitized = {}
-        for key, value in data.items():
-            lower_key = key.lower()
-            if lower_key in SENSITIVE_KEYS:
-                sanitized[key] = self._mask_value(value, lower_key)
-            elif isinstance(value, dict):
-                sanitized[key] = self._sanitize_dict(value)
-            elif isinstance(value, list):
-                sanitized[key] = [
-                    (
-                        self._sanitize_dict(v)
-                        if isinstance(v, dict)
-                        else self._sanitize_value(v)
-                    )
-                    for v in value
-                ]
+    def _sanitize_container(
+        self, data: Any, depth: int = 0, safe_paths: Optional[Dict] = None
+    ) -> Any:
+        """
+        Sanitize a dict, list or tuple, recursing into nested containers.
+
+        Recursion stops at max_depth, which is capped at MAX_DEPTH_LIMIT so deep
+        payloads are cut by a marker before the interpreter recursion limit.
+        In lazy mode dicts become SanitizedViews and are not traversed.
+        """
+        if depth >= self.max_depth:
+            return MAX_DEPTH_MARKER
+
+        if isinstance(data, dict):
+            if self.lazy:
+                return SanitizedView(data, self, depth, safe_paths)
+            sanitize_item = self._sanitize_item
+            sanitized = {}
+            for key, value in data.items():
+                sanitized[key] = sanitize_item(key, value, depth, safe_paths)
+            return sanitized
+
+        sanitized = []
+        for index, value in enumerate(data[: self.max_list_items]):
+            safe_child = self._safe_child(safe_paths, index) if safe_paths else None
+            if safe_child is True:
+                sanitized.append(value)
+            elif isinstance(value, str):
+                sanitized.append(self._sanitize_value(value))
+            elif isinstance(value, _CONTAINER_TYPES):
+                sanitized.append(self._sanitize_container(value, depth + 1, safe_child))
             else:
-                sanitized[key] = self._sanitize_value(value)
-        return sanitized
+                sanitized.append(value)
+        truncated = len(data) - self.max_list_items
+        if truncated > 0:
+            sanitized.append(LIST_TRUNCATED_MARKER.format(count=truncated))
+        return tuple(sanitized) if isinstance(data, tuple) else sanitized
+
+    def _sanitize_dict(self, data: Dict) -> Any:
+        if data is None:
+            return {}
+        return self._sanitize_container(data, 0, self._safe_paths)
 
     def get_sanitized_data(self) -> Dict:
         return self.sanitized_data
+
+
+class SanitizedView(Mapping):
+    """
+    Read-only view of an event that sanitizes each value on first access.
+
+    Values are memoized, so work and memory scale with the keys a strategy
+    actually reads rather than with the size of the event. Nested dicts are
+    views themselves; `to_dict()` materializes the fully masked copy, repr only
+    reports the key counts.
+    """
+
+    __slots__ = ("_data", "_sanitizer", "_depth", "_safe_paths", "_cache")
+
+    def __init__(
+        self,
+        data: Dict,
+        sanitizer: EventSanitizer,
+        depth: int = 0,
+        safe_paths: Optional[Dict] = None,
+    ):
+        self._data = data
+        self._sanitizer = sanitizer
+        self._depth = depth
+        self._safe_paths = safe_paths
+        self._cache: Dict[Any, Any] = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        value = self._sanitizer._sanitize_item(
+            key, self._data[key], self._depth, self._safe_paths
+        )
+        self._cache[key] = value
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def to_dict(self) -> Dict:
+        """Sanitized deep copy with nested views converted to plain dicts."""
+        return {key: _materialize(value) for key, value in self.items()}
+
+    def __repr__(self) -> str:
+        # never materializes the view: repr is hit by logging and debuggers
+        return f"<SanitizedView {len(self._data)} keys, {len(self._cache)} sanitized>"
+
+
+def _materialize(value: Any) -> Any:
+    if isinstance(value, SanitizedView):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return type(value)(_materialize(item) for item in value)
+    return value
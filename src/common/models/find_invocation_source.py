@@ -9,11 +9,24 @@ A utility to identify common Lambda invocation sources:
 - API Gateway (HTTP API v2)
 - Lambda Function URL
 - S3 Events
+- SQS messages
+- Kinesis Data Streams records
+- DynamoDB Streams records
 - EventBridge/CloudWatch Events
 - Direct Invoke
+
+Detection runs through a decision table instead of an if-chain: each entry
+names the top-level keys that trigger it, so an event is only tested against
+the classifiers whose keys it carries. Connect, direct invoke, record-based
+(`Records` with an `eventSource`, one dict lookup), EventBridge and HTTP events
+are matched by top-level key checks before the table walk. New sources are added with `register_invocation_source` /
+`register_record_source`.
 """
 
-from typing import Literal
+import base64
+import json
+import os
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Tuple
 
 InvocationSource = Literal[
     "AMAZON_CONNECT",
@@ -21,6 +34,9 @@ InvocationSource = Literal[
     "API_GATEWAY_HTTP",
     "FUNCTION_URL",
     "S3",
+    "SQS",
+    "KINESIS",
+    "DYNAMODB_STREAMS",
     "EVENTBRIDGE",
     "DIRECT_INVOKE",
 ]
@@ -84,6 +100,232 @@ def _is_api_gateway_rest(request_context: dict) -> bool:
     ) and not _is_function_url(request_context)
 
 
+Classifier = Callable[[dict], Optional[str]]
+Extractor = Callable[[dict], Any]
+
+def _classify_amazon_connect(event: dict) -> Optional[str]:
+    return "AMAZON_CONNECT" if _is_amazon_connect(event) else None
+
+
+# eventSource of the first record -> invocation source
+_RECORD_SOURCES: Dict[str, str] = {
+    "aws:s3": "S3",
+    "aws:sqs": "SQS",
+    "aws:kinesis": "KINESIS",
+    "aws:dynamodb": "DYNAMODB_STREAMS",
+}
+
+# sources delivering a batch of records, each run through the strategy on its
+# own and reported back with batchItemFailures
+BATCH_INVOCATION_SOURCES = {"SQS", "KINESIS", "DYNAMODB_STREAMS"}
+
+# stream sources are checkpointed by sequence number and processed in order
+STREAM_INVOCATION_SOURCES = {"KINESIS", "DYNAMODB_STREAMS"}
+
+# request_type given to stream records that do not carry one, e.g. Connect
+# contact trace records or table changes routed to a single strategy
+STREAM_REQUEST_TYPE_ENV = "STREAM_REQUEST_TYPE"
+
+# request_type given to S3 notifications, which never carry one
+S3_REQUEST_TYPE_ENV = "S3_REQUEST_TYPE"
+
+
+def _classify_records(event: dict) -> Optional[str]:
+    records = event["Records"]
+    if not records or not isinstance(records, list):
+        return None
+    first_record = records[0]
+    event_source = first_record.get("eventSource") or first_record.get("EventSource")
+    return _RECORD_SOURCES.get(event_source)
+
+
+def _classify_eventbridge(event: dict) -> Optional[str]:
+    return "EVENTBRIDGE" if _is_eventbridge(event) else None
+
+
+def _classify_http(event: dict) -> Optional[str]:
+    if "headers" not in event:
+        return None
+    request_context = event["requestContext"]
+    # same checks as _is_function_url / _is_api_gateway_http / _is_api_gateway_rest
+    if ".lambda-url." in request_context.get("domainName", ""):
+        return "FUNCTION_URL"
+    if "http" in request_context:
+        return "API_GATEWAY_HTTP"
+    if "apiId" in request_context or "stage" in request_context:
+        return "API_GATEWAY_REST"
+    return None
+
+
+# (trigger key, classifier) in priority order; a classifier only runs when the
+# event has its trigger key at the top level
+_CLASSIFIERS: List[Tuple[str, Classifier]] = [
+    ("Name", _classify_amazon_connect),
+    ("Details", _classify_amazon_connect),
+    ("Records", _classify_records),
+    ("detail-type", _classify_eventbridge),
+    ("requestContext", _classify_http),
+]
+# trigger keys added by register_invocation_source; an event with none of the
+# built-in or registered trigger keys is a direct invoke
+_REGISTERED_TRIGGER_KEYS: frozenset = frozenset()
+
+
+def _extract_amazon_connect(event: dict) -> dict:
+    return event.get("Details", {}).get("ContactData", {}).get("Attributes", {})
+
+
+def _extract_sqs(event: dict) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (messageId, body) per SQS record, the body parsed from JSON.
+
+    Parsing happens as the batch is consumed; a body that is not valid JSON is
+    yielded as the raw string so only that message fails.
+    """
+    for record in event.get("Records", []):
+        body = record.get("body")
+        try:
+            body = json.loads(body)
+        except (TypeError, ValueError):
+            pass
+        yield record.get("messageId"), body
+
+
+def _extract_s3(event: dict) -> Any:
+    """
+    The Records of the notification; with S3_REQUEST_TYPE set,
+    {"request_type", "Records"} so the records can be dispatched to a strategy.
+    """
+    records = event.get("Records", [])
+    request_type = os.environ.get(S3_REQUEST_TYPE_ENV)
+    if request_type:
+        return {"request_type": request_type, "Records": records}
+    return records
+
+
+def _with_stream_request_type(data: Any) -> Any:
+    request_type = os.environ.get(STREAM_REQUEST_TYPE_ENV)
+    if request_type and isinstance(data, dict):
+        data.setdefault("request_type", request_type)
+    return data
+
+
+def _extract_kinesis(event: dict) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (sequenceNumber, data) per Kinesis record, data decoded from
+    base64 JSON as the batch is consumed.
+
+    Data that is not valid base64 JSON is yielded as None so only that record
+    fails; its sequence number becomes the checkpoint.
+    """
+    for record in event.get("Records", []):
+        kinesis = record.get("kinesis", {})
+        try:
+            data = json.loads(base64.b64decode(kinesis.get("data", ""), validate=True))
+        except (TypeError, ValueError):
+            data = None
+        yield kinesis.get("sequenceNumber"), _with_stream_request_type(data)
+
+
+def _extract_dynamodb_streams(event: dict) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (SequenceNumber, item) per INSERT / MODIFY DynamoDB Streams record.
+
+    The item is the NewImage converted from the DynamoDB JSON format, with
+    Decimal numbers as returned by boto3, and the record's eventName added.
+    REMOVE records are skipped, so a deleted item is never written back;
+    records without a NewImage are yielded as None and fail on their own.
+    """
+    # boto3 is only imported once a stream event is actually received
+    from boto3.dynamodb.types import TypeDeserializer
+
+    deserializer = TypeDeserializer()
+    for record in event.get("Records", []):
+        event_name = record.get("eventName")
+        if event_name == "REMOVE":
+            continue
+        change = record.get("dynamodb", {})
+        try:
+            item = {
+                key: deserializer.deserialize(value)
+                for key, value in change["NewImage"].items()
+            }
+        except (AttributeError, KeyError, TypeError, ValueError):
+            item = None
+        if item is not None and event_name:
+            item.setdefault("eventName", event_name)
+        yield change.get("SequenceNumber"), _with_stream_request_type(item)
+
+
+# invocation source -> data passed to strategies; DIRECT_INVOKE keeps the event
+_EXTRACTORS: Dict[str, Extractor] = {
+    "AMAZON_CONNECT": _extract_amazon_connect,
+    "API_GATEWAY_REST": lambda event: event.get("requestContext", {}),
+    "API_GATEWAY_HTTP": lambda event: event.get("requestContext", {}),
+    "FUNCTION_URL": lambda event: event.get("requestContext", {}),
+    "S3": _extract_s3,
+    "SQS": _extract_sqs,
+    "KINESIS": _extract_kinesis,
+    "DYNAMODB_STREAMS": _extract_dynamodb_streams,
+    "EVENTBRIDGE": lambda event: event.get("detail", {}),
+}
+
+
+def register_invocation_source(
+    trigger_key: str,
+    classifier: Classifier,
+    invocation_source: Optional[str] = None,
+    extractor: Optional[Extractor] = None,
+) -> None:
+    """
+    Add a classifier to the decision table, after the built-in sources.
+
+    arg:
+        trigger_key: top-level event key whose presence makes the classifier run
+        classifier: returns the invocation source name, or None if not matched
+        invocation_source: source the extractor is registered for
+        extractor: returns the data passed to strategies for that source
+    """
+    global _REGISTERED_TRIGGER_KEYS
+    _CLASSIFIERS.append((trigger_key, classifier))
+    _REGISTERED_TRIGGER_KEYS = _REGISTERED_TRIGGER_KEYS | {trigger_key}
+    if invocation_source and extractor:
+        _EXTRACTORS[invocation_source] = extractor
+
+
+def register_record_source(
+    event_source: str, invocation_source: str, extractor: Optional[Extractor] = None
+) -> None:
+    """
+    Map a `Records[].eventSource` value (e.g. "aws:sqs") to an invocation source.
+
+    arg:
+        event_source: eventSource / EventSource of the records
+        invocation_source: name returned by get_invocation_source
+        extractor: returns the data passed to strategies for that source
+    """
+    _RECORD_SOURCES[event_source] = invocation_source
+    if extractor:
+        _EXTRACTORS[invocation_source] = extractor
+
+
+def is_ordered_batch(event: dict, invocation_source: str) -> bool:
+    """
+    True if the records of a batch must be processed in order.
+
+    SQS FIFO queues require that processing stops at the first failure so the
+    failed message and everything after it in its group are retried in order.
+    Kinesis and DynamoDB Streams shards are always processed in order; the
+    first failed sequence number is the checkpoint the stream resumes from.
+    """
+    if invocation_source in STREAM_INVOCATION_SOURCES:
+        return True
+    if invocation_source == "SQS":
+        records = event.get("Records") or [{}]
+        return records[0].get("eventSourceARN", "").endswith(".fifo")
+    return False
+
+
 def get_invocation_source(event: dict) -> InvocationSource:
     """
     Detect the source of a Lambda invocation from the event structure.
@@ -107,25 +349,41 @@ def get_invocation_source(event: dict) -> InvocationSource:
         >>> get_invocation_source(event)
         'S3'
     """
-
-    if _is_amazon_connect(event):
-        return "AMAZON_CONNECT"
-
-    if _is_s3_event(event):
-        return "S3"
-
-    if _is_eventbridge(event):
-        return "EVENTBRIDGE"
-
-    if "headers" in event and "requestContext" in event:
-        request_context = event["requestContext"]
-
-        if _is_function_url(request_context):
-            return "FUNCTION_URL"
-        if _is_api_gateway_http(request_context):
-            return "API_GATEWAY_HTTP"
-        if _is_api_gateway_rest(request_context):
-            return "API_GATEWAY_REST"
+    # fast paths for the hottest shapes, checked with top-level keys only and
+    # giving the same answer as the table below
+    details = event.get("Details")
+    if details is not None:
+        if "ContactData" in details:
+            return "AMAZON_CONNECT"
+    elif "Name" not in event:
+        if "Records" in event:
+            records = event["Records"]
+            if records and isinstance(records, list):
+                first_record = records[0]
+                invocation_source = _RECORD_SOURCES.get(
+                    first_record.get("eventSource") or first_record.get("EventSource")
+                )
+                if invocation_source is not None:
+                    return invocation_source
+        elif "detail-type" in event:
+            if event.get("source", "") != "aws.events":
+                return "EVENTBRIDGE"
+        elif "requestContext" in event:
+            invocation_source = _classify_http(event)
+            if invocation_source is not None:
+                return invocation_source
+        elif not _REGISTERED_TRIGGER_KEYS or not any(
+            trigger_key in event for trigger_key in _REGISTERED_TRIGGER_KEYS
+        ):
+            # none of the built-in trigger keys; probing them one by one stays
+            # cheap however wide a direct payload is
+            return "DIRECT_INVOKE"
+
+    for trigger_key, classifier in _CLASSIFIERS:
+        if trigger_key in event:
+            invocation_source = classifier(event)
+            if invocation_source is not None:
+                return invocation_source
 
     return "DIRECT_INVOKE"
 
@@ -155,13 +413,7 @@ def extract_event_data(event: dict, invocation_source: InvocationSource) -> dict
         >>> data = extract_event_data(event, "S3")
         >>> print(data[0]['s3']['bucket']['name'])
     """
-    if invocation_source == "AMAZON_CONNECT":
-        return event.get("Details", {}).get("ContactData", {}).get("Attributes", {})
-    elif invocation_source in ("API_GATEWAY_REST", "API_GATEWAY_HTTP", "FUNCTION_URL"):
-        return event.get("requestContext", {})
-    elif invocation_source == "S3":
-        return event.get("Records", [])
-    elif invocation_source == "EVENTBRIDGE":
-        return event.get("detail", {})
-    else:  # DIRECT_INVOKE
+    extractor = _EXTRACTORS.get(invocation_source)
+    if extractor is None:  # DIRECT_INVOKE
         return event
+    return extractor(event)
@@ -0,0 +1,37 @@
+import time
+
+# time.monotonic() value at which the current invocation times out, None if unknown
+DEADLINE_CACHE = None
+
+
+class InvocationDeadline:
+    @staticmethod
+    def init(context):
+        global DEADLINE_CACHE
+
+        # dict contexts (tests) and contexts without a usable
+        # get_remaining_time_in_millis leave the deadline unknown
+        get_remaining = getattr(context, "get_remaining_time_in_millis", None)
+        remaining_ms = get_remaining() if callable(get_remaining) else None
+
+        if isinstance(remaining_ms, (int, float)) and not isinstance(
+            remaining_ms, bool
+        ):
+            DEADLINE_CACHE = time.monotonic() + remaining_ms / 1000
+        else:
+            DEADLINE_CACHE = None
+
+    @staticmethod
+    def remaining_seconds():
+        """Seconds left before the invocation times out, None if unknown."""
+        if DEADLINE_CACHE is None:
+            return None
+        return DEADLINE_CACHE - time.monotonic()
+
+    @staticmethod
+    def set(remaining_seconds):
+        """Set the deadline to remaining_seconds from now; None clears it."""
+        global DEADLINE_CACHE
+        DEADLINE_CACHE = (
+            None if remaining_seconds is None else time.monotonic() + remaining_seconds
+        )
@@ -0,0 +1,123 @@
+"""
+JSON encoder shared by LambdaResponse and Logger.
+
+Uses orjson when it is installed (JSON_ENCODER=orjson|stdlib|auto, default
+auto) and the stdlib json module otherwise. Both encoders produce UTF-8 text
+(no \\u escapes) and handle the types strategies return natively:
+
+- datetime / date / time: ISO 8601 string
+- Decimal (DynamoDB numbers): int when integral, float otherwise; integers
+  beyond 64 bits are written exactly by the stdlib encoder
+- set / frozenset: list
+- Mapping (e.g. a SanitizedView of the event): object
+
+`RawJSON` marks a string that is already serialized JSON; the Logger writes
+such fields as-is instead of serializing them again.
+"""
+
+import datetime
+import json
+import os
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+JSON_ENCODER_ENV = "JSON_ENCODER"
+
+Encoder = Callable[[Any, bool], str]
+
+
+class RawJSON(str):
+    """A string holding serialized JSON, embedded verbatim by the Logger."""
+
+
+def _default(value: Any) -> Any:
+    """Convert the non-JSON types strategies return; raise TypeError otherwise."""
+    if isinstance(value, Decimal):
+        if value.is_finite() and value == value.to_integral_value():
+            return int(value)
+        return float(value)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _lenient_default(value: Any) -> Any:
+    """Logger fallback: anything unknown is written as its str()."""
+    try:
+        return _default(value)
+    except TypeError:
+        return str(value)
+
+
+def _stdlib_dumps(value: Any, strict: bool = True) -> str:
+    return json.dumps(
+        value, ensure_ascii=False, default=_default if strict else _lenient_default
+    )
+
+
+def _load_orjson() -> Optional[Encoder]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    options = orjson.OPT_NON_STR_KEYS
+
+    def _orjson_dumps(value: Any, strict: bool = True) -> str:
+        try:
+            return orjson.dumps(
+                value,
+                default=_default if strict else _lenient_default,
+                option=options,
+            ).decode()
+        except orjson.JSONEncodeError:
+            # orjson only encodes 64-bit integers; large DynamoDB numbers
+            # (Decimal / int) and anything else it rejects go through the
+            # stdlib encoder, which raises the TypeError if it is unsupported
+            return _stdlib_dumps(value, strict)
+
+    return _orjson_dumps
+
+
+def _select_encoder() -> Encoder:
+    choice = os.environ.get(JSON_ENCODER_ENV, "auto").strip().lower()
+    if choice != "stdlib":
+        orjson_dumps = _load_orjson()
+        if orjson_dumps is not None:
+            return orjson_dumps
+    return _stdlib_dumps
+
+
+_encoder: Encoder = _select_encoder()
+
+
+def dumps(value: Any, strict: bool = True) -> str:
+    """
+    arg:
+        value: object to serialize
+        strict: raise TypeError on unsupported types; False writes them as str()
+    Return:
+        JSON text from the active encoder
+    """
+    return _encoder(value, strict)
+
+
+def set_encoder(encoder: Optional[Encoder] = None) -> None:
+    """
+    Replace the active encoder; None selects it again from JSON_ENCODER.
+
+    arg:
+        encoder: callable(value, strict) -> str
+    """
+    global _encoder
+    _encoder = encoder if encoder is not None else _select_encoder()
+
+
+def encoder_name() -> str:
+    """Name of the active encoder function, e.g. "_orjson_dumps"."""
+    return getattr(_encoder, "__name__", repr(_encoder))
@@ -1,6 +1,7 @@
-import json
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, Literal
+from typing import Optional, Dict, Any, Iterable, Literal
+
+from common.models.json_encoder import dumps
 
 
 class LambdaResponse:
@@ -19,7 +20,7 @@ class LambdaResponse:
         return {
             "statusCode": status_code,
             "result": result,
-            "body": json.dumps(
+            "body": dumps(
                 {
                     "message": message,
                     "data": data,
@@ -49,3 +50,18 @@ class LambdaResponse:
         return LambdaResponse._build_response(
             status_code=status_code, result="error", message=message, data=data, ts=ts
         )
+
+    @staticmethod
+    def batch_item_failures(item_identifiers: Iterable[str]) -> Dict[str, Any]:
+        """
+        Partial batch response for SQS / Kinesis / DynamoDB Streams triggers.
+
+        Requires ReportBatchItemFailures on the event source mapping; only the
+        listed records are retried, an empty list acknowledges the whole batch.
+        """
+        return {
+            "batchItemFailures": [
+                {"itemIdentifier": item_identifier}
+                for item_identifier in item_identifiers
+            ]
+        }
@@ -1,9 +1,85 @@
 import logging
 import os
-import inspect
+import sys
 import datetime
-import json
-from typing import Dict, Any, Optional
+import heapq
+import itertools
+import threading
+import time
+import zlib
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, Mapping, Optional, Tuple
+
+from common.models.json_encoder import RawJSON, dumps
+from common.models.trace_id import TraceId
+
+# set LOG_CALLER_INFO=false to skip function/file/line resolution entirely
+LOG_CALLER_INFO_ENV = "LOG_CALLER_INFO"
+
+# buffered mode: hold records in memory and write them in one call per flush
+LOG_BUFFERED_ENV = "LOG_BUFFERED"
+LOG_BUFFER_SIZE_ENV = "LOG_BUFFER_SIZE"
+# with buffering, keep records below the logger level and write them only if
+# the invocation logged an ERROR
+LOG_DEBUG_ON_ERROR_ENV = "LOG_DEBUG_ON_ERROR"
+DEFAULT_LOG_BUFFER_SIZE = 200
+
+# fraction (0..1) of invocations, keyed on TraceId, that log DEBUG/INFO records;
+# WARNING and above are always logged
+LOG_SAMPLE_RATE_ENV = "LOG_SAMPLE_RATE"
+# LOG_RATE_LIMIT_<LEVEL>: max records per second from one call site at that level
+LOG_RATE_LIMIT_ENV_PREFIX = "LOG_RATE_LIMIT_"
+RATE_LIMITED_LEVELS = (logging.DEBUG, logging.INFO, logging.WARNING)
+_SAMPLE_BUCKETS = 10000
+
+# frame depth from _caller_info: _caller_info <- _log <- public method <- caller
+_CALLER_DEPTH = 3
+
+_getframe = getattr(sys, "_getframe", None)
+_FILE_NAMES: Dict[str, str] = {}
+
+# fields attached to every record inside a `scoped_fields` block
+_SCOPED_FIELDS: ContextVar[Dict[str, Any]] = ContextVar("scoped_fields", default={})
+
+
+def _serialize(log_entry: Dict[str, Any]) -> str:
+    """
+    Serialize a record; RawJSON fields (e.g. a response body that is already
+    JSON) are appended verbatim instead of being serialized a second time.
+    """
+    raw_fields = [
+        (key, log_entry.pop(key))
+        for key, value in list(log_entry.items())
+        if isinstance(value, RawJSON)
+    ]
+    line = dumps(log_entry, strict=False)
+    for key, raw in raw_fields:
+        separator = "," if line != "{}" else ""
+        line = f"{line[:-1]}{separator}{dumps(key)}:{raw}}}"
+    return line
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
 
 
 class Logger:
@@ -23,7 +99,7 @@ class Logger:
             return
 
         self._metadata: Dict[str, Any] = {}
-        self._tempdata: Dict[str, Any] = {}
+        self._local = threading.local()
 
         # Configure root logger
         root_logger = logging.getLogger()
@@ -35,50 +111,195 @@ class Logger:
 
         self.logger = logging.getLogger(loggername)
         self.logger.setLevel(logging.INFO)
+        self.include_caller = _env_flag(LOG_CALLER_INFO_ENV, True)
+
+        self.buffered = _env_flag(LOG_BUFFERED_ENV, False)
+        self.buffer_size = _env_int(LOG_BUFFER_SIZE_ENV, DEFAULT_LOG_BUFFER_SIZE)
+        self.debug_on_error = _env_flag(LOG_DEBUG_ON_ERROR_ENV, False)
+        # buffered records are (sequence, level, line); the sequence number
+        # lets flush interleave the two buffers back in emission order
+        self._buffer: list = []
+        self._debug_buffer: deque = deque(maxlen=self.buffer_size)
+        self._sequence = itertools.count()
+        self._invocation_errored = False
+        self._buffer_lock = threading.Lock()
+
+        self.sample_rate = min(1.0, max(0.0, _env_float(LOG_SAMPLE_RATE_ENV, 1.0)))
+        self._sampled_trace_id: Optional[str] = None
+        self._sampled = True
+        self.rate_limits: Dict[int, float] = {}
+        for level in RATE_LIMITED_LEVELS:
+            limit = _env_float(
+                LOG_RATE_LIMIT_ENV_PREFIX + logging.getLevelName(level), 0.0
+            )
+            if limit > 0:
+                self.rate_limits[level] = limit
+        # call site -> [window start, records in window, suppressed in window]
+        self._rate_windows: Dict[tuple, list] = {}
         self._initialized = True
 
-    def _log(self, level: int, msg: str) -> None:
-        """Internal logging method."""
-        if not self.logger.isEnabledFor(level):
-            return
+    @property
+    def _tempdata(self) -> Dict[str, Any]:
+        """Per-thread fields waiting to be attached to the next emitted record."""
+        tempdata = getattr(self._local, "tempdata", None)
+        if tempdata is None:
+            tempdata = self._local.tempdata = {}
+        return tempdata
 
+    @staticmethod
+    def _caller_info() -> Tuple[str, str, int]:
+        """
+        Resolve the calling function, file and line from the frame's code object.
+
+        Reads f_code/f_lineno directly instead of inspect.getframeinfo, which
+        loads source lines through linecache on every call.
+        """
         try:
-            # Get caller info
-            frame = inspect.currentframe()
-            caller_frame = frame.f_back.f_back if frame and frame.f_back else None
-
-            if caller_frame:
-                info = inspect.getframeinfo(caller_frame)
-                function = info.function
-                filename = os.path.basename(info.filename)
-                line = info.lineno
+            caller_frame = _getframe(_CALLER_DEPTH) if _getframe else None
+        except ValueError:
+            caller_frame = None
+
+        if caller_frame is None:
+            return "unknown", "unknown", 0
+
+        code = caller_frame.f_code
+        filename = _FILE_NAMES.get(code.co_filename)
+        if filename is None:
+            filename = _FILE_NAMES[code.co_filename] = os.path.basename(
+                code.co_filename
+            )
+        return code.co_name, filename, caller_frame.f_lineno
+
+    def _capture_below_level(self, level: int) -> bool:
+        """True if a record below the logger level is kept for error-only flush."""
+        return self.buffered and self.debug_on_error and level < logging.WARNING
+
+    def _is_sampled(self) -> bool:
+        """
+        Deterministic per-invocation sampling decision keyed on TraceId.
+
+        Every record of a sampled invocation is kept, so sampled traces stay
+        complete; the decision is recomputed only when the trace id changes.
+        """
+        if self.sample_rate >= 1.0:
+            return True
+        trace_id = TraceId.get()
+        if trace_id != self._sampled_trace_id:
+            self._sampled_trace_id = trace_id
+            if trace_id is None:
+                self._sampled = True
             else:
-                function = "unknown"
-                filename = "unknown"
-                line = 0
+                bucket = zlib.crc32(str(trace_id).encode()) % _SAMPLE_BUCKETS
+                self._sampled = bucket < self.sample_rate * _SAMPLE_BUCKETS
+        return self._sampled
+
+    def _rate_limited(self, level: int) -> Tuple[bool, int]:
+        """
+        Fixed one-second window limit per call site (the message template).
+
+        Returns (limited, suppressed), where suppressed is the number of records
+        dropped from this call site in the previous window.
+        """
+        limit = self.rate_limits.get(level)
+        if not limit:
+            return False, 0
+        try:
+            caller_frame = _getframe(_CALLER_DEPTH) if _getframe else None
+        except ValueError:
+            caller_frame = None
+        if caller_frame is None:
+            return False, 0
+
+        key = (caller_frame.f_code, caller_frame.f_lineno, level)
+        now = time.monotonic()
+        window = self._rate_windows.get(key)
+        if window is None or now - window[0] >= 1.0:
+            suppressed = window[2] if window else 0
+            self._rate_windows[key] = [now, 1, 0]
+            return False, suppressed
+        if window[1] >= limit:
+            window[2] += 1
+            return True, 0
+        window[1] += 1
+        return False, 0
+
+    @staticmethod
+    def _render(msg: Any, args: tuple) -> str:
+        """%-format msg with args, as the stdlib does, once the record is kept."""
+        if not args:
+            return str(msg)
+        if len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+            args = args[0]
+        return str(msg) % args
+
+    def _log(
+        self,
+        level: int,
+        msg: Any,
+        args: tuple = (),
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Internal logging method.
+
+        msg is only formatted with args, and fields only serialized, after the
+        level, sampling and rate-limit checks pass, so disabled records cost a
+        few comparisons regardless of how large their arguments are.
+        tempdata applies to this call only and is cleared on every path,
+        including records dropped by level, sampling or rate limits.
+        """
+        try:
+            if not (
+                self.logger.isEnabledFor(level) or self._capture_below_level(level)
+            ):
+                return
+
+            if level < logging.WARNING and not self._is_sampled():
+                return
+
+            suppressed = 0
+            if self.rate_limits:
+                limited, suppressed = self._rate_limited(level)
+                if limited:
+                    return
 
             # Build log entry
             log_entry = {
                 "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
                 "level": logging.getLevelName(level),
-                "message": str(msg),
-                "function": function,
-                "file": filename,
-                "line": line,
+                "message": self._render(msg, args),
             }
 
+            # Get caller info
+            if self.include_caller:
+                function, filename, line = self._caller_info()
+                log_entry["function"] = function
+                log_entry["file"] = filename
+                log_entry["line"] = line
+
+            if suppressed:
+                log_entry["suppressed_count"] = suppressed
+
             # Add metadata if exists
             if self._metadata:
                 log_entry.update(self._metadata)
 
+            # Add scoped fields if inside a scoped_fields block
+            scoped = _SCOPED_FIELDS.get()
+            if scoped:
+                log_entry.update(scoped)
+
             # Add tempdata if exists
-            if self._tempdata:
-                log_entry.update(self._tempdata)
+            tempdata = self._tempdata
+            if tempdata:
+                log_entry.update(tempdata)
+
+            # Add structured fields passed with the call
+            if fields:
+                log_entry.update(fields)
 
             # Log the entry
-            self.logger.log(
-                level, json.dumps(log_entry, ensure_ascii=False, default=str)
-            )
+            self._emit(level, _serialize(log_entry))
 
         except Exception as e:
             fallback = {
@@ -86,29 +307,80 @@ class Logger:
                 "level": "ERROR",
                 "message": f"Logging failed: {e}. Original: {msg}",
             }
-            self.logger.error(json.dumps(fallback, default=str))
+            self.logger.error(dumps(fallback, strict=False))
         finally:
             self._tempdata.clear()
 
-    def debug(self, msg: str) -> None:
-        """Log debug message."""
-        self._log(logging.DEBUG, msg)
+    def _emit(self, level: int, line: str) -> None:
+        """Write a serialized record now, or queue it in buffered mode."""
+        if not self.buffered:
+            self.logger.log(level, line)
+            return
+
+        with self._buffer_lock:
+            if level >= logging.ERROR:
+                self._invocation_errored = True
+            record = (next(self._sequence), level, line)
+            if not self.logger.isEnabledFor(level):
+                # bounded ring: only the most recent context is kept
+                self._debug_buffer.append(record)
+                return
+            self._buffer.append(record)
+            if len(self._buffer) < self.buffer_size:
+                return
+            records, self._buffer = self._buffer, []
+        self._write(records)
+
+    def _write(self, records: list) -> None:
+        """Write buffered records with a single handler call."""
+        if records:
+            level = max(record_level for _, record_level, _ in records)
+            self.logger.log(level, "\n".join(line for _, _, line in records))
+
+    def flush(self) -> None:
+        """
+        Writes buffered records; call once at the end of each invocation.
+
+        Records captured below the logger level are written only if an ERROR
+        was logged since the last flush, otherwise they are discarded. When
+        written they are merged with the other buffered records in the order
+        they were logged.
+        """
+        with self._buffer_lock:
+            records, self._buffer = self._buffer, []
+            if self._invocation_errored and self._debug_buffer:
+                records = list(heapq.merge(self._debug_buffer, records))
+            self._debug_buffer.clear()
+            self._invocation_errored = False
+        self._write(records)
+
+    def debug(self, msg: str, *args: Any, **fields: Any) -> None:
+        """
+        Log debug message.
 
-    def info(self, msg: str) -> None:
+        msg may be a %-style template rendered with args only if the record is
+        emitted; keyword arguments are added to the record as structured fields.
+
+        Example:
+            LOGGER.debug("Processing event: %s", event, request_type=request_type)
+        """
+        self._log(logging.DEBUG, msg, args, fields)
+
+    def info(self, msg: str, *args: Any, **fields: Any) -> None:
         """Log info message."""
-        self._log(logging.INFO, msg)
+        self._log(logging.INFO, msg, args, fields)
 
-    def warning(self, msg: str) -> None:
+    def warning(self, msg: str, *args: Any, **fields: Any) -> None:
         """Log warning message."""
-        self._log(logging.WARNING, msg)
+        self._log(logging.WARNING, msg, args, fields)
 
-    def error(self, msg: str) -> None:
+    def error(self, msg: str, *args: Any, **fields: Any) -> None:
         """Log error message."""
-        self._log(logging.ERROR, msg)
+        self._log(logging.ERROR, msg, args, fields)
 
-    def critical(self, msg: str) -> None:
+    def critical(self, msg: str, *args: Any, **fields: Any) -> None:
         """Log critical message."""
-        self._log(logging.CRITICAL, msg)
+        self._log(logging.CRITICAL, msg, args, fields)
 
     def set_metadata(self, key_values: Optional[Dict[str, Any]]) -> None:
         """Sets persistent metadata for all logs."""
@@ -120,10 +392,33 @@ class Logger:
             self._metadata[key] = value
 
     def add_tempdata(self, key: str, value: Any) -> None:
-        """Adds temporary data for the next log only."""
+        """
+        Buffers a key-value pair for the next log call only.
+
+        Nothing is written here; the data is attached to the record of the next
+        log call and cleared by it, also when that record is dropped by the
+        level check, sampling or a rate limit.
+        """
         if key is not None:
             self._tempdata[key] = value
-        self._log(logging.ERROR, f"context_message: {key}={value}")
+
+    @contextmanager
+    def scoped_fields(self, **fields: Any) -> Iterator[None]:
+        """
+        Attaches fields to every record logged inside the `with` block.
+
+        Blocks can be nested; inner fields override outer ones and the previous
+        fields are restored on exit. Scope is per thread / async context.
+
+        Example:
+            with LOGGER.scoped_fields(contact_id=contact_id):
+                LOGGER.info("Describing contact")
+        """
+        token = _SCOPED_FIELDS.set({**_SCOPED_FIELDS.get(), **fields})
+        try:
+            yield
+        finally:
+            _SCOPED_FIELDS.reset(token)
 
     def init_context(self, context: Optional[Any] = None) -> None:
         """
@@ -153,3 +448,4 @@ class Logger:
                 context_data[key] = value
 
         self.set_metadata(context_data)
+        self._tempdata.clear()
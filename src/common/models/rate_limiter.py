@@ -0,0 +1,98 @@
+"""
+Client-side rate limiting for AWS APIs with per-account request quotas.
+
+`TokenBucket` hands out one token per call at `rate` tokens per second with up
+to `burst` saved up. Callers reserve a token and sleep until it is due, so
+concurrent threads are spaced out instead of all hitting the API at once.
+The bucket is adaptive: `throttled()` halves the rate (down to a floor) and
+`succeeded()` grows it back towards the configured rate, so a quota lower than
+configured is found without a stream of failed calls.
+
+`backoff_delay` is the "full jitter" exponential backoff used between retries
+of throttled calls.
+"""
+
+import random
+import threading
+import time
+from typing import Optional, Tuple
+
+# throttled() never slows a bucket below this fraction of its configured rate
+MIN_RATE_FRACTION = 0.1
+# succeeded() adds this fraction of the configured rate back per call
+RECOVERY_FRACTION = 0.05
+
+
+def parse_rate_limit(
+    value: Optional[str], default: Tuple[float, float]
+) -> Tuple[float, float]:
+    """
+    Parse "tps" or "tps:burst" (e.g. "10:15") into (rate, burst).
+
+    arg:
+        value: setting to parse, None or invalid values give default
+        default: (rate, burst) used when value is missing or invalid
+    """
+    if not value:
+        return default
+    try:
+        rate, _, burst = value.partition(":")
+        rate = float(rate)
+        burst = float(burst) if burst else max(1.0, rate)
+    except ValueError:
+        return default
+    if rate <= 0 or burst < 1:
+        return default
+    return rate, burst
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Full-jitter exponential backoff: uniform(0, min(max, base * 2**attempt))."""
+    return random.uniform(0, min(max_delay, base_delay * (2**attempt)))
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float):
+        """
+        arg:
+            rate: sustained calls per second
+            burst: calls allowed back to back after an idle period
+        """
+        self.configured_rate = rate
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available; return seconds waited."""
+        with self._lock:
+            self._refill(time.monotonic())
+            # reserve the token now; a negative balance is the queue of waiters
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    def throttled(self) -> None:
+        """The API rejected a call: halve the rate."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.configured_rate * MIN_RATE_FRACTION, self.rate / 2)
+
+    def succeeded(self) -> None:
+        """A call went through: grow the rate back towards the configured rate."""
+        if self.rate >= self.configured_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(
+                self.configured_rate,
+                self.rate + self.configured_rate * RECOVERY_FRACTION,
+            )
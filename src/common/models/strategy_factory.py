@@ -1,14 +1,9 @@
 from common.models.logger import Logger
 from common.models.lambda_response import LambdaResponse
-from workflow.amazon_connect.imports import *
-from workflow.api_gateway_http.imports import *
-from workflow.api_gateway_rest.imports import *
-from workflow.functional_url.imports import *
-from workflow.s3.imports import *
-
-
-ALL_INVOCATION_TYPE_LIST = (
-    AMAZON_CONNECT + API_GATEWAY_HTTP + API_GATEWAY_REST + FUNCTION_URL + S3
+from common.models.strategy_registry import (
+    INVOCATION_SOURCE_STRATEGIES,
+    get_strategy,
+    is_registered,
 )
 
 LOGGER = Logger(__name__)
@@ -20,12 +15,12 @@ class StrategyFactory:
         self.invoke_type = invoke_type
 
         if not self._validate_strategy():
-            LOGGER.error(f"Failed in validate strategy")
+            LOGGER.error("Failed in validate strategy")
             raise Exception(f"Failed in validate strategy")
 
     # validation
     def _validate_strategy(self):
-        if self.invoke_type not in globals().keys():
+        if self.invoke_type not in INVOCATION_SOURCE_STRATEGIES:
             LOGGER.add_tempdata("Invalid invoke strategy type", self.invoke_type)
             return False
 
@@ -33,7 +28,7 @@ class StrategyFactory:
             LOGGER.add_tempdata("Event must contain request_type", self.event)
             return False
 
-        if self.event.get("request_type") not in ALL_INVOCATION_TYPE_LIST:
+        if not is_registered(self.invoke_type, self.event.get("request_type")):
             LOGGER.add_tempdata("Invalid strategy", self.event.get("request_type"))
             return False
         return True
@@ -42,25 +37,29 @@ class StrategyFactory:
     def _initiate_strategy(self):
         try:
             request_type = self.event.get("request_type")
-            self.strategy_class = globals().get(request_type, None)
-            LOGGER.info(f"Initiating strategy: {request_type}")
+            self.strategy_class = get_strategy(self.invoke_type, request_type)
+            LOGGER.info("Initiating strategy: %s", request_type)
 
             if self.strategy_class is None:
-                LOGGER.add_tempdata("Strategy class not found in globals", request_type)
-                raise Exception(f"Strategy class '{request_type}' not found in globals")
+                LOGGER.add_tempdata(
+                    "Strategy class not found in registry", request_type
+                )
+                raise Exception(
+                    f"Strategy class '{request_type}' not found in registry"
+                )
 
         except Exception as e:
             LOGGER.add_tempdata("error", str(e))
-            LOGGER.error(f"Error initiating strategy: {e}")
+            LOGGER.error("Error initiating strategy: %s", e)
             raise Exception(f"Failed to initiate strategy: {e}")
 
     def _pass_event_to_strategy(self):
         try:
             self.strategy_class_obj = self.strategy_class(self.event)
-            LOGGER.info(f"Event passed to strategy: {self.event}")
+            LOGGER.info("Event passed to strategy: %s", self.event)
         except Exception as e:
             LOGGER.add_tempdata("error", str(e))
-            LOGGER.error(f"Error passing event to strategy: {e}")
+            LOGGER.error("Error passing event to strategy: %s", e)
 
     def execute(self):
         try:
@@ -71,20 +70,19 @@ class StrategyFactory:
             result, error = self.strategy_class_obj.do_validate()
             if not result:
                 LOGGER.error(
-                    f"validation failed from called strategy_class with error:{error}"
+                    "validation failed from called strategy_class with error:%s", error
                 )
                 raise Exception("validation failed from called strategy_class")
         except Exception as e:
             LOGGER.add_tempdata("error", str(e))
-            LOGGER.error(f"Error in validation from called strategy_class: {e}")
+            LOGGER.error("Error in validation from called strategy_class: %s", e)
             return LambdaResponse.error(message=str(e))
 
         try:
             strategy_response = self.strategy_class_obj.do_operation()
-            LOGGER.add_metadata("strategy_response", strategy_response)
-            LOGGER.info(f"Strategy response: {strategy_response}")
+            LOGGER.info("Strategy operation completed")
             return strategy_response
         except Exception as e:
             LOGGER.add_tempdata("error", str(e))
-            LOGGER.error(f"Error in processing event from called strategy_class: {e}")
+            LOGGER.error("Error in processing event from called strategy_class: %s", e)
             return LambdaResponse.error(message=str(e))
@@ -0,0 +1,107 @@
+"""
+Registry of strategy classes, indexed by (invocation source, request_type).
+
+Strategies register themselves with the `register_strategy` decorator, naming
+the invocation sources allowed to call them. Each `workflow/<source>/imports.py`
+maps a `request_type` to the dotted path of the module that defines it, so the
+module is only imported the first time that request type is executed and a cold
+start pays for the dependencies of the strategy it actually runs (phonenumbers,
+boto3, ...) and nothing else.
+
+Dispatch is a single dict lookup; request types that are not mapped for the
+invocation source are rejected without importing anything.
+"""
+
+import importlib
+import threading
+from typing import Callable, Optional
+
+from common.models.default_strategy import DefaultStrategy
+from common.models.logger import Logger
+from workflow.amazon_connect.imports import AMAZON_CONNECT
+from workflow.api_gateway_http.imports import API_GATEWAY_HTTP
+from workflow.api_gateway_rest.imports import API_GATEWAY_REST
+from workflow.direct_invoke.imports import DIRECT_INVOKE
+from workflow.dynamodb_streams.imports import DYNAMODB_STREAMS
+from workflow.functional_url.imports import FUNCTION_URL
+from workflow.kinesis.imports import KINESIS
+from workflow.s3.imports import S3
+from workflow.sqs.imports import SQS
+
+LOGGER = Logger(__name__)
+
+# invocation source -> {request_type: module path}
+INVOCATION_SOURCE_STRATEGIES = {
+    "AMAZON_CONNECT": AMAZON_CONNECT,
+    "API_GATEWAY_HTTP": API_GATEWAY_HTTP,
+    "API_GATEWAY_REST": API_GATEWAY_REST,
+    "DIRECT_INVOKE": DIRECT_INVOKE,
+    "DYNAMODB_STREAMS": DYNAMODB_STREAMS,
+    "FUNCTION_URL": FUNCTION_URL,
+    "KINESIS": KINESIS,
+    "S3": S3,
+    "SQS": SQS,
+}
+
+# (invocation source, request_type) -> strategy class, filled by register_strategy
+_STRATEGY_REGISTRY: dict[tuple[str, str], type] = {}
+_LOAD_LOCK = threading.Lock()
+
+
+def register_strategy(*invocation_sources: str) -> Callable[[type], type]:
+    """
+    Class decorator registering a DefaultStrategy subclass for invocation sources.
+
+    arg:
+        invocation_sources: sources allowed to call the strategy, e.g. "AMAZON_CONNECT"
+    Return:
+        decorator returning the class unchanged
+    """
+    if not invocation_sources:
+        raise ValueError("register_strategy requires at least one invocation source")
+
+    def decorator(strategy_class: type) -> type:
+        if not issubclass(strategy_class, DefaultStrategy):
+            raise TypeError(
+                f"{strategy_class.__name__} must subclass DefaultStrategy to be registered"
+            )
+        for invocation_source in invocation_sources:
+            _STRATEGY_REGISTRY[(invocation_source, strategy_class.__name__)] = (
+                strategy_class
+            )
+        return strategy_class
+
+    return decorator
+
+
+def is_registered(invocation_source: str, request_type: str) -> bool:
+    """Return True if request_type may be called from invocation_source."""
+    return request_type in INVOCATION_SOURCE_STRATEGIES.get(invocation_source, {})
+
+
+def get_strategy(invocation_source: str, request_type: str) -> Optional[type]:
+    """
+    Return the strategy class for a request type, importing its module on first use.
+
+    arg:
+        invocation_source: detected invocation source of the event
+        request_type: strategy class name sent in the event
+    Return:
+        the strategy class, or None if it is not registered for the source
+    """
+    key = (invocation_source, request_type)
+    strategy_class = _STRATEGY_REGISTRY.get(key)
+    if strategy_class is not None:
+        return strategy_class
+
+    module_path = INVOCATION_SOURCE_STRATEGIES.get(invocation_source, {}).get(
+        request_type
+    )
+    if module_path is None:
+        return None
+
+    with _LOAD_LOCK:
+        if key not in _STRATEGY_REGISTRY:
+            LOGGER.debug(f"Importing strategy {request_type} from {module_path}")
+            importlib.import_module(module_path)
+    return _STRATEGY_REGISTRY.get(key)
@@ -6,19 +6,328 @@ including user, queue, and contact flow management, real-time and historical met
 and call control actions.
 
 All methods include logging and error handling for robust production use.
+
+Every API call goes through a token bucket per (region, operation), shared by
+the whole process because Connect quotas are per account and region. Each API
+starts from its default in DEFAULT_CONNECT_RATE_LIMITS (Connect's baseline
+2 requests/second with a burst of 5 for the rest); override it per operation
+with CONNECT_RATE_LIMIT_<OPERATION>="tps:burst", e.g.
+CONNECT_RATE_LIMIT_DESCRIBE_CONTACT="20:30". Throttled calls
+(TooManyRequestsException / ThrottlingException) slow the bucket down and are
+retried up to CONNECT_MAX_RETRIES times with jittered exponential backoff. The
+Connect client is built with botocore retries turned off, so this is the only
+retry logic and the bucket sees every throttle.
+Calls, throttles and time spent waiting are counted per operation in
+`connect_api_metrics()`.
+
+Instance configuration listings (list_contact_flow, list_routing_profile,
+list_queues) rarely change, so they are cached per (region, instance) for
+CONNECT_LISTING_CACHE_TTL seconds (default 300, 0 disables the cache). With
+CONNECT_LISTING_SNAPSHOT set ("dynamodb://<table>" or a directory such as
+/tmp/connect-listings) each listing is also saved as a snapshot, so a new
+container reuses a fresh listing instead of paginating the instance again;
+values read from a snapshot are plain JSON (timestamps become ISO strings).
+`ConnectUtils.invalidate_listings()` drops both after a configuration change.
 """
 
+import copy
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
 from common.client_record.connect_client import connect_client
 from common.models.logger import Logger
+from common.models.rate_limiter import TokenBucket, backoff_delay, parse_rate_limit
+from common.utils_methods.snapshot_store import snapshot_store
 
 logger = Logger(__name__)
 
+CONNECT_RATE_LIMIT_ENV_PREFIX = "CONNECT_RATE_LIMIT_"
+DEFAULT_CONNECT_RATE_LIMIT = (2.0, 5.0)  # requests/second, burst
+# per-API defaults (requests/second, burst) following the Connect API quotas;
+# an account's actual values are listed in the Service Quotas console
+DEFAULT_CONNECT_RATE_LIMITS = {
+    "describe_contact": (10.0, 15.0),
+    "stop_contact": (5.0, 8.0),
+    "get_current_user_data": (5.0, 8.0),
+    "list_contact_flows": (2.0, 5.0),
+    "list_routing_profiles": (2.0, 5.0),
+    "list_queues": (2.0, 5.0),
+}
+CONNECT_MAX_RETRIES_ENV = "CONNECT_MAX_RETRIES"
+DEFAULT_CONNECT_MAX_RETRIES = 5
+BACKOFF_BASE_DELAY = 0.2  # seconds
+BACKOFF_MAX_DELAY = 5.0  # seconds
+THROTTLING_ERROR_CODES = frozenset(
+    {"TooManyRequestsException", "ThrottlingException", "Throttling"}
+)
+
+CONNECT_LISTING_CACHE_TTL_ENV = "CONNECT_LISTING_CACHE_TTL"
+DEFAULT_CONNECT_LISTING_CACHE_TTL = 300.0  # seconds
+CONNECT_LISTING_SNAPSHOT_ENV = "CONNECT_LISTING_SNAPSHOT"
+# cached listing operation -> key of its items in each page
+LISTING_RESULT_KEYS = {
+    "list_contact_flows": "ContactFlowSummaryList",
+    "list_routing_profiles": "RoutingProfileSummaryList",
+    "list_queues": "QueueSummaryList",
+}
+
+# (region, operation) -> TokenBucket; operation -> counters
+_LIMITERS: Dict[tuple, TokenBucket] = {}
+_METRICS: Dict[str, Dict[str, Any]] = {}
+# (region, instance, operation) -> (fetched_at epoch seconds, items)
+_LISTINGS: Dict[tuple, tuple] = {}
+_LOCK = threading.Lock()
+
+
+def _limiter(region_name: str, operation: str) -> TokenBucket:
+    key = (region_name, operation)
+    limiter = _LIMITERS.get(key)
+    if limiter is None:
+        with _LOCK:
+            limiter = _LIMITERS.get(key)
+            if limiter is None:
+                rate, burst = parse_rate_limit(
+                    os.environ.get(CONNECT_RATE_LIMIT_ENV_PREFIX + operation.upper()),
+                    DEFAULT_CONNECT_RATE_LIMITS.get(
+                        operation, DEFAULT_CONNECT_RATE_LIMIT
+                    ),
+                )
+                limiter = _LIMITERS[key] = TokenBucket(rate, burst)
+    return limiter
+
+
+def _record(operation: str, calls: int = 0, throttled: int = 0, wait: float = 0.0):
+    with _LOCK:
+        metrics = _METRICS.setdefault(
+            operation, {"calls": 0, "throttled": 0, "wait_seconds": 0.0}
+        )
+        metrics["calls"] += calls
+        metrics["throttled"] += throttled
+        metrics["wait_seconds"] += wait
+
+
+def _is_throttling(error: Exception) -> bool:
+    response = getattr(error, "response", None) or {}
+    return response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+
+
+def connect_api_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Return:
+        {operation: {"calls", "throttled", "wait_seconds"}} since the last reset;
+        wait_seconds includes rate limiter waits and backoff sleeps
+    """
+    with _LOCK:
+        return {
+            operation: dict(metrics, wait_seconds=round(metrics["wait_seconds"], 3))
+            for operation, metrics in _METRICS.items()
+        }
+
+
+def reset_connect_api_metrics() -> None:
+    """Start counting calls, throttles and waits from zero."""
+    with _LOCK:
+        _METRICS.clear()
+
+
+def reset_rate_limiters() -> None:
+    """Drop every token bucket so limits are read again (used by tests)."""
+    with _LOCK:
+        _LIMITERS.clear()
+
+
+def _listing_cache_ttl() -> float:
+    try:
+        return max(
+            0.0,
+            float(
+                os.environ.get(
+                    CONNECT_LISTING_CACHE_TTL_ENV, DEFAULT_CONNECT_LISTING_CACHE_TTL
+                )
+            ),
+        )
+    except ValueError:
+        return DEFAULT_CONNECT_LISTING_CACHE_TTL
+
+
+def invalidate_listing_cache(
+    region_name: Optional[str] = None,
+    instance_id: Optional[str] = None,
+    operation: Optional[str] = None,
+) -> int:
+    """
+    Drop in-process cached listings; None matches any value.
+
+    arg:
+        region_name: region of the listings to drop
+        instance_id: Connect instance of the listings to drop
+        operation: e.g. "list_routing_profiles"
+    Return:
+        number of listings dropped
+    """
+    wanted = (region_name, instance_id, operation)
+    with _LOCK:
+        keys = [
+            key
+            for key in _LISTINGS
+            if all(value is None or value == part for value, part in zip(wanted, key))
+        ]
+        for key in keys:
+            del _LISTINGS[key]
+    return len(keys)
+
 
 class ConnectUtils:
     def __init__(self, region_name: str, instanceId: str):
         self.region_name = region_name
         self.instanceId = instanceId
         self.connect_client = connect_client(region_name)
+        try:
+            self.max_retries = max(
+                0,
+                int(
+                    os.environ.get(CONNECT_MAX_RETRIES_ENV, DEFAULT_CONNECT_MAX_RETRIES)
+                ),
+            )
+        except ValueError:
+            self.max_retries = DEFAULT_CONNECT_MAX_RETRIES
+        self.snapshot_store = snapshot_store(
+            os.environ.get(CONNECT_LISTING_SNAPSHOT_ENV), region_name
+        )
+
+    def _call(self, operation: str, **kwargs):
+        """Call a Connect API within its rate limit, retrying throttled calls.
+
+        Args:
+            operation: boto3 method name, e.g. `'describe_contact'`.
+            kwargs: parameters passed to the API.
+
+        Returns:
+            The API response.
+
+        Raises:
+            The API error once it is not a throttling error or retries are
+            exhausted.
+        """
+        limiter = _limiter(self.region_name, operation)
+        attempt = 0
+        while True:
+            _record(operation, calls=1, wait=limiter.acquire())
+            try:
+                response = getattr(self.connect_client, operation)(**kwargs)
+            except Exception as e:
+                if not _is_throttling(e):
+                    raise
+                limiter.throttled()
+                if attempt >= self.max_retries:
+                    _record(operation, throttled=1)
+                    raise
+                delay = backoff_delay(attempt, BACKOFF_BASE_DELAY, BACKOFF_MAX_DELAY)
+                _record(operation, throttled=1, wait=delay)
+                logger.warning(
+                    "Connect %s throttled, retry %s/%s in %.2fs",
+                    operation,
+                    attempt + 1,
+                    self.max_retries,
+                    delay,
+                )
+                time.sleep(delay)
+                attempt += 1
+                continue
+            limiter.succeeded()
+            return response
+
+    def _paginate(self, operation: str, **kwargs) -> Iterator[dict]:
+        """Yield the pages of a NextToken-paginated operation.
+
+        Every page is fetched through `_call`, so each one takes a rate limit
+        token and throttled pages are retried with backoff (a botocore
+        paginator cannot resume once a page raised).
+        """
+        next_token = None
+        while True:
+            params = dict(kwargs, NextToken=next_token) if next_token else kwargs
+            page = self._call(operation, **params)
+            yield page
+            next_token = page.get("NextToken")
+            if not next_token:
+                return
+
+    def _snapshot_key(self, operation: str) -> str:
+        return f"connect-listing#{self.region_name}#{self.instanceId}#{operation}"
+
+    def _load_snapshot(self, operation: str) -> Optional[tuple]:
+        if self.snapshot_store is None:
+            return None
+        try:
+            snapshot = self.snapshot_store.get(self._snapshot_key(operation))
+        except Exception as e:
+            logger.warning(f"Could not read {operation} snapshot: {e}")
+            return None
+        if not snapshot:
+            return None
+        return snapshot["fetched_at"], snapshot["items"]
+
+    def _save_snapshot(self, operation: str, fetched_at: float, items: list):
+        if self.snapshot_store is None:
+            return
+        try:
+            self.snapshot_store.put(
+                self._snapshot_key(operation),
+                {"fetched_at": fetched_at, "items": items},
+            )
+        except Exception as e:
+            logger.warning(f"Could not save {operation} snapshot: {e}")
+
+    def _listing(self, operation: str) -> list:
+        """Return every item of a listing operation, from the cache while fresh.
+
+        The in-process cache is checked first, then the persisted snapshot, and
+        only when both are older than CONNECT_LISTING_CACHE_TTL is the instance
+        paginated again. Callers get a deep copy of the list and its items, so
+        changing a returned listing never changes the cache.
+        """
+        ttl = _listing_cache_ttl()
+        if ttl <= 0:
+            return self._fetch_listing(operation)
+        key = (self.region_name, self.instanceId, operation)
+        now = time.time()
+        cached = _LISTINGS.get(key)
+        if cached is None or now - cached[0] >= ttl:
+            cached = self._load_snapshot(operation)
+            if cached is None or now - cached[0] >= ttl:
+                cached = (now, self._fetch_listing(operation))
+                self._save_snapshot(operation, *cached)
+            with _LOCK:
+                _LISTINGS[key] = cached
+        else:
+            logger.debug(f"Using cached {operation}, {now - cached[0]:.0f}s old")
+        return copy.deepcopy(cached[1])
+
+    def _fetch_listing(self, operation: str) -> list:
+        result_key = LISTING_RESULT_KEYS[operation]
+        return [
+            item
+            for response in self._paginate(operation, InstanceId=self.instanceId)
+            for item in response.get(result_key, [])
+        ]
+
+    def invalidate_listings(self, operation: Optional[str] = None) -> None:
+        """Drop cached and persisted listings of this instance.
+
+        Args:
+            operation: one of LISTING_RESULT_KEYS, None for all of them.
+        """
+        invalidate_listing_cache(self.region_name, self.instanceId, operation)
+        if self.snapshot_store is None:
+            return
+        for name in [operation] if operation else LISTING_RESULT_KEYS:
+            try:
+                self.snapshot_store.delete(self._snapshot_key(name))
+            except Exception as e:
+                logger.warning(f"Could not delete {name} snapshot: {e}")
 
     def _get_paginator(self, service: str):
         """Return a paginator for the given Amazon Connect service operation.
@@ -45,7 +354,7 @@ class ConnectUtils:
         """List contact flow summaries for a Connect instance.
 
         This returns a flat list of contact flow summary dictionaries by paginating
-        the `list_contact_flows` API.
+        the `list_contact_flows` API. The result is cached (see `_listing`).
 
         Args:
             region_name: AWS region where the Connect instance exists.
@@ -57,16 +366,7 @@ class ConnectUtils:
         """
         try:
             logger.info(f"Listing all contact flow from region:{self.region_name}")
-            response_paginator = self._get_paginator(
-                "list_contact_flows"
-            ).paginate(
-                InstanceId=self.instanceId,
-            )
-            return [
-                contact_flow
-                for response in response_paginator
-                for contact_flow in response.get("ContactFlowSummaryList", [])
-            ]
+            return self._listing("list_contact_flows")
         except Exception as e:
             logger.error(f"Error in listing contact flows: {e}")
             raise
@@ -74,6 +374,8 @@ class ConnectUtils:
     def list_routing_profile(self):
         """List routing profile summaries for a Connect instance.
 
+        The result is cached (see `_listing`).
+
         Args:
             region_name: AWS region where the Connect instance exists.
             instanceId: The Connect InstanceId to query.
@@ -84,16 +386,7 @@ class ConnectUtils:
         """
         try:
             logger.info(f"Listing all routing profile from region:{self.region_name}")
-            response_paginator = self._get_paginator(
-                "list_routing_profiles"
-            ).paginate(
-                InstanceId=self.instanceId,
-            )
-            return [
-                routing_profile
-                for response in response_paginator
-                for routing_profile in response.get("RoutingProfileSummaryList", [])
-            ]
+            return self._listing("list_routing_profiles")
         except Exception as e:
             logger.error(f"Error in listing routing profiles: {e}")
             raise
@@ -101,6 +394,8 @@ class ConnectUtils:
     def list_queues(self):
         """List queue summaries for a Connect instance.
 
+        The result is cached (see `_listing`).
+
         Args:
             region_name: AWS region where the Connect instance exists.
             instanceId: The Connect InstanceId to query.
@@ -116,16 +411,7 @@ class ConnectUtils:
         """
         try:
             logger.info(f"Listing all queue from region:{self.region_name}")
-            response_paginator = self._get_paginator(
-                "list_queues"
-            ).paginate(
-                InstanceId=self.instanceId,
-            )
-            return [
-                queue
-                for response in response_paginator
-                for queue in response.get("QueueSummaryList", [])
-            ]
+            return self._listing("list_queues")
         except Exception as e:
             logger.error(f"Error in listing queues: {e}")
             raise
@@ -149,8 +435,8 @@ class ConnectUtils:
             logger.info(
                 f"Describing contact id {contactId} from region:{self.region_name}"
             )
-            return self.connect_client.describe_contact(
-                instanceId=self.instanceId, ContactId=contactId
+            return self._call(
+                "describe_contact", InstanceId=self.instanceId, ContactId=contactId
             )
         except Exception as e:
             logger.error(f"Error in describing contact id {contactId}: {e}")
@@ -191,13 +477,18 @@ class ConnectUtils:
             logger.info(
                 f"Inititing outbound voice contact all queue from region:{self.region_name},DestinationPhoneNumber:{DestinationPhoneNumber}"
             )
-            return self.connect_client.start_outbound_voice_contact(
-                name=name,
-                DestinationPhoneNumber=DestinationPhoneNumber,
-                ContactFlowId=ContactFlowId,
-                InstanceId=self.InstanceId,
-                SourcePhoneNumber=SourcePhoneNumber,
-                QueueId=QueueId,
+            params = {
+                "Name": name,
+                "DestinationPhoneNumber": DestinationPhoneNumber,
+                "ContactFlowId": ContactFlowId,
+                "InstanceId": self.instanceId,
+                "SourcePhoneNumber": SourcePhoneNumber,
+                "QueueId": QueueId,
+            }
+            # botocore rejects None for the optional parameters
+            return self._call(
+                "start_outbound_voice_contact",
+                **{key: value for key, value in params.items() if value is not None},
             )
         except Exception as e:
             logger.error(
@@ -224,8 +515,9 @@ class ConnectUtils:
             logger.info(
                 f"Disconnecting contact id {contactId} from region:{self.region_name}"
             )
-            self.connect_client.stop_contact(
-                instanceId=self.instanceId,
+            self._call(
+                "stop_contact",
+                InstanceId=self.instanceId,
                 ContactId=contactId,
                 DisconnectReason={"Code": "OTHERS"},
             )
@@ -251,27 +543,64 @@ class ConnectUtils:
         """
         try:
             logger.info(f"tag contact id {contactId} from region:{self.region_name}")
-            self.connect_client.tag_contact(
-                instanceId=self.instanceId, ContactId=contactId, Tags=tags
+            self._call(
+                "tag_contact",
+                InstanceId=self.instanceId,
+                ContactId=contactId,
+                Tags=tags,
             )
         except Exception as e:
             logger.error(f"Error in tagging contactId{contactId}: {e}")
             raise
 
-    def get_current_user_data(self, filters: dict[str, list[str]]):
-        """Retrieve current user data from Amazon Connect.
+    def get_current_user_data(
+        self,
+        filters: dict[str, list[str]],
+        next_token: str = None,
+        max_results: int = None,
+    ):
+        """Retrieve one page of current user data from Amazon Connect.
         arg:
             region_name: AWS region where the Connect instance exists.
             instanceId: The Connect InstanceId where the contact exists.
             filter:filter to get current user data
+            next_token: NextToken of the previous page, None for the first page
+            max_results: users per page (Connect allows up to 100)
         Returns:
             A dictionary containing the current user data from the Amazon Connect API.
         """
         try:
             logger.info(f"Getting current user data from region:{self.region_name}")
-            return self.connect_client.get_current_user_data(
-                instanceId=self.instanceId, Filters=filters
-            )
+            params = {"InstanceId": self.instanceId, "Filters": filters}
+            if next_token:
+                params["NextToken"] = next_token
+            if max_results:
+                params["MaxResults"] = max_results
+            return self._call("get_current_user_data", **params)
         except Exception as e:
             logger.error(f"Error in getting current user data: {e}")
             raise
+
+    def iter_current_user_data(
+        self, filters: dict[str, list[str]], max_results: int = 100
+    ) -> Iterator[dict]:
+        """Yield every user of get_current_user_data, following NextToken.
+
+        Pages are requested one at a time as the caller consumes users, so
+        memory stays at one page however many agents match the filters.
+        arg:
+            filters: filter to get current user data
+            max_results: users per page (Connect allows up to 100)
+        Yields:
+            UserData dicts, page after page.
+        """
+        next_token = None
+        pages = 0
+        while True:
+            response = self.get_current_user_data(filters, next_token, max_results)
+            pages += 1
+            yield from response.get("UserDataList", [])
+            next_token = response.get("NextToken")
+            if not next_token:
+                logger.info(f"Read {pages} pages of current user data")
+                return
@@ -6,6 +6,8 @@ including single and batch CRUD, attribute-based queries, existence checks, and
 All methods include logging and error handling for robust production use.
 """
 
+import threading
+
 from common.client_record.dynamodb_resource import (
     dynamoDB_resource,
     dynamoDB_condition_Expression,
@@ -20,6 +22,10 @@ KEY_VALUE = "keyValue"
 
 logger = Logger(__name__)
 
+# (region, table name) -> DynamoDBUtilsResource, reused by warm invocations
+_TABLE_UTILS: dict[tuple, "DynamoDBUtilsResource"] = {}
+_TABLE_UTILS_LOCK = threading.Lock()
+
 
 class DynamoDBUtilsResource:
 
@@ -164,3 +170,23 @@ class DynamoDBUtilsResource:
                 f"Error in putting data in {self.table_name} with item: {item}"
             )
             raise
+
+
+def table_utils(region_name: str, table_name: str) -> DynamoDBUtilsResource:
+    """Return the DynamoDBUtilsResource of a table, built once per container."""
+    key = (region_name, table_name)
+    utils = _TABLE_UTILS.get(key)
+    if utils is not None:
+        return utils
+
+    with _TABLE_UTILS_LOCK:
+        utils = _TABLE_UTILS.get(key)
+        if utils is None:
+            utils = _TABLE_UTILS[key] = DynamoDBUtilsResource(region_name, table_name)
+    return utils
+
+
+def reset_table_utils() -> None:
+    """Drop the cached table utilities (used by tests)."""
+    with _TABLE_UTILS_LOCK:
+        _TABLE_UTILS.clear()
@@ -5,13 +5,71 @@ This class provides high-level, descriptive methods for common S3 operations suc
 All methods include logging and error handling for robust production use.
 """
 
+import json
+from collections.abc import Mapping
+from urllib.parse import unquote_plus
+
 from common.models.logger import Logger
 from common.client_record.s3_client import s3_client
-from typing import Literal
+from typing import Any, Dict, Iterator, Literal
 
 logger = Logger(__name__)
 
 
+def _event_object_refs(event: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield raw {bucket, key, version_id} refs from every supported envelope."""
+    # EventBridge "Object Created" / "Object Deleted" notification
+    detail = event.get("detail")
+    if isinstance(detail, Mapping) and "bucket" in detail:
+        yield {
+            "bucket": detail.get("bucket", {}).get("name"),
+            "key": detail.get("object", {}).get("key"),
+            "version_id": detail.get("object", {}).get("version-id"),
+        }
+        return
+
+    for record in event.get("Records") or []:
+        if "s3" in record:
+            s3 = record["s3"]
+            yield {
+                "bucket": s3.get("bucket", {}).get("name"),
+                "key": unquote_plus(s3.get("object", {}).get("key", "")),
+                "version_id": s3.get("object", {}).get("versionId"),
+            }
+        elif "body" in record:
+            # S3 notification delivered through SQS (optionally via SNS)
+            try:
+                body = json.loads(record["body"])
+                if "Message" in body:
+                    body = json.loads(body["Message"])
+            except (TypeError, ValueError):
+                continue
+            if isinstance(body, Mapping):
+                yield from _event_object_refs(body)
+
+
+def iter_event_objects(event: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every object referenced by an S3 notification, once.
+
+    Reads all `Records` of an S3 event, S3 events wrapped in SQS (and SNS)
+    message bodies, and EventBridge S3 events. Keys are URL-decoded and
+    objects are deduplicated by (bucket, key, version_id).
+
+    Args:
+        event (dict): S3, SQS or EventBridge event.
+    Returns:
+        Iterator[dict]: {"bucket", "key", "version_id"} per object.
+    """
+    seen = set()
+    for ref in _event_object_refs(event):
+        identity = (ref["bucket"], ref["key"], ref["version_id"])
+        if not ref["bucket"] or not ref["key"] or identity in seen:
+            continue
+        seen.add(identity)
+        yield ref
+
+
 class S3Utils:
 
     def __init__(self, bucket):
@@ -0,0 +1,104 @@
+"""
+Small key/value stores for JSON snapshots that should outlive one invocation.
+
+- FileSnapshotStore: one JSON file per key in a directory, e.g. under /tmp.
+  Survives across invocations of the same warm container.
+- DynamoDBSnapshotStore: one item per key in a DynamoDB table whose partition
+  key is a string (default "pk"). Shared by every container.
+
+`snapshot_store(location, region_name)` builds a store from a setting:
+"dynamodb://<table>" for DynamoDB, "file://<dir>" or a plain path for files,
+empty for no store.
+
+Values are stored as JSON text, so anything `json_encoder.dumps` accepts can be
+saved and comes back as plain JSON types.
+"""
+
+import json
+import os
+import re
+import tempfile
+from typing import Any, Optional
+
+from common.client_record.dynamodb_resource import dynamoDB_resource
+from common.models.json_encoder import dumps
+from common.models.logger import Logger
+
+logger = Logger(__name__)
+
+DYNAMODB_SCHEME = "dynamodb://"
+FILE_SCHEME = "file://"
+
+
+class FileSnapshotStore:
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, re.sub(r"[^A-Za-z0-9._-]", "_", key))
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value saved under key, None if there is none."""
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Save value under key; readers never see a half written file."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(dumps(value))
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+class DynamoDBSnapshotStore:
+    def __init__(self, region_name: str, table_name: str, key_name: str = "pk"):
+        self.table_name = table_name
+        self.key_name = key_name
+        self.dynamodb_table = dynamoDB_resource(region_name).Table(table_name)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value saved under key, None if there is none."""
+        item = self.dynamodb_table.get_item(
+            Key={self.key_name: key}, ConsistentRead=True
+        ).get("Item")
+        return json.loads(item["payload"]) if item else None
+
+    def put(self, key: str, value: Any) -> None:
+        self.dynamodb_table.put_item(Item={self.key_name: key, "payload": dumps(value)})
+
+    def delete(self, key: str) -> None:
+        self.dynamodb_table.delete_item(Key={self.key_name: key})
+
+
+def snapshot_store(location: Optional[str], region_name: str):
+    """
+    arg:
+        location: "dynamodb://<table>", "file://<dir>", a directory path, or
+            empty for no store
+        region_name: region of the DynamoDB table
+    Return:
+        FileSnapshotStore, DynamoDBSnapshotStore or None
+    """
+    location = (location or "").strip()
+    if not location:
+        return None
+    if location.startswith(DYNAMODB_SCHEME):
+        return DynamoDBSnapshotStore(
+            region_name, location.removeprefix(DYNAMODB_SCHEME)
+        )
+    location = location.removeprefix(FILE_SCHEME)
+    return FileSnapshotStore(location)
@@ -17,6 +17,45 @@ class TranscribeUtils:
         self.region_name = region_name
         self.transcribe_client = transcribe_client(region_name)
 
+    def start_transcription_job(
+        self,
+        transcription_job_name,
+        media_file_uri,
+        output_bucket,
+        language_code="en-US",
+    ):
+        """
+        Start a transcription job that redacts PII from the transcript.
+        Args:
+            transcription_job_name (str): Unique name of the transcription job.
+            media_file_uri (str): s3:// URI of the audio file.
+            output_bucket (str): Bucket receiving the redacted transcript.
+            language_code (str): Language of the audio (PII redaction needs one).
+        Returns:
+            dict: The response from Transcribe start_transcription_job.
+        Raises:
+            Exception: If the operation fails.
+        """
+        logger.info(
+            f"Starting transcription job {transcription_job_name} for: {media_file_uri}"
+        )
+        try:
+            return self.transcribe_client.start_transcription_job(
+                TranscriptionJobName=transcription_job_name,
+                Media={"MediaFileUri": media_file_uri},
+                LanguageCode=language_code,
+                OutputBucketName=output_bucket,
+                ContentRedaction={
+                    "RedactionType": "PII",
+                    "RedactionOutput": "redacted",
+                },
+            )
+        except Exception as e:
+            logger.error(
+                f"Error starting transcription job {transcription_job_name}: {e}"
+            )
+            raise
+
     def check_transcription_status(self, transcription_job_name):
         """
         Poll the status of a transcription job until it completes or fails.
@@ -31,7 +70,7 @@ class TranscribeUtils:
         try:
             while True:
                 response = self.transcribe_client.get_transcription_job(
-                    transcription_job_name
+                    TranscriptionJobName=transcription_job_name
                 )
                 status = response["TranscriptionJob"]["TranscriptionJobStatus"]
                 logger.info(f"Transcription job status: {status}")
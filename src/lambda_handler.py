@@ -1,65 +1,112 @@
+import logging
+
 from common.models.strategy_factory import StrategyFactory
+from common.models.batch_processor import BatchProcessor, DIRECT_BATCH_KEY
+from common.models.json_encoder import RawJSON
 from common.models.lambda_response import LambdaResponse
 from common.models.event_sanitizer import EventSanitizer
 from common.models.trace_id import TraceId
+from common.models.invocation_deadline import InvocationDeadline
 from common.models.find_invocation_source import (
+    BATCH_INVOCATION_SOURCES,
     get_invocation_source,
     extract_event_data,
+    is_ordered_batch,
 )
 from common.models.logger import Logger
 
-
 LOGGER = Logger(__name__)
 
 
 def lambda_handler(event, context) -> LambdaResponse:
+    try:
+        return _handle_event(event, context)
+    finally:
+        # write records held by buffered logging in one call
+        LOGGER.flush()
+
+
+def _handle_event(event, context) -> LambdaResponse:
 
     invocation_source = None
     # init trace id process
     try:
-        LOGGER.info(f"Lambda handler initialized with context: {context}.")
-        LOGGER.init_context(context)
+        # the trace id keys log sampling, so it is set before the first record
         TraceId.init(context)
+        InvocationDeadline.init(context)
+        LOGGER.init_context(context)
         LOGGER.add_metadata("trace_id", TraceId.get())
+        LOGGER.info("Lambda handler initialized with context: %s.", context)
     except Exception as e:
         LOGGER.add_tempdata("error", str(e))
-        LOGGER.error(f"Error in processing Trace Id: {e}")
+        LOGGER.error("Error in processing Trace Id: %s", e)
         return LambdaResponse.error(message=str(e))
 
     # init checking event source and extracting usefull event
     try:
         invocation_source = get_invocation_source(event)
         LOGGER.add_metadata("invocation_source", invocation_source)
+        ordered = is_ordered_batch(event, invocation_source)
         event = extract_event_data(event, invocation_source)
     except Exception as e:
         LOGGER.add_tempdata("error", str(e))
-        LOGGER.error(f"Error in processing event from function url invocation: {e}")
+        LOGGER.error("Error in processing event from function url invocation: %s", e)
         return LambdaResponse.error(message=str(e))
 
+    # batch sources run the strategy per record (sanitizing each one) and
+    # report failed records instead of failing the whole invocation
+    if invocation_source in BATCH_INVOCATION_SOURCES:
+        return BatchProcessor(invocation_source, ordered=ordered).process(event)
+
+    # direct invokes may carry many requests as {"batch": [...]}; each item is
+    # validated and executed on its own and gets its own result
+    if invocation_source == "DIRECT_INVOKE" and isinstance(
+        event.get(DIRECT_BATCH_KEY), list
+    ):
+        return _handle_direct_batch(event[DIRECT_BATCH_KEY])
+
     # init Event Sanitizer to remove PII information
     try:
         LOGGER.info("Processing event sanitizer to remove sensitive data")
-        sanitizer = EventSanitizer(event)
+        sanitizer = EventSanitizer(
+            event, invocation_source=invocation_source, lazy=True
+        )
         event = sanitizer.get_sanitized_data()
     except Exception as e:
         LOGGER.add_tempdata("error", str(e))
-        LOGGER.error(f"Error in processing Event Sanitizer: {e}")
+        LOGGER.error("Error in processing Event Sanitizer: %s", e)
         return LambdaResponse.error(message=str(e))
 
     # Use StrategyFactory to choose and run strategy
     try:
-        LOGGER.info(f"Processing event: {event}")
-        LOGGER.add_metadata("event", event)
+        # the event is a lazy view: log a summary and dump it in full only
+        # when debug records are enabled, as dumping sanitizes every value
+        LOGGER.add_metadata("request_type", event.get("request_type"))
+        LOGGER.info("Processing event", event_keys=len(event))
+        if LOGGER.logger.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Processing event", event=event)
 
         response = StrategyFactory(event, invocation_source).execute()
 
-        LOGGER.info(f"Strategy response: {response}")
-        LOGGER.add_metadata("response", response)
-        # final return from lambda
-        return LambdaResponse.success(
+        # final return from lambda; the body is serialized once and logged as is
+        lambda_response = LambdaResponse.success(
             message="Strategy executed successfully", data=response
         )
+        LOGGER.info("Strategy response", response=RawJSON(lambda_response["body"]))
+        return lambda_response
+    except Exception as e:
+        LOGGER.add_tempdata("error", str(e))
+        LOGGER.error("Error in processing final execution: %s", e)
+        return LambdaResponse.error(message=str(e))
+
+
+def _handle_direct_batch(items: list) -> LambdaResponse:
+    try:
+        results = BatchProcessor("DIRECT_INVOKE").run(enumerate(items))
+        return LambdaResponse.success(
+            message="Batch executed", data={"results": results}
+        )
     except Exception as e:
         LOGGER.add_tempdata("error", str(e))
-        LOGGER.error(f"Error in processing final execution: {e}")
+        LOGGER.error("Error in processing direct invoke batch: %s", e)
         return LambdaResponse.error(message=str(e))
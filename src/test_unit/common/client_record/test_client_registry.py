@@ -0,0 +1,82 @@
+"""
+Unit tests for client_registry module.
+"""
+import threading
+from unittest.mock import patch, MagicMock
+
+from botocore.config import Config
+
+from common.client_record.client_registry import (
+    get_client,
+    get_resource,
+    reset_clients,
+)
+
+
+class TestClientRegistry:
+
+    @patch("common.client_record.client_registry.boto3")
+    def test_get_client_is_cached_per_service_and_region(self, mock_boto3):
+        """Test the same client is returned for repeated lookups."""
+        mock_boto3.client.side_effect = lambda *a, **kw: MagicMock()
+
+        first = get_client("connect", region_name="us-east-1")
+        second = get_client("connect", region_name="us-east-1")
+        other_region = get_client("connect", region_name="eu-west-2")
+
+        assert first is second
+        assert other_region is not first
+        assert mock_boto3.client.call_count == 2
+
+    @patch("common.client_record.client_registry.boto3")
+    def test_get_client_keys_on_config_values(self, mock_boto3):
+        """Test equal configs share a client and different configs do not."""
+        mock_boto3.client.side_effect = lambda *a, **kw: MagicMock()
+
+        a = get_client("sqs", "us-east-1", Config(retries={"max_attempts": 3}))
+        b = get_client("sqs", "us-east-1", Config(retries={"max_attempts": 3}))
+        c = get_client("sqs", "us-east-1", Config(retries={"max_attempts": 5}))
+
+        assert a is b
+        assert c is not a
+
+    @patch("common.client_record.client_registry.boto3")
+    def test_resource_and_client_are_separate_entries(self, mock_boto3):
+        """Test clients and resources for the same service do not collide."""
+        mock_boto3.client.return_value = MagicMock(name="client")
+        mock_boto3.resource.return_value = MagicMock(name="resource")
+
+        client = get_client("dynamodb", region_name="us-east-1")
+        resource = get_resource("dynamodb", region_name="us-east-1")
+
+        assert client is not resource
+        mock_boto3.resource.assert_called_once_with("dynamodb", region_name="us-east-1")
+
+    @patch("common.client_record.client_registry.boto3")
+    def test_reset_clients(self, mock_boto3):
+        """Test reset drops cached clients."""
+        mock_boto3.client.side_effect = lambda *a, **kw: MagicMock()
+
+        first = get_client("s3")
+        reset_clients()
+        second = get_client("s3")
+
+        assert first is not second
+
+    @patch("common.client_record.client_registry.boto3")
+    def test_concurrent_lookups_create_one_client(self, mock_boto3):
+        """Test concurrent first lookups create a single client."""
+        mock_boto3.client.side_effect = lambda *a, **kw: MagicMock()
+        results = []
+
+        def lookup():
+            results.append(get_client("connect", region_name="us-east-1"))
+
+        threads = [threading.Thread(target=lookup) for _ in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert mock_boto3.client.call_count == 1
+        assert all(r is results[0] for r in results)
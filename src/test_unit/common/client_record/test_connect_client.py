@@ -1,21 +1,23 @@
 import pytest
 from unittest.mock import patch, MagicMock
 
-from common.client_record.connect_client import connect_client
+from common.client_record.connect_client import CONNECT_CLIENT_CONFIG, connect_client
 
 
-@patch("common.client_record.connect_client.boto3")  # Patch boto3 in the connect_client module
+@patch("common.client_record.client_registry.boto3")  # Patch boto3 in the shared client registry
 def test_connect_client_default_region(mock_boto3):
     mock_client_obj = MagicMock()
     mock_boto3.client.return_value = mock_client_obj
 
     client = connect_client()
 
-    mock_boto3.client.assert_called_once_with("connect", region_name="us-east-1")
+    mock_boto3.client.assert_called_once_with(
+        "connect", region_name="us-east-1", config=CONNECT_CLIENT_CONFIG
+    )
     assert client is mock_client_obj
 
 
-@patch("common.client_record.connect_client.boto3")  # Patch boto3 in the connect_client module
+@patch("common.client_record.client_registry.boto3")  # Patch boto3 in the shared client registry
 def test_connect_client_custom_region(mock_boto3):
     mock_client_obj = MagicMock()
     mock_boto3.client.return_value = mock_client_obj
@@ -23,5 +25,35 @@ def test_connect_client_custom_region(mock_boto3):
     region = "ap-south-1"
     client = connect_client(region_name=region)
 
-    mock_boto3.client.assert_called_once_with("connect", region_name=region)
-    assert client is mock_client_obj
\ No newline at end of file
+    mock_boto3.client.assert_called_once_with(
+        "connect", region_name=region, config=CONNECT_CLIENT_CONFIG
+    )
+    assert client is mock_client_obj
+
+
+def test_connect_client_does_not_retry_throttles(monkeypatch):
+    """A throttled call is sent once; ConnectUtils is the only retry layer."""
+    from botocore.awsrequest import AWSResponse
+    from botocore.exceptions import ClientError
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+
+    class ThrottledBody:
+        def stream(self, **kwargs):
+            yield b'{"__type": "TooManyRequestsException", "Message": "Rate exceeded"}'
+
+    sent = []
+
+    def send(request, **kwargs):
+        sent.append(request.url)
+        return AWSResponse(request.url, 429, {"x-amzn-ErrorType": "TooManyRequestsException"}, ThrottledBody())
+
+    client = connect_client("us-east-1")
+    client.meta.events.register("before-send", send)
+
+    with pytest.raises(ClientError, match="TooManyRequestsException"):
+        client.describe_contact(InstanceId="instance-id", ContactId="contact-id")
+
+    assert len(sent) == 1
+
@@ -8,7 +8,7 @@ from common.client_record.dynamodb_client import dynamoDB_client
 
 class TestDynamoDBClient:
     
-    @patch('common.client_record.dynamodb_client.boto3.client')
+    @patch('common.client_record.client_registry.boto3.client')
     def test_dynamodb_client_success(self, mock_boto3_client):
         """Test successful DynamoDB client creation."""
         mock_client = MagicMock()
@@ -19,7 +19,7 @@ class TestDynamoDBClient:
         assert client == mock_client
         mock_boto3_client.assert_called_once_with('dynamodb', region_name='us-east-1')
     
-    @patch('common.client_record.dynamodb_client.boto3.client')
+    @patch('common.client_record.client_registry.boto3.client')
     def test_dynamodb_client_with_region(self, mock_boto3_client):
         """Test DynamoDB client creation with specific region."""
         mock_client = MagicMock()
@@ -30,7 +30,7 @@ class TestDynamoDBClient:
         assert client == mock_client
         mock_boto3_client.assert_called_once_with('dynamodb', region_name='eu-west-1')
     
-    @patch('common.client_record.dynamodb_client.boto3.client')
+    @patch('common.client_record.client_registry.boto3.client')
     def test_dynamodb_client_exception(self, mock_boto3_client):
         """Test DynamoDB client creation with exception."""
         mock_boto3_client.side_effect = Exception("Service unavailable")
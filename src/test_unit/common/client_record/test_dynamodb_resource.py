@@ -3,7 +3,7 @@ from unittest.mock import patch, MagicMock
 from common.client_record.dynamodb_resource import dynamoDB_resource, dynamoDB_condition_Expression
 
 
-@patch("common.client_record.dynamodb_resource.boto3") 
+@patch("common.client_record.client_registry.boto3") 
 def test_dynamodb_resource_default_region(mock_boto3):
     mock_resource_obj = MagicMock()
     mock_boto3.resource.return_value = mock_resource_obj
@@ -14,7 +14,7 @@ def test_dynamodb_resource_default_region(mock_boto3):
     assert client is mock_resource_obj
 
 
-@patch("common.client_record.dynamodb_resource.boto3") 
+@patch("common.client_record.client_registry.boto3") 
 def test_dynamodb_resource_custom_region(mock_boto3):
     mock_resource_obj = MagicMock()
     mock_boto3.resource.return_value = mock_resource_obj
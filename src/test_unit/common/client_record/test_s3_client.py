@@ -8,7 +8,7 @@ from common.client_record.s3_client import s3_client
 
 class TestS3Client:
     
-    @patch('common.client_record.s3_client.boto3.client')
+    @patch('common.client_record.client_registry.boto3.client')
     def test_s3_client_success(self, mock_boto3_client):
         """Test successful S3 client creation."""
         mock_client = MagicMock()
@@ -19,7 +19,7 @@ class TestS3Client:
         assert client == mock_client
         mock_boto3_client.assert_called_once_with('s3')
     
-    @patch('common.client_record.s3_client.boto3.client')
+    @patch('common.client_record.client_registry.boto3.client')
     def test_s3_client_no_parameters(self, mock_boto3_client):
         """Test S3 client creation without parameters."""
         mock_client = MagicMock()
@@ -30,7 +30,7 @@ class TestS3Client:
         assert client == mock_client
         mock_boto3_client.assert_called_once_with('s3')
     
-    @patch('common.client_record.s3_client.boto3.client')
+    @patch('common.client_record.client_registry.boto3.client')
     def test_s3_client_exception(self, mock_boto3_client):
         """Test S3 client creation with exception."""
         mock_boto3_client.side_effect = Exception("AWS credentials not found")
@@ -4,7 +4,7 @@ from unittest.mock import patch, MagicMock
 from common.client_record.sns_client import sns_client
 
 
-@patch("common.client_record.sns_client.boto3")  # Patch boto3 in the sns_client module
+@patch("common.client_record.client_registry.boto3")  # Patch boto3 in the shared client registry
 def test_sns_client_default_region(mock_boto3):
     mock_client_obj = MagicMock()
     mock_boto3.client.return_value = mock_client_obj
@@ -15,7 +15,7 @@ def test_sns_client_default_region(mock_boto3):
     assert client is mock_client_obj
 
 
-@patch("common.client_record.sns_client.boto3")  # Patch boto3 in the sns_client module
+@patch("common.client_record.client_registry.boto3")  # Patch boto3 in the shared client registry
 def test_sns_client_custom_region(mock_boto3):
     mock_client_obj = MagicMock()
     mock_boto3.client.return_value = mock_client_obj
@@ -0,0 +1,174 @@
+"""
+Unit tests for batch_processor module.
+"""
+import threading
+import pytest
+from unittest.mock import patch, MagicMock
+from common.models.batch_processor import (
+    BATCH_CHUNK_SIZE,
+    DEFAULT_BATCH_MAX_WORKERS,
+    BatchProcessor,
+)
+from common.models.lambda_response import LambdaResponse
+
+
+def _factory_for(results):
+    """StrategyFactory stand-in returning results[request_type] from execute()."""
+    def build(event, invoke_type):
+        outcome = results[event["request_type"]]
+        if isinstance(outcome, Exception):
+            raise outcome
+        factory = MagicMock()
+        factory.execute.return_value = outcome
+        return factory
+    return build
+
+
+class TestBatchProcessor:
+
+    def test_all_records_succeed(self):
+        """Test an empty failure list acknowledges the whole batch."""
+        records = [("m1", {"request_type": "StatusCheckerSQS"}), ("m2", {"request_type": "StatusCheckerSQS"})]
+
+        result = BatchProcessor("SQS").process(records)
+
+        assert result == {"batchItemFailures": []}
+
+    @patch('common.models.batch_processor.StrategyFactory')
+    def test_failed_records_are_reported(self, mock_factory):
+        """Test error responses, exceptions and non-object bodies fail only their record."""
+        mock_factory.side_effect = _factory_for({
+            "ok": {"status": "done"},
+            "error": LambdaResponse.error(message="boom"),
+            "invalid": Exception("Failed in validate strategy"),
+        })
+        records = [
+            ("m1", {"request_type": "ok"}),
+            ("m2", {"request_type": "error"}),
+            ("m3", {"request_type": "invalid"}),
+            ("m4", "not json"),
+            ("m5", {"request_type": "ok"}),
+        ]
+
+        result = BatchProcessor("SQS").process(iter(records))
+
+        assert result == {
+            "batchItemFailures": [
+                {"itemIdentifier": "m2"},
+                {"itemIdentifier": "m3"},
+                {"itemIdentifier": "m4"},
+            ]
+        }
+
+    @patch('common.models.batch_processor.StrategyFactory')
+    def test_ordered_batch_stops_at_first_failure(self, mock_factory):
+        """Test FIFO batches report the failed record and everything after it."""
+        mock_factory.side_effect = _factory_for({
+            "ok": {"status": "done"},
+            "error": LambdaResponse.error(message="boom"),
+        })
+        records = [
+            ("m1", {"request_type": "ok"}),
+            ("m2", {"request_type": "error"}),
+            ("m3", {"request_type": "ok"}),
+        ]
+
+        result = BatchProcessor("SQS", max_workers=4, ordered=True).process(records)
+
+        assert [f["itemIdentifier"] for f in result["batchItemFailures"]] == ["m2", "m3"]
+        assert mock_factory.call_count == 2
+
+    @patch('common.models.batch_processor.StrategyFactory')
+    def test_concurrent_processing_keeps_record_order(self, mock_factory):
+        """Test records run on the worker pool and failures keep batch order."""
+        threads = set()
+
+        def build(event, invoke_type):
+            threads.add(threading.get_ident())
+            factory = MagicMock()
+            factory.execute.return_value = (
+                LambdaResponse.error(message="boom") if event["fail"] else {"ok": True}
+            )
+            return factory
+
+        mock_factory.side_effect = build
+        records = [(f"m{i}", {"request_type": "x", "fail": i % 3 == 0}) for i in range(9)]
+
+        result = BatchProcessor("SQS", max_workers=3).process(records)
+
+        assert [f["itemIdentifier"] for f in result["batchItemFailures"]] == ["m0", "m3", "m6"]
+        assert threading.get_ident() not in threads
+
+    def test_max_workers_from_environment(self, monkeypatch):
+        """Test BATCH_MAX_WORKERS sets the default pool size."""
+        monkeypatch.setenv("BATCH_MAX_WORKERS", "8")
+        assert BatchProcessor("SQS").max_workers == 8
+
+        monkeypatch.setenv("BATCH_MAX_WORKERS", "invalid")
+        assert BatchProcessor("SQS").max_workers == DEFAULT_BATCH_MAX_WORKERS
+
+        monkeypatch.delenv("BATCH_MAX_WORKERS")
+        assert BatchProcessor("DIRECT_INVOKE").max_workers > 1
+
+    @patch('common.models.batch_processor.StrategyFactory')
+    def test_records_are_sanitized(self, mock_factory):
+        """Test each record reaches the strategy masked."""
+        mock_factory.return_value.execute.return_value = {"ok": True}
+
+        BatchProcessor("SQS").process([("m1", {"request_type": "x", "password": "secret"})])
+
+        event = mock_factory.call_args[0][0]
+        assert event["password"] == "***password***"
+        assert mock_factory.call_args[0][1] == "SQS"
+
+    @patch('common.models.batch_processor.StrategyFactory')
+    def test_run_returns_a_result_per_item(self, mock_factory):
+        """Test direct batches return each item's response or error message in order."""
+        mock_factory.side_effect = _factory_for({
+            "ok": {"status": "done"},
+            "error": LambdaResponse.error(message="boom"),
+            "invalid": Exception("Failed in validate strategy"),
+        })
+        items = [
+            {"request_type": "ok"},
+            {"request_type": "error"},
+            {"request_type": "invalid"},
+            "not an object",
+        ]
+
+        results = BatchProcessor("DIRECT_INVOKE", max_workers=2).run(enumerate(items))
+
+        assert results == [
+            {"item": 0, "result": "success", "data": {"status": "done"}},
+            {"item": 1, "result": "error", "message": "boom"},
+            {"item": 2, "result": "error", "message": "Failed in validate strategy"},
+            {"item": 3, "result": "error", "message": "Batch item is not a JSON object"},
+        ]
+
+    def test_non_object_record_message_depends_on_source(self):
+        """Test queue records and direct batch items get their own not-an-object message."""
+        processor = BatchProcessor("SQS")
+        assert processor._process_record("m1", "text") == (
+            False, "Record body is not a JSON object"
+        )
+        processor = BatchProcessor("DIRECT_INVOKE")
+        assert processor._process_record(0, ["a"]) == (
+            False, "Batch item is not a JSON object"
+        )
+
+    @patch('common.models.batch_processor.StrategyFactory')
+    def test_concurrent_processing_pulls_records_in_chunks(self, mock_factory):
+        """Test the pool only consumes a bounded chunk of the record iterator at a time."""
+        mock_factory.return_value.execute.return_value = {"ok": True}
+        pulled = []
+
+        def records():
+            for i in range(20):
+                pulled.append(i)
+                yield f"m{i}", {"request_type": "x"}
+
+        outcomes = BatchProcessor("SQS", max_workers=2)._process_all(records())
+        next(outcomes)
+
+        assert len(pulled) == 2 * BATCH_CHUNK_SIZE
+        assert len(list(outcomes)) == 19
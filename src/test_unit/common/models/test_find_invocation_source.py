@@ -1,7 +1,6 @@
 """
 Unit tests for find_invocation_source module.
 """
-import pytest
 from common.models.find_invocation_source import (
     get_invocation_source, 
     extract_event_data,
@@ -56,7 +55,7 @@ class TestFindInvocationSource:
             ]
         }
         assert _is_s3_event(event) is True
-    
+
     def test_is_s3_event_false(self):
         """Test S3 event detection returns false."""
         event = {"Records": [{"eventSource": "aws:sns"}]}
@@ -268,4 +267,142 @@ class TestFindInvocationSource:
         assert result == []
         
         result = extract_event_data(event, "EVENTBRIDGE")
-        assert result == {}
\ No newline at end of file
+        assert result == {}
+
+    def test_get_invocation_source_contact_flow_name_fast_path(self):
+        """Test the standard contact flow Name is recognised without Details."""
+        assert get_invocation_source({"Name": "ContactFlowEvent"}) == "AMAZON_CONNECT"
+        assert get_invocation_source({"Name": "Report"}) == "DIRECT_INVOKE"
+
+    def test_get_invocation_source_unknown_records(self):
+        """Test records from an unregistered source fall back to DIRECT_INVOKE."""
+        event = {"Records": [{"eventSource": "aws:unknown"}]}
+        assert get_invocation_source(event) == "DIRECT_INVOKE"
+
+    def test_register_record_source(self, monkeypatch):
+        """Test a new record source resolves and uses its extractor."""
+        from common.models import find_invocation_source as module
+
+        monkeypatch.setattr(module, "_RECORD_SOURCES", dict(module._RECORD_SOURCES))
+        monkeypatch.setattr(module, "_EXTRACTORS", dict(module._EXTRACTORS))
+        module.register_record_source(
+            "aws:custom", "CUSTOM", lambda event: [r["body"] for r in event["Records"]]
+        )
+
+        event = {"Records": [{"eventSource": "aws:custom", "body": "b1"}]}
+        assert get_invocation_source(event) == "CUSTOM"
+        assert extract_event_data(event, "CUSTOM") == ["b1"]
+
+    def test_register_invocation_source(self, monkeypatch):
+        """Test a registered classifier runs only when its trigger key is present."""
+        from common.models import find_invocation_source as module
+
+        monkeypatch.setattr(module, "_CLASSIFIERS", list(module._CLASSIFIERS))
+        monkeypatch.setattr(module, "_EXTRACTORS", dict(module._EXTRACTORS))
+        monkeypatch.setattr(
+            module, "_REGISTERED_TRIGGER_KEYS", module._REGISTERED_TRIGGER_KEYS
+        )
+        calls = []
+
+        def classify_custom(event):
+            calls.append(event)
+            return "CUSTOM" if event["custom"] == "yes" else None
+
+        module.register_invocation_source(
+            "custom", classify_custom, "CUSTOM", lambda event: event["payload"]
+        )
+
+        assert get_invocation_source({"other": 1}) == "DIRECT_INVOKE"
+        assert calls == []
+        event = {"custom": "yes", "payload": {"a": 1}}
+        assert get_invocation_source(event) == "CUSTOM"
+        assert extract_event_data(event, "CUSTOM") == {"a": 1}
+        assert get_invocation_source({"custom": "no"}) == "DIRECT_INVOKE"
+
+    def test_get_invocation_source_sqs(self):
+        """Test SQS event detection."""
+        event = {"Records": [{"messageId": "m1", "eventSource": "aws:sqs", "body": "{}"}]}
+        assert get_invocation_source(event) == "SQS"
+
+    def test_extract_event_data_sqs(self):
+        """Test SQS records yield (messageId, parsed body) pairs."""
+        event = {
+            "Records": [
+                {"messageId": "m1", "body": '{"request_type": "StatusCheckerSQS"}'},
+                {"messageId": "m2", "body": "plain text"},
+            ]
+        }
+        result = extract_event_data(event, "SQS")
+        assert list(result) == [
+            ("m1", {"request_type": "StatusCheckerSQS"}),
+            ("m2", "plain text"),
+        ]
+
+    def test_is_ordered_batch(self):
+        """Test only SQS FIFO queues are processed in order."""
+        from common.models.find_invocation_source import is_ordered_batch
+
+        fifo = {"Records": [{"eventSourceARN": "arn:aws:sqs:eu-west-2:123:jobs.fifo"}]}
+        standard = {"Records": [{"eventSourceARN": "arn:aws:sqs:eu-west-2:123:jobs"}]}
+        assert is_ordered_batch(fifo, "SQS") is True
+        assert is_ordered_batch(standard, "SQS") is False
+        assert is_ordered_batch({"Records": []}, "SQS") is False
+        assert is_ordered_batch(fifo, "S3") is False
+
+    def test_get_invocation_source_streams(self):
+        """Test Kinesis and DynamoDB Streams event detection."""
+        assert get_invocation_source({"Records": [{"eventSource": "aws:kinesis"}]}) == "KINESIS"
+        assert get_invocation_source({"Records": [{"eventSource": "aws:dynamodb"}]}) == "DYNAMODB_STREAMS"
+
+    def test_extract_event_data_kinesis(self):
+        """Test Kinesis records yield (sequenceNumber, decoded data) lazily."""
+        import base64
+
+        data = base64.b64encode(b'{"request_type": "StatusCheckerKinesis"}').decode()
+        event = {
+            "Records": [
+                {"kinesis": {"sequenceNumber": "1", "data": data}},
+                {"kinesis": {"sequenceNumber": "2", "data": "not base64 json"}},
+            ]
+        }
+        result = extract_event_data(event, "KINESIS")
+        assert next(result) == ("1", {"request_type": "StatusCheckerKinesis"})
+        assert next(result) == ("2", None)
+
+    def test_extract_event_data_dynamodb_streams(self):
+        """Test DynamoDB Streams records yield (SequenceNumber, deserialized NewImage)."""
+        from decimal import Decimal
+
+        event = {
+            "Records": [
+                {"eventName": "INSERT", "dynamodb": {"SequenceNumber": "100", "NewImage": {
+                    "request_type": {"S": "StatusCheckerDynamoDBStreams"}, "Id": {"N": "7"}}}},
+                {"eventName": "REMOVE", "dynamodb": {"SequenceNumber": "200", "OldImage": {"Id": {"N": "8"}}}},
+                {"dynamodb": {"SequenceNumber": "300"}},
+            ]
+        }
+        assert list(extract_event_data(event, "DYNAMODB_STREAMS")) == [
+            ("100", {"request_type": "StatusCheckerDynamoDBStreams", "Id": Decimal("7"), "eventName": "INSERT"}),
+            ("300", None),
+        ]
+
+    def test_stream_request_type_default(self, monkeypatch):
+        """Test STREAM_REQUEST_TYPE fills request_type for records without one."""
+        monkeypatch.setenv("STREAM_REQUEST_TYPE", "DynamoDBStoreAttributes")
+        event = {
+            "Records": [
+                {"dynamodb": {"SequenceNumber": "1", "NewImage": {"Id": {"N": "1"}}}},
+                {"dynamodb": {"SequenceNumber": "2", "NewImage": {"request_type": {"S": "Other"}}}},
+            ]
+        }
+        request_types = [
+            item["request_type"] for _, item in extract_event_data(event, "DYNAMODB_STREAMS")
+        ]
+        assert request_types == ["DynamoDBStoreAttributes", "Other"]
+
+    def test_streams_are_ordered_batches(self):
+        """Test Kinesis and DynamoDB Streams batches are always processed in order."""
+        from common.models.find_invocation_source import is_ordered_batch
+
+        assert is_ordered_batch({"Records": []}, "KINESIS") is True
+        assert is_ordered_batch({"Records": []}, "DYNAMODB_STREAMS") is True
@@ -0,0 +1,37 @@
+"""
+Unit tests for invocation_deadline module.
+"""
+from unittest.mock import MagicMock
+from common.models.invocation_deadline import InvocationDeadline
+
+
+class TestInvocationDeadline:
+
+    def setup_method(self):
+        """Reset the deadline before each test."""
+        InvocationDeadline.set(None)
+
+    def test_init_with_lambda_context(self):
+        """Test the deadline follows get_remaining_time_in_millis."""
+        context = MagicMock()
+        context.get_remaining_time_in_millis.return_value = 60000
+        InvocationDeadline.init(context)
+
+        assert 59 < InvocationDeadline.remaining_seconds() <= 60
+
+    def test_init_without_remaining_time(self):
+        """Test dict contexts and unusable values leave the deadline unknown."""
+        InvocationDeadline.set(5)
+        InvocationDeadline.init({"aws_request_id": "test-request-id"})
+        assert InvocationDeadline.remaining_seconds() is None
+
+        InvocationDeadline.init(MagicMock())
+        assert InvocationDeadline.remaining_seconds() is None
+
+    def test_set(self):
+        """Test set() moves the deadline and None clears it."""
+        InvocationDeadline.set(-1)
+        assert InvocationDeadline.remaining_seconds() < 0
+
+        InvocationDeadline.set(None)
+        assert InvocationDeadline.remaining_seconds() is None
@@ -0,0 +1,88 @@
+"""
+Unit tests for json_encoder module.
+"""
+import json
+import pytest
+from datetime import datetime, date, timezone
+from decimal import Decimal
+from common.models.json_encoder import RawJSON, dumps, encoder_name, set_encoder
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def encoder(request, monkeypatch):
+    """Run a test with each encoder, skipping orjson when it is not installed."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    monkeypatch.setenv("JSON_ENCODER", request.param)
+    set_encoder()
+    yield request.param
+    monkeypatch.delenv("JSON_ENCODER")
+    set_encoder()
+
+
+class TestJsonEncoder:
+
+    def test_encoder_selection(self, encoder):
+        """Test JSON_ENCODER picks the encoder."""
+        assert encoder_name() == f"_{encoder}_dumps"
+
+    def test_native_types(self, encoder):
+        """Test datetime, Decimal, set and mappings are converted."""
+        from common.models.event_sanitizer import EventSanitizer
+
+        view = EventSanitizer({"password": "secret"}, lazy=True).get_sanitized_data()
+        value = {
+            "at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "day": date(2026, 1, 2),
+            "count": Decimal("42"),
+            "price": Decimal("9.5"),
+            "tags": {"a"},
+            "event": view,
+            "name": "Zoë",
+        }
+
+        text = dumps(value)
+
+        assert json.loads(text) == {
+            "at": "2026-01-02T03:04:05+00:00",
+            "day": "2026-01-02",
+            "count": 42,
+            "price": 9.5,
+            "tags": ["a"],
+            "event": {"password": "***password***"},
+            "name": "Zoë",
+        }
+        assert "Zoë" in text
+
+    def test_integers_beyond_64_bits(self, encoder):
+        """Test large DynamoDB numbers are written exactly by either encoder."""
+        from common.models.lambda_response import LambdaResponse
+
+        value = {"id": Decimal("123456789012345678901234"), "big": 2**70}
+
+        assert json.loads(dumps(value)) == {"id": 123456789012345678901234, "big": 2**70}
+        response = LambdaResponse.success(data={"id": Decimal("123456789012345678901234")})
+        assert json.loads(response["body"])["data"] == {"id": 123456789012345678901234}
+
+    def test_strict_and_lenient(self, encoder):
+        """Test unknown types raise when strict and become str() otherwise."""
+        class Custom:
+            def __str__(self):
+                return "custom"
+
+        with pytest.raises(TypeError):
+            dumps({"value": Custom()})
+        assert json.loads(dumps({"value": Custom()}, strict=False)) == {"value": "custom"}
+
+    def test_set_encoder_custom(self):
+        """Test a custom encoder can be plugged in and reset."""
+        set_encoder(lambda value, strict=True: "custom")
+        try:
+            assert dumps({"a": 1}) == "custom"
+        finally:
+            set_encoder()
+        assert json.loads(dumps({"a": 1})) == {"a": 1}
+
+    def test_raw_json_is_a_string(self):
+        """Test RawJSON values behave like the serialized text they hold."""
+        assert RawJSON('{"a": 1}') == '{"a": 1}'
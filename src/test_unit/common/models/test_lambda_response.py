@@ -4,6 +4,8 @@ Unit tests for lambda_response module.
 import pytest
 import json
 from datetime import datetime, timezone
+from decimal import Decimal
+from common.models.event_sanitizer import EventSanitizer
 from common.models.lambda_response import LambdaResponse
 
 
@@ -112,4 +114,42 @@ class TestLambdaResponse:
         # Should be able to parse the timestamp
         timestamp = datetime.fromisoformat(body["timestamp"].replace('Z', '+00:00'))
         assert isinstance(timestamp, datetime)
-        assert timestamp.tzinfo is not None
\ No newline at end of file
+        assert timestamp.tzinfo is not None
+
+    def test_data_with_sanitized_view(self):
+        """Test lazy sanitized events in the data are serialized as masked dicts."""
+        view = EventSanitizer({"password": "secret", "name": "John"}, lazy=True).get_sanitized_data()
+        response = LambdaResponse.success(data={"event": view})
+
+        body = json.loads(response["body"])
+        assert body["data"]["event"] == {"password": "***password***", "name": "John"}
+
+    def test_unserializable_data_still_raises(self):
+        """Test objects other than mappings are still rejected."""
+        with pytest.raises(TypeError):
+            LambdaResponse.success(data={"value": object()})
+
+    def test_batch_item_failures(self):
+        """Test the partial batch response shape."""
+        assert LambdaResponse.batch_item_failures(["m1", "m2"]) == {
+            "batchItemFailures": [{"itemIdentifier": "m1"}, {"itemIdentifier": "m2"}]
+        }
+        assert LambdaResponse.batch_item_failures([]) == {"batchItemFailures": []}
+
+    def test_data_with_dynamodb_types(self):
+        """Test Decimal, datetime and set values returned by strategies are serialized."""
+        data = {"count": Decimal("3"), "at": datetime(2026, 1, 1, tzinfo=timezone.utc), "ids": {"a"}}
+        response = LambdaResponse.success(data=data)
+
+        body = json.loads(response["body"])
+        assert body["data"] == {"count": 3, "at": "2026-01-01T00:00:00+00:00", "ids": ["a"]}
+
+    def test_non_ascii_body_is_not_escaped(self):
+        """Test non-ASCII characters are written as UTF-8 text, not \\u escapes."""
+        response = LambdaResponse.success(message="Ação concluída", data={"name": "José 日本"})
+
+        assert "Ação concluída" in response["body"]
+        assert "José 日本" in response["body"]
+        assert "\\u" not in response["body"]
+        body = json.loads(response["body"])
+        assert body["data"]["name"] == "José 日本"
@@ -5,8 +5,10 @@ import pytest
 import json
 import logging
 import os
+import sys
 from unittest.mock import patch, MagicMock
 from common.models.logger import Logger
+from common.models.trace_id import TraceId
 
 
 class TestLogger:
@@ -226,20 +228,20 @@ class TestLogger:
         """Test that add_tempdata stores data temporarily."""
         logger = Logger("test_logger")
         
-        # add_tempdata should log immediately and clear tempdata
-        logger.add_tempdata("request_id", "temp-123")
+        with patch.object(logger.logger, 'log') as mock_log:
+            logger.add_tempdata("request_id", "temp-123")
         
-        # After logging, tempdata should be cleared
-        assert logger._tempdata == {}
+        # Nothing is logged; the data waits for the next record
+        mock_log.assert_not_called()
+        assert logger._tempdata == {"request_id": "temp-123"}
     
     def test_add_tempdata_with_none_key(self):
         """Test add_tempdata with None key."""
         logger = Logger("test_logger")
         
-        initial_tempdata = logger._tempdata.copy()
         logger.add_tempdata(None, "value")
         
-        # Tempdata should be cleared after logging
+        # None keys are ignored
         assert logger._tempdata == {}
     
     def test_add_tempdata_multiple_calls(self):
@@ -247,10 +249,9 @@ class TestLogger:
         logger = Logger("test_logger")
         
         logger.add_tempdata("key1", "value1")
-        assert logger._tempdata == {}
-        
         logger.add_tempdata("key2", "value2")
-        assert logger._tempdata == {}
+        
+        assert logger._tempdata == {"key1": "value1", "key2": "value2"}
     
     def test_init_context_with_aws_request_id(self):
         """Test context initialization with AWS request ID."""
@@ -338,14 +339,15 @@ class TestLogger:
         """Test that tempdata is cleared after logging."""
         logger = Logger("test_logger")
         
-        # add_tempdata logs immediately and clears
         logger.add_tempdata("temp", "value")
+        logger.info("Message carrying tempdata")
+        
         assert logger._tempdata == {}
     
-    @patch('common.models.logger.inspect.currentframe')
+    @patch('common.models.logger._getframe')
     def test_log_with_no_frame(self, mock_frame):
         """Test logging when frame inspection fails."""
-        mock_frame.return_value = None
+        mock_frame.side_effect = ValueError("call stack is not deep enough")
         
         logger = Logger("test_logger")
         
@@ -355,12 +357,9 @@ class TestLogger:
         except Exception as e:
             pytest.fail(f"Logging should handle missing frame gracefully: {e}")
     
-    @patch('common.models.logger.inspect.currentframe')
-    def test_log_with_no_caller_frame(self, mock_frame):
-        """Test logging when caller frame is missing."""
-        mock_current_frame = MagicMock()
-        mock_current_frame.f_back = None
-        mock_frame.return_value = mock_current_frame
+    @patch('common.models.logger._getframe', None)
+    def test_log_with_no_caller_frame(self):
+        """Test logging when frame access is unavailable."""
         
         logger = Logger("test_logger")
         
@@ -370,7 +369,7 @@ class TestLogger:
         except Exception as e:
             pytest.fail(f"Logging should handle missing caller frame gracefully: {e}")
     
-    @patch('common.models.logger.json.dumps')
+    @patch('common.models.logger.dumps')
     def test_log_handles_json_serialization_error(self, mock_json_dumps):
         """Test that logging handles JSON serialization errors."""
         mock_json_dumps.side_effect = [Exception("JSON error"), '{"fallback": "log"}']
@@ -408,7 +407,8 @@ class TestLogger:
         
         try:
             logger.add_tempdata("temporary", "data")
-            # Tempdata should be cleared after the log in add_tempdata
+            logger.info("Message with metadata and tempdata")
+            # Tempdata should be cleared after the next log
             assert logger._tempdata == {}
             assert logger._metadata["persistent"] == "metadata"
         except Exception as e:
@@ -435,4 +435,304 @@ class TestLogger:
             logger.info(long_message)
             assert True
         except Exception as e:
-            pytest.fail(f"Logging long message should not raise exception: {e}")
\ No newline at end of file
+            pytest.fail(f"Logging long message should not raise exception: {e}")
+
+    def test_caller_info_points_at_call_site(self):
+        """Test function, file and line resolve to the caller of info()."""
+        logger = Logger("test_logger")
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            expected_line = sys._getframe().f_lineno + 1
+            logger.info("Caller message")
+
+        entry = json.loads(mock_log.call_args[0][1])
+        assert entry["function"] == "test_caller_info_points_at_call_site"
+        assert entry["file"] == "test_logger.py"
+        assert entry["line"] == expected_line
+
+    @patch.dict(os.environ, {'LOG_CALLER_INFO': 'false'})
+    def test_caller_info_disabled_by_config(self):
+        """Test LOG_CALLER_INFO=false omits caller fields."""
+        logger = Logger("test_logger")
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            logger.info("No caller message")
+
+        entry = json.loads(mock_log.call_args[0][1])
+        assert logger.include_caller is False
+        assert "function" not in entry
+        assert "file" not in entry
+        assert "line" not in entry
+
+    def test_tempdata_attached_to_next_record_only(self):
+        """Test tempdata reaches the next record and is then cleared."""
+        logger = Logger("test_logger")
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            logger.add_tempdata("error", "boom")
+            logger.error("First record")
+            logger.error("Second record")
+
+        assert mock_log.call_count == 2
+        first = json.loads(mock_log.call_args_list[0][0][1])
+        second = json.loads(mock_log.call_args_list[1][0][1])
+        assert first["error"] == "boom"
+        assert "error" not in second
+
+    def test_tempdata_cleared_when_record_is_dropped(self):
+        """Test tempdata of a filtered, sampled-out or rate-limited call does not leak."""
+        logger = Logger("test_logger")
+        logger.rate_limits = {logging.INFO: 1}
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            logger.add_tempdata("filtered", True)
+            logger.debug("Filtered debug line")
+            for i in range(2):
+                logger.add_tempdata("limited", i)
+                logger.info("Rate limited line")
+            with patch.object(logger, '_is_sampled', return_value=False):
+                logger.add_tempdata("sampled_out", True)
+                logger.info("Sampled out line")
+            logger.error("Next record")
+
+        assert mock_log.call_count == 2
+        entry = json.loads(mock_log.call_args_list[1][0][1])
+        assert entry["message"] == "Next record"
+        assert not {"filtered", "limited", "sampled_out"} & set(entry)
+        assert logger._tempdata == {}
+
+    def test_scoped_fields(self):
+        """Test scoped fields attach to every record in the block and nest."""
+        logger = Logger("test_logger")
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            with logger.scoped_fields(contact_id="c-1", batch=1):
+                logger.info("Outer")
+                with logger.scoped_fields(batch=2):
+                    logger.info("Inner")
+                logger.info("Outer again")
+            logger.info("Outside")
+
+        entries = [json.loads(call[0][1]) for call in mock_log.call_args_list]
+        assert [e.get("contact_id") for e in entries] == ["c-1", "c-1", "c-1", None]
+        assert [e.get("batch") for e in entries] == [1, 2, 1, None]
+
+    def test_init_context_clears_stale_tempdata(self):
+        """Test tempdata left over from a previous invocation is dropped."""
+        logger = Logger("test_logger")
+
+        logger.add_tempdata("stale", "value")
+        logger.init_context(None)
+
+        assert logger._tempdata == {}
+
+    def test_buffered_mode_writes_once_on_flush(self):
+        """Test buffered records are written in a single call on flush."""
+        logger = Logger("test_logger")
+        logger.buffered = True
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            logger.info("first")
+            logger.warning("second")
+            mock_log.assert_not_called()
+            logger.flush()
+
+        mock_log.assert_called_once()
+        level, payload = mock_log.call_args[0]
+        assert level == logging.WARNING
+        assert [json.loads(line)["message"] for line in payload.split("\n")] == ["first", "second"]
+
+    def test_buffered_mode_flushes_when_full(self):
+        """Test the buffer is written as soon as it reaches buffer_size."""
+        logger = Logger("test_logger")
+        logger.buffered = True
+        logger.buffer_size = 3
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            for i in range(7):
+                logger.info(f"line {i}")
+            assert mock_log.call_count == 2
+            logger.flush()
+
+        assert mock_log.call_count == 3
+        assert mock_log.call_args[0][1].count("\n") == 0
+
+    def test_debug_on_error_discards_debug_without_error(self):
+        """Test below-level records are dropped when the invocation succeeded."""
+        logger = Logger("test_logger")
+        logger.buffered = True
+        logger.debug_on_error = True
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            logger.debug("debug context")
+            logger.info("info line")
+            logger.flush()
+
+        messages = [json.loads(line)["message"] for line in mock_log.call_args[0][1].split("\n")]
+        assert messages == ["info line"]
+
+    def test_debug_on_error_writes_debug_after_error(self):
+        """Test below-level records are written when the invocation errored."""
+        logger = Logger("test_logger")
+        logger.buffered = True
+        logger.debug_on_error = True
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            logger.debug("debug context")
+            logger.error("failure")
+            logger.flush()
+            logger.flush()
+
+        mock_log.assert_called_once()
+        level, payload = mock_log.call_args[0]
+        messages = [json.loads(line)["message"] for line in payload.split("\n")]
+        assert level == logging.ERROR
+        assert messages == ["debug context", "failure"]
+        assert logger._invocation_errored is False
+
+    def test_debug_on_error_keeps_emission_order(self):
+        """Test below-level records are interleaved with the others in logged order."""
+        logger = Logger("test_logger")
+        logger.buffered = True
+        logger.debug_on_error = True
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            logger.info("info 1")
+            logger.debug("debug 1")
+            logger.info("info 2")
+            logger.debug("debug 2")
+            logger.error("failure")
+            logger.debug("debug 3")
+            logger.flush()
+
+        messages = [json.loads(line)["message"] for line in mock_log.call_args[0][1].split("\n")]
+        assert messages == ["info 1", "debug 1", "info 2", "debug 2", "failure", "debug 3"]
+
+    @patch.dict(os.environ, {'LOG_BUFFERED': 'true', 'LOG_BUFFER_SIZE': '5', 'LOG_DEBUG_ON_ERROR': 'true'})
+    def test_buffered_mode_from_environment(self):
+        """Test buffering is configured from environment variables."""
+        logger = Logger("test_logger")
+
+        assert logger.buffered is True
+        assert logger.buffer_size == 5
+        assert logger.debug_on_error is True
+
+    def test_unbuffered_flush_is_noop(self):
+        """Test flush writes nothing when buffering is off."""
+        logger = Logger("test_logger")
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            logger.info("direct")
+            logger.flush()
+
+        mock_log.assert_called_once()
+
+    def test_sampling_is_deterministic_per_trace_id(self):
+        """Test sampled invocations log completely and unsampled ones keep warnings."""
+        logger = Logger("test_logger")
+        logger.sample_rate = 0.5
+        trace_ids = [f"trace-{i}" for i in range(200)]
+        decisions = {}
+        for trace_id in trace_ids:
+            TraceId.set(trace_id)
+            decisions[trace_id] = logger._is_sampled()
+        sampled = [t for t, d in decisions.items() if d]
+        unsampled = [t for t, d in decisions.items() if not d]
+
+        assert 60 < len(sampled) < 140
+        with patch.object(logger.logger, 'log') as mock_log:
+            TraceId.set(sampled[0])
+            logger.info("kept")
+            logger.info("kept again")
+            TraceId.set(unsampled[0])
+            logger.info("dropped")
+            logger.warning("warning kept")
+            logger.error("error kept")
+        TraceId.set(None)
+
+        messages = [json.loads(call[0][1])["message"] for call in mock_log.call_args_list]
+        assert messages == ["kept", "kept again", "warning kept", "error kept"]
+
+    @patch.dict(os.environ, {'LOG_SAMPLE_RATE': '0.1', 'LOG_RATE_LIMIT_INFO': '5'})
+    def test_sampling_and_rate_limits_from_environment(self):
+        """Test sampling and per-level rate limits are read from the environment."""
+        logger = Logger("test_logger")
+
+        assert logger.sample_rate == 0.1
+        assert logger.rate_limits == {logging.INFO: 5.0}
+
+    def test_rate_limit_per_call_site(self):
+        """Test records from one call site are capped per second and errors are not."""
+        logger = Logger("test_logger")
+        logger.rate_limits = {logging.INFO: 2}
+
+        def process(i):
+            logger.info(f"contact {i}")
+            logger.error(f"failure {i}")
+
+        with patch('common.models.logger.time.monotonic', return_value=100.0), \
+                patch.object(logger.logger, 'log') as mock_log:
+            for i in range(5):
+                process(i)
+        messages = [json.loads(call[0][1])["message"] for call in mock_log.call_args_list]
+
+        assert [m for m in messages if m.startswith("contact")] == ["contact 0", "contact 1"]
+        assert len([m for m in messages if m.startswith("failure")]) == 5
+
+        with patch('common.models.logger.time.monotonic', return_value=101.5), \
+                patch.object(logger.logger, 'log') as mock_log:
+            process(5)
+
+        entry = json.loads(mock_log.call_args_list[0][0][1])
+        assert entry["message"] == "contact 5"
+        assert entry["suppressed_count"] == 3
+
+    def test_lazy_formatting_renders_args(self):
+        """Test %-style args and keyword fields are rendered into the record."""
+        logger = Logger("test_logger")
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            logger.info("Processing %s of %d", "contact-1", 3, request_type="Lookup")
+            logger.info("Event: %(id)s", {"id": "evt-1"})
+
+        first = json.loads(mock_log.call_args_list[0][0][1])
+        second = json.loads(mock_log.call_args_list[1][0][1])
+        assert first["message"] == "Processing contact-1 of 3"
+        assert first["request_type"] == "Lookup"
+        assert second["message"] == "Event: evt-1"
+
+    def test_lazy_formatting_skips_disabled_levels(self):
+        """Test args of a disabled level are never converted to strings."""
+        logger = Logger("test_logger")
+        payload = MagicMock()
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            logger.debug("Processing event: %s", payload, event=payload)
+
+        mock_log.assert_not_called()
+        payload.__str__.assert_not_called()
+
+    def test_lazy_formatting_error_falls_back(self):
+        """Test a template/args mismatch is reported instead of raising."""
+        logger = Logger("test_logger")
+
+        with patch.object(logger.logger, 'error') as mock_error:
+            logger.info("missing %s %s", "one")
+
+        entry = json.loads(mock_error.call_args[0][0])
+        assert entry["message"].startswith("Logging failed")
+
+    def test_raw_json_fields_are_not_serialized_again(self):
+        """Test RawJSON fields are embedded verbatim as JSON values."""
+        from common.models.json_encoder import RawJSON
+
+        logger = Logger("test_logger")
+
+        with patch.object(logger.logger, 'log') as mock_log:
+            logger.info("Strategy response", response=RawJSON('{"message": "ok", "data": [1, 2]}'))
+
+        line = mock_log.call_args[0][1]
+        entry = json.loads(line)
+        assert entry["message"] == "Strategy response"
+        assert entry["response"] == {"message": "ok", "data": [1, 2]}
+        assert line.endswith('"response":{"message": "ok", "data": [1, 2]}}')
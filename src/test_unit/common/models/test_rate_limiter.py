@@ -0,0 +1,85 @@
+"""
+Unit tests for rate_limiter module.
+"""
+import pytest
+from unittest.mock import patch
+from common.models.rate_limiter import TokenBucket, backoff_delay, parse_rate_limit
+
+
+class FakeClock:
+    """time.monotonic / time.sleep stand-in advancing only when slept."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch('common.models.rate_limiter.time', fake):
+        yield fake
+
+
+class TestTokenBucket:
+
+    def test_burst_then_rate(self, clock):
+        """Test the burst is free and later calls are spaced at the rate."""
+        bucket = TokenBucket(rate=2, burst=3)
+
+        waits = [bucket.acquire() for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(0.5)
+        assert waits[4] == pytest.approx(0.5)
+        assert clock.now == pytest.approx(1.0)
+
+    def test_tokens_refill_while_idle(self, clock):
+        """Test idle time refills the bucket up to the burst."""
+        bucket = TokenBucket(rate=2, burst=2)
+        bucket.acquire()
+        bucket.acquire()
+
+        clock.now += 10
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(0.5)
+
+    def test_throttled_halves_rate_and_success_recovers(self, clock):
+        """Test the adaptive rate drops on throttling and grows back on success."""
+        bucket = TokenBucket(rate=10, burst=10)
+
+        bucket.throttled()
+        assert bucket.rate == 5
+        for _ in range(10):
+            bucket.throttled()
+        assert bucket.rate == pytest.approx(1.0)
+
+        for _ in range(100):
+            bucket.succeeded()
+        assert bucket.rate == 10
+
+
+class TestRateLimitHelpers:
+
+    def test_parse_rate_limit(self):
+        """Test "tps" and "tps:burst" settings, falling back on invalid values."""
+        assert parse_rate_limit("10:15", (2, 5)) == (10.0, 15.0)
+        assert parse_rate_limit("4", (2, 5)) == (4.0, 4.0)
+        assert parse_rate_limit(None, (2, 5)) == (2, 5)
+        assert parse_rate_limit("fast", (2, 5)) == (2, 5)
+        assert parse_rate_limit("0:5", (2, 5)) == (2, 5)
+
+    def test_backoff_delay_is_jittered_and_capped(self):
+        """Test the delay stays within [0, min(max, base * 2**attempt)]."""
+        for attempt in range(10):
+            delay = backoff_delay(attempt, 0.2, 5.0)
+            assert 0 <= delay <= min(5.0, 0.2 * 2 ** attempt)
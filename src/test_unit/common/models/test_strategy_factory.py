@@ -37,7 +37,6 @@ class TestStrategyFactory:
         
         assert factory._validate_strategy() is False
     
-    @patch('common.models.strategy_factory.ALL_INVOCATION_TYPE_LIST', ['StatusCheckerConnect'])
     def test_validate_strategy_invalid_request_type(self):
         """Test validation with invalid request_type."""
         event = {"request_type": "InvalidRequestType"}
@@ -49,30 +48,41 @@ class TestStrategyFactory:
         
         assert factory._validate_strategy() is False
     
-    @patch('common.models.strategy_factory.globals')
-    def test_initiate_strategy_success(self, mock_globals):
+    def test_validate_strategy_scoped_to_invocation_source(self):
+        """Test a strategy registered for another source is rejected."""
+        factory = StrategyFactory.__new__(StrategyFactory)
+        factory.event = {"request_type": "StatusCheckerS3"}
+        factory.invoke_type = "AMAZON_CONNECT"
+        
+        assert factory._validate_strategy() is False
+    
+    @patch('common.models.strategy_factory.get_strategy')
+    def test_initiate_strategy_success(self, mock_get_strategy):
         """Test successful strategy initiation."""
         mock_strategy_class = MagicMock()
-        mock_globals.return_value.get.return_value = mock_strategy_class
+        mock_get_strategy.return_value = mock_strategy_class
         
         event = {"request_type": "StatusCheckerConnect"}
         
         factory = StrategyFactory.__new__(StrategyFactory)
         factory.event = event
+        factory.invoke_type = "AMAZON_CONNECT"
         
         factory._initiate_strategy()
         
         assert factory.strategy_class == mock_strategy_class
+        mock_get_strategy.assert_called_once_with("AMAZON_CONNECT", "StatusCheckerConnect")
     
-    @patch('common.models.strategy_factory.globals')
-    def test_initiate_strategy_class_not_found(self, mock_globals):
+    @patch('common.models.strategy_factory.get_strategy')
+    def test_initiate_strategy_class_not_found(self, mock_get_strategy):
         """Test strategy initiation when class not found."""
-        mock_globals.return_value.get.return_value = None
+        mock_get_strategy.return_value = None
         
         event = {"request_type": "NonExistentStrategy"}
         
         factory = StrategyFactory.__new__(StrategyFactory)
         factory.event = event
+        factory.invoke_type = "AMAZON_CONNECT"
         
         with pytest.raises(Exception, match="Failed to initiate strategy"):
             factory._initiate_strategy()
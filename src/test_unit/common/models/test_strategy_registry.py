@@ -0,0 +1,138 @@
+"""
+Unit tests for strategy_registry module.
+"""
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import common.models.strategy_registry as strategy_registry
+from common.models.default_strategy import DefaultStrategy
+from common.models.strategy_registry import (
+    INVOCATION_SOURCE_STRATEGIES,
+    get_strategy,
+    is_registered,
+    register_strategy,
+)
+
+
+class TestStrategyRegistry:
+
+    def teardown_method(self):
+        for key in [k for k in strategy_registry._STRATEGY_REGISTRY if k[0] == "TEST_SOURCE"]:
+            strategy_registry._STRATEGY_REGISTRY.pop(key)
+
+    def test_every_mapped_strategy_registers_for_its_source(self):
+        """Test each imports.py entry resolves to a class registered for that source."""
+        for invocation_source, strategies in INVOCATION_SOURCE_STRATEGIES.items():
+            for request_type in strategies:
+                strategy_class = get_strategy(invocation_source, request_type)
+                assert strategy_class is not None, (invocation_source, request_type)
+                assert strategy_class.__name__ == request_type
+                assert issubclass(strategy_class, DefaultStrategy)
+
+    def test_register_strategy_decorator(self):
+        """Test the decorator registers the class for every given source."""
+
+        @register_strategy("TEST_SOURCE")
+        class SampleStrategy(DefaultStrategy):
+            def do_validate(self):
+                return True, None
+
+            def do_operation(self):
+                return {}
+
+        assert strategy_registry._STRATEGY_REGISTRY[("TEST_SOURCE", "SampleStrategy")] is SampleStrategy
+
+    def test_register_strategy_requires_default_strategy(self):
+        """Test non-DefaultStrategy classes are rejected."""
+        with pytest.raises(TypeError):
+
+            @register_strategy("TEST_SOURCE")
+            class NotAStrategy:
+                pass
+
+    def test_register_strategy_requires_source(self):
+        """Test the decorator needs at least one invocation source."""
+        with pytest.raises(ValueError):
+            register_strategy()
+
+    def test_is_registered(self):
+        """Test registration is scoped to invocation sources."""
+        assert is_registered("AMAZON_CONNECT", "StatusCheckerConnect") is True
+        assert is_registered("S3", "StatusCheckerConnect") is False
+        assert is_registered("UNKNOWN_SOURCE", "StatusCheckerConnect") is False
+        assert is_registered("AMAZON_CONNECT", None) is False
+
+    def test_get_strategy_unknown_does_not_import(self):
+        """Test unknown request types fail fast without importing anything."""
+        with patch("common.models.strategy_registry.importlib.import_module") as mock_import:
+            assert get_strategy("AMAZON_CONNECT", "UnknownStrategy") is None
+            assert get_strategy("S3", "StatusCheckerConnect") is None
+            mock_import.assert_not_called()
+
+    def test_get_strategy_registered_class_skips_import(self):
+        """Test an already registered strategy is returned without importing."""
+        get_strategy("S3", "StatusCheckerS3")
+        with patch("common.models.strategy_registry.importlib.import_module") as mock_import:
+            assert get_strategy("S3", "StatusCheckerS3").__name__ == "StatusCheckerS3"
+            mock_import.assert_not_called()
+
+    def test_factory_import_does_not_load_strategy_modules(self):
+        """Test a fresh interpreter importing the factory loads no strategy module."""
+        src_path = os.path.dirname(os.path.dirname(strategy_registry.__file__))
+        src_path = os.path.dirname(src_path)
+        check = (
+            "import sys\n"
+            "import common.models.strategy_factory\n"
+            "from common.models.strategy_registry import INVOCATION_SOURCE_STRATEGIES\n"
+            "modules = {m for s in INVOCATION_SOURCE_STRATEGIES.values() for m in s.values()}\n"
+            "print(sorted(modules & set(sys.modules)))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", check],
+            cwd=src_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        assert output.strip().splitlines()[-1] == "[]"
+
+    def test_warm_state_built_once_per_class(self):
+        """Test warm_init runs on first use only and is kept per strategy class."""
+        calls = []
+
+        class WarmStrategy(DefaultStrategy):
+            @classmethod
+            def warm_init(cls):
+                calls.append(cls)
+                return {"client": object()}
+
+            def do_validate(self):
+                return True, None
+
+            def do_operation(self):
+                return self.warm_state()["client"]
+
+        class OtherWarmStrategy(WarmStrategy):
+            pass
+
+        first = WarmStrategy({}).do_operation()
+        assert WarmStrategy({}).do_operation() is first
+        assert OtherWarmStrategy({}).do_operation() is not first
+        assert calls == [WarmStrategy, OtherWarmStrategy]
+
+    def test_warm_state_defaults_to_empty(self):
+        """Test strategies without warm_init get an empty state."""
+
+        class PlainStrategy(DefaultStrategy):
+            def do_validate(self):
+                return True, None
+
+            def do_operation(self):
+                return {}
+
+        assert PlainStrategy.warm_state() == {}
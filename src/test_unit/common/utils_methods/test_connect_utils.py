@@ -25,11 +25,7 @@ class TestConnectUtils:
     def test_list_contact_flow_success(self, mock_connect_client):
         """Test successful contact flow listing."""
         mock_client = MagicMock()
-        mock_paginator = MagicMock()
-        mock_paginator.paginate.return_value = [
-            {"ContactFlowSummaryList": [{"Id": "cf1", "Name": "Flow1"}]}
-        ]
-        mock_client.get_paginator.return_value = mock_paginator
+        mock_client.list_contact_flows.return_value = {"ContactFlowSummaryList": [{"Id": "cf1", "Name": "Flow1"}]}
         mock_connect_client.return_value = mock_client
         
         utils = ConnectUtils("us-east-1", "instance-id")
@@ -41,11 +37,7 @@ class TestConnectUtils:
     def test_list_routing_profile_success(self, mock_connect_client):
         """Test successful routing profile listing."""
         mock_client = MagicMock()
-        mock_paginator = MagicMock()
-        mock_paginator.paginate.return_value = [
-            {"RoutingProfileSummaryList": [{"Id": "rp1", "Name": "Profile1"}]}
-        ]
-        mock_client.get_paginator.return_value = mock_paginator
+        mock_client.list_routing_profiles.return_value = {"RoutingProfileSummaryList": [{"Id": "rp1", "Name": "Profile1"}]}
         mock_connect_client.return_value = mock_client
         
         utils = ConnectUtils("us-east-1", "instance-id")
@@ -57,11 +49,7 @@ class TestConnectUtils:
     def test_list_queues_success(self, mock_connect_client):
         """Test successful queue listing."""
         mock_client = MagicMock()
-        mock_paginator = MagicMock()
-        mock_paginator.paginate.return_value = [
-            {"QueueSummaryList": [{"Id": "q1", "Name": "Queue1"}]}
-        ]
-        mock_client.get_paginator.return_value = mock_paginator
+        mock_client.list_queues.return_value = {"QueueSummaryList": [{"Id": "q1", "Name": "Queue1"}]}
         mock_connect_client.return_value = mock_client
         
         utils = ConnectUtils("us-east-1", "instance-id")
@@ -79,7 +67,7 @@ class TestConnectUtils:
         utils.stop_contact("contact-id")
         
         mock_client.stop_contact.assert_called_once_with(
-            instanceId="instance-id",
+            InstanceId="instance-id",
             ContactId="contact-id",
             DisconnectReason={'Code': 'OTHERS'}
         )
@@ -95,7 +83,7 @@ class TestConnectUtils:
         utils.tag_contact("contact-id", tags)
         
         mock_client.tag_contact.assert_called_once_with(
-            instanceId="instance-id",
+            InstanceId="instance-id",
             ContactId="contact-id",
             Tags=tags
         )
@@ -126,3 +114,360 @@ class TestConnectUtils:
         
         assert result == {"UserData": "data"}
         mock_client.get_current_user_data.assert_called_once()
+
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_iter_current_user_data_follows_next_token(self, mock_connect_client):
+        """Test users are streamed across pages until NextToken runs out."""
+        mock_client = MagicMock()
+        mock_client.get_current_user_data.side_effect = [
+            {"UserDataList": [{"User": {"Id": "u1"}}, {"User": {"Id": "u2"}}], "NextToken": "t1"},
+            {"UserDataList": [], "NextToken": "t2"},
+            {"UserDataList": [{"User": {"Id": "u3"}}]},
+        ]
+        mock_connect_client.return_value = mock_client
+
+        utils = ConnectUtils("us-east-1", "instance-id")
+        filters = {"RoutingProfiles": ["rp-arn"]}
+        users = utils.iter_current_user_data(filters, max_results=2)
+
+        assert next(users) == {"User": {"Id": "u1"}}
+        # pages are fetched lazily as the caller consumes users
+        assert mock_client.get_current_user_data.call_count == 1
+        assert [user["User"]["Id"] for user in users] == ["u2", "u3"]
+        calls = mock_client.get_current_user_data.call_args_list
+        assert [call.kwargs.get("NextToken") for call in calls] == [None, "t1", "t2"]
+        assert all(call.kwargs["MaxResults"] == 2 for call in calls)
+        assert all(call.kwargs["Filters"] == filters for call in calls)
+
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_iter_current_user_data_request_shape(self, mock_connect_client):
+        """Test the pager sends requests botocore accepts for GetCurrentUserData."""
+        import boto3
+        from botocore.stub import Stubber
+
+        client = boto3.client(
+            "connect",
+            region_name="us-east-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        mock_connect_client.return_value = client
+        filters = {
+            "RoutingProfiles": ["rp-arn"],
+            "ContactFilter": {"ContactStates": ["CONNECTED"]},
+        }
+
+        with Stubber(client) as stubber:
+            stubber.add_response(
+                "get_current_user_data",
+                {"UserDataList": [{"User": {"Id": "u1"}}], "NextToken": "t1"},
+                {"InstanceId": "instance-id", "Filters": filters, "MaxResults": 100},
+            )
+            stubber.add_response(
+                "get_current_user_data",
+                {"UserDataList": [{"User": {"Id": "u2"}}]},
+                {
+                    "InstanceId": "instance-id",
+                    "Filters": filters,
+                    "NextToken": "t1",
+                    "MaxResults": 100,
+                },
+            )
+            users = list(ConnectUtils("us-east-1", "instance-id").iter_current_user_data(filters))
+            stubber.assert_no_pending_responses()
+
+        assert [user["User"]["Id"] for user in users] == ["u1", "u2"]
+
+
+def _throttling_error(code="TooManyRequestsException"):
+    from botocore.exceptions import ClientError
+
+    return ClientError({"Error": {"Code": code, "Message": "Rate exceeded"}}, "DescribeContact")
+
+
+class TestConnectUtilsThrottling:
+
+    @patch('common.utils_methods.connect_utils.time.sleep')
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_throttled_call_is_retried_with_backoff(self, mock_connect_client, mock_sleep):
+        """Test throttling errors are retried and counted, then the call succeeds."""
+        from common.utils_methods.connect_utils import connect_api_metrics
+
+        mock_client = MagicMock()
+        mock_client.describe_contact.side_effect = [
+            _throttling_error(),
+            _throttling_error("ThrottlingException"),
+            {"Contact": {"Id": "contact-id"}},
+        ]
+        mock_connect_client.return_value = mock_client
+
+        result = ConnectUtils("us-east-1", "instance-id").describe_contact("contact-id")
+
+        assert result == {"Contact": {"Id": "contact-id"}}
+        assert mock_client.describe_contact.call_count == 3
+        assert mock_sleep.call_count == 2
+        metrics = connect_api_metrics()["describe_contact"]
+        assert metrics["calls"] == 3
+        assert metrics["throttled"] == 2
+
+    @patch.dict('os.environ', {'CONNECT_MAX_RETRIES': '1'})
+    @patch('common.utils_methods.connect_utils.time.sleep')
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_throttling_retries_are_bounded(self, mock_connect_client, mock_sleep):
+        """Test the throttling error is raised once CONNECT_MAX_RETRIES is used up."""
+        mock_client = MagicMock()
+        mock_client.stop_contact.side_effect = _throttling_error()
+        mock_connect_client.return_value = mock_client
+
+        with pytest.raises(Exception, match="Rate exceeded"):
+            ConnectUtils("us-east-1", "instance-id").stop_contact("contact-id")
+
+        assert mock_client.stop_contact.call_count == 2
+
+    @patch('common.utils_methods.connect_utils.time.sleep')
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_other_errors_are_not_retried(self, mock_connect_client, mock_sleep):
+        """Test non-throttling errors are raised on the first attempt."""
+        mock_client = MagicMock()
+        mock_client.describe_contact.side_effect = Exception("ResourceNotFound")
+        mock_connect_client.return_value = mock_client
+
+        with pytest.raises(Exception, match="ResourceNotFound"):
+            ConnectUtils("us-east-1", "instance-id").describe_contact("contact-id")
+
+        assert mock_client.describe_contact.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch.dict('os.environ', {'CONNECT_RATE_LIMIT_DESCRIBE_CONTACT': '10:15'})
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_rate_limit_per_operation_and_region(self, mock_connect_client):
+        """Test limiters are shared per (region, operation) and read their quota from the environment."""
+        from common.utils_methods.connect_utils import _limiter
+
+        first = ConnectUtils("us-east-1", "instance-1")
+        second = ConnectUtils("us-east-1", "instance-2")
+        first.describe_contact("contact-id")
+        second.describe_contact("contact-id")
+
+        limiter = _limiter("us-east-1", "describe_contact")
+        assert (limiter.rate, limiter.burst) == (10.0, 15.0)
+        stop_contact = _limiter("us-east-1", "stop_contact")
+        assert (stop_contact.rate, stop_contact.burst) == (5.0, 8.0)
+        assert _limiter("us-east-1", "list_queues").rate == 2.0
+        assert _limiter("us-east-1", "start_outbound_voice_contact").rate == 2.0
+        assert _limiter("eu-west-2", "describe_contact") is not limiter
+
+
+def _routing_profile_client(*pages):
+    """Client whose list_routing_profiles returns pages chained by NextToken."""
+    responses = {
+        (f"t{number}" if number else None): dict(
+            {"RoutingProfileSummaryList": [{"Id": rp_id, "Arn": f"arn/{rp_id}"} for rp_id in page]},
+            **({"NextToken": f"t{number + 1}"} if number + 1 < len(pages) else {}),
+        )
+        for number, page in enumerate(pages)
+    }
+    mock_client = MagicMock()
+    mock_client.list_routing_profiles.side_effect = lambda **kwargs: responses[kwargs.get("NextToken")]
+    return mock_client
+
+
+def _listing_calls(mock_client):
+    """Number of listings fetched: calls that asked for the first page."""
+    return sum(
+        1 for call in mock_client.list_routing_profiles.call_args_list if "NextToken" not in call.kwargs
+    )
+
+
+class TestConnectUtilsListingCache:
+
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_listing_is_cached_per_instance_until_ttl(self, mock_connect_client):
+        """Test listings are reused within the TTL, per instance, and paginated again after it."""
+        mock_client = _routing_profile_client(["rp1"], ["rp2"])
+        mock_connect_client.return_value = mock_client
+
+        with patch('common.utils_methods.connect_utils.time.time', return_value=1000.0):
+            first = ConnectUtils("us-east-1", "instance-id").list_routing_profile()
+            first.append({"Id": "caller-owned"})
+            first[0]["Id"] = "changed-by-caller"
+            second = ConnectUtils("us-east-1", "instance-id").list_routing_profile()
+            ConnectUtils("us-east-1", "other-instance").list_routing_profile()
+        assert [rp["Id"] for rp in second] == ["rp1", "rp2"]
+        assert _listing_calls(mock_client) == 2
+
+        with patch('common.utils_methods.connect_utils.time.time', return_value=1300.0):
+            ConnectUtils("us-east-1", "instance-id").list_routing_profile()
+        assert _listing_calls(mock_client) == 3
+
+    @patch.dict('os.environ', {'CONNECT_LISTING_CACHE_TTL': '0'})
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_zero_ttl_disables_cache(self, mock_connect_client):
+        """Test CONNECT_LISTING_CACHE_TTL=0 paginates on every call."""
+        mock_client = _routing_profile_client(["rp1"])
+        mock_connect_client.return_value = mock_client
+
+        utils = ConnectUtils("us-east-1", "instance-id")
+        utils.list_routing_profile()
+        utils.list_routing_profile()
+
+        assert _listing_calls(mock_client) == 2
+
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_invalidate_listings(self, mock_connect_client):
+        """Test invalidation drops only the requested operation of this instance."""
+        from common.utils_methods.connect_utils import _LISTINGS
+
+        mock_client = MagicMock()
+        mock_client.list_routing_profiles.return_value = {}
+        mock_client.list_queues.return_value = {}
+        mock_connect_client.return_value = mock_client
+
+        utils = ConnectUtils("us-east-1", "instance-id")
+        utils.list_routing_profile()
+        utils.list_queues()
+        ConnectUtils("us-east-1", "other-instance").list_queues()
+
+        utils.invalidate_listings("list_queues")
+
+        assert set(_LISTINGS) == {
+            ("us-east-1", "instance-id", "list_routing_profiles"),
+            ("us-east-1", "other-instance", "list_queues"),
+        }
+
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_snapshot_is_reused_by_a_new_process(self, mock_connect_client, tmp_path, monkeypatch):
+        """Test a fresh snapshot replaces pagination when the in-process cache is empty."""
+        from common.utils_methods.connect_utils import invalidate_listing_cache
+
+        monkeypatch.setenv("CONNECT_LISTING_SNAPSHOT", str(tmp_path))
+        mock_client = _routing_profile_client(["rp1"])
+        mock_connect_client.return_value = mock_client
+
+        ConnectUtils("us-east-1", "instance-id").list_routing_profile()
+        invalidate_listing_cache()  # as if a new container started
+        result = ConnectUtils("us-east-1", "instance-id").list_routing_profile()
+
+        assert result == [{"Id": "rp1", "Arn": "arn/rp1"}]
+        assert _listing_calls(mock_client) == 1
+
+        ConnectUtils("us-east-1", "instance-id").invalidate_listings()
+        assert list(tmp_path.iterdir()) == []
+        ConnectUtils("us-east-1", "instance-id").list_routing_profile()
+        assert _listing_calls(mock_client) == 2
+
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_snapshot_errors_fall_back_to_listing(self, mock_connect_client):
+        """Test an unavailable snapshot store never fails the listing."""
+        mock_connect_client.return_value = _routing_profile_client(["rp1"])
+
+        utils = ConnectUtils("us-east-1", "instance-id")
+        utils.snapshot_store = MagicMock()
+        utils.snapshot_store.get.side_effect = Exception("AccessDenied")
+        utils.snapshot_store.put.side_effect = Exception("AccessDenied")
+
+        assert [rp["Id"] for rp in utils.list_routing_profile()] == ["rp1"]
+
+
+class TestConnectUtilsRequestShape:
+
+    @staticmethod
+    def _client():
+        import boto3
+
+        return boto3.client(
+            "connect",
+            region_name="us-east-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_contact_calls_send_instance_id(self, mock_connect_client):
+        """Test rate limited contact calls send requests botocore accepts."""
+        from botocore.stub import Stubber
+
+        client = self._client()
+        mock_connect_client.return_value = client
+        utils = ConnectUtils("us-east-1", "instance-id")
+
+        with Stubber(client) as stubber:
+            stubber.add_response(
+                "describe_contact",
+                {"Contact": {"Id": "contact-id"}},
+                {"InstanceId": "instance-id", "ContactId": "contact-id"},
+            )
+            stubber.add_response(
+                "stop_contact",
+                {},
+                {
+                    "InstanceId": "instance-id",
+                    "ContactId": "contact-id",
+                    "DisconnectReason": {"Code": "OTHERS"},
+                },
+            )
+            stubber.add_response(
+                "tag_contact",
+                {},
+                {"InstanceId": "instance-id", "ContactId": "contact-id", "Tags": {"k": "v"}},
+            )
+            stubber.add_response(
+                "start_outbound_voice_contact",
+                {"ContactId": "new-contact"},
+                {
+                    "Name": "callback",
+                    "DestinationPhoneNumber": "+15555550100",
+                    "ContactFlowId": "flow-id",
+                    "InstanceId": "instance-id",
+                },
+            )
+            utils.describe_contact("contact-id")
+            utils.stop_contact("contact-id")
+            utils.tag_contact("contact-id", {"k": "v"})
+            utils.start_outbound_voice_contact("callback", "+15555550100", "flow-id")
+            stubber.assert_no_pending_responses()
+
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_listing_pages_follow_next_token(self, mock_connect_client):
+        """Test listings page with NextToken in requests botocore accepts."""
+        from botocore.stub import Stubber
+
+        client = self._client()
+        mock_connect_client.return_value = client
+
+        with Stubber(client) as stubber:
+            stubber.add_response(
+                "list_queues",
+                {"QueueSummaryList": [{"Id": "q1"}], "NextToken": "t1"},
+                {"InstanceId": "instance-id"},
+            )
+            stubber.add_response(
+                "list_queues",
+                {"QueueSummaryList": [{"Id": "q2"}]},
+                {"InstanceId": "instance-id", "NextToken": "t1"},
+            )
+            result = ConnectUtils("us-east-1", "instance-id").list_queues()
+            stubber.assert_no_pending_responses()
+
+        assert [queue["Id"] for queue in result] == ["q1", "q2"]
+
+    @patch('common.utils_methods.connect_utils.time.sleep')
+    @patch('common.utils_methods.connect_utils.connect_client')
+    def test_throttled_listing_page_is_retried(self, mock_connect_client, mock_sleep):
+        """Test a throttled page is retried with backoff and the listing resumes from it."""
+        mock_client = MagicMock()
+        mock_client.list_queues.side_effect = [
+            {"QueueSummaryList": [{"Id": "q1"}], "NextToken": "t1"},
+            _throttling_error(),
+            {"QueueSummaryList": [{"Id": "q2"}]},
+        ]
+        mock_connect_client.return_value = mock_client
+
+        result = ConnectUtils("us-east-1", "instance-id").list_queues()
+
+        assert [queue["Id"] for queue in result] == ["q1", "q2"]
+        assert mock_client.list_queues.call_args_list[2].kwargs == {
+            "InstanceId": "instance-id",
+            "NextToken": "t1",
+        }
+        mock_sleep.assert_called_once()
@@ -4,7 +4,7 @@ Unit tests for dynamodb_utils module.
 
 import pytest
 from unittest.mock import patch, MagicMock
-from common.utils_methods.dynamodb_utils_resource import DynamoDBUtilsResource
+from common.utils_methods.dynamodb_utils_resource import DynamoDBUtilsResource, table_utils
 
 
 class TestDynamoDBUtils:
@@ -143,3 +143,20 @@ class TestDynamoDBUtils:
         utils.put_item(item)
 
         mock_table.put_item.assert_called_once_with(Item=item)
+
+    @patch("common.utils_methods.dynamodb_utils_resource.dynamoDB_resource")
+    def test_table_utils_shared_per_region_and_table(self, mock_dynamodb_resource):
+        """Test table utilities are built once per (region, table) and shared by strategies."""
+        from workflow.amazon_connect.dynamodb_lookup import DynamodbLookup
+        from workflow.amazon_connect.dynamodb_store_attributes import DynamoDBStoreAttributes
+
+        with patch("workflow.amazon_connect.dynamodb_lookup.REGION", "us-east-1"), patch(
+            "workflow.amazon_connect.dynamodb_store_attributes.REGION", "us-east-1"
+        ):
+            lookup = DynamodbLookup({"TABLE_NAME": "test-table"})
+            store = DynamoDBStoreAttributes({"TABLE_NAME": "test-table"})
+
+        assert lookup.DynamoDB_Utils_Resource is store.dynamodb_resource
+        assert table_utils("us-east-1", "test-table") is store.dynamodb_resource
+        assert table_utils("eu-west-2", "test-table") is not store.dynamodb_resource
+        assert mock_dynamodb_resource.call_count == 2
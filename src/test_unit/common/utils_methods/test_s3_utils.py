@@ -3,7 +3,8 @@ Unit tests for s3_utils module.
 """
 import pytest
 from unittest.mock import patch, MagicMock
-from common.utils_methods.s3_utils import S3Utils
+import json
+from common.utils_methods.s3_utils import S3Utils, iter_event_objects
 
 
 class TestS3Utils:
@@ -123,4 +124,51 @@ class TestS3Utils:
             ClientMethod='get_object',
             Params={'Bucket': 'test-bucket', 'Key': 'test-key'},
             ExpiresIn=7200
-        )
\ No newline at end of file
+        )
+
+class TestIterEventObjects:
+
+    def test_s3_records_are_decoded_and_deduplicated(self):
+        """Test every record is read once with URL-decoded keys."""
+        event = {
+            "Records": [
+                {"s3": {"bucket": {"name": "b"}, "object": {"key": "a%2Fx+y.wav"}}},
+                {"s3": {"bucket": {"name": "b"}, "object": {"key": "a%2Fx+y.wav"}}},
+                {"s3": {"bucket": {"name": "b"}, "object": {"key": "a%2Fx+y.wav", "versionId": "2"}}},
+            ]
+        }
+
+        assert list(iter_event_objects(event)) == [
+            {"bucket": "b", "key": "a/x y.wav", "version_id": None},
+            {"bucket": "b", "key": "a/x y.wav", "version_id": "2"},
+        ]
+
+    def test_sqs_sns_and_eventbridge_envelopes(self):
+        """Test S3 events delivered through SQS, SNS and EventBridge."""
+        s3_event = {"Records": [{"s3": {"bucket": {"name": "b"}, "object": {"key": "k"}}}]}
+        sqs_event = {
+            "Records": [
+                {"body": json.dumps(s3_event)},
+                {"body": json.dumps({"Message": json.dumps(s3_event)})},
+                {"body": "not json"},
+            ]
+        }
+        eventbridge_event = {
+            "detail-type": "Object Created",
+            "detail": {"bucket": {"name": "b"}, "object": {"key": "k", "version-id": "1"}},
+        }
+
+        assert list(iter_event_objects(sqs_event)) == [{"bucket": "b", "key": "k", "version_id": None}]
+        assert list(iter_event_objects(eventbridge_event)) == [{"bucket": "b", "key": "k", "version_id": "1"}]
+
+    def test_sanitized_view_envelopes(self):
+        """Test the lazy sanitized event the handler passes is read like a dict."""
+        from common.models.event_sanitizer import EventSanitizer
+
+        eventbridge_event = {
+            "detail-type": "Object Created",
+            "detail": {"bucket": {"name": "b"}, "object": {"key": "k"}},
+        }
+        view = EventSanitizer(eventbridge_event, lazy=True).get_sanitized_data()
+
+        assert list(iter_event_objects(view)) == [{"bucket": "b", "key": "k", "version_id": None}]
@@ -0,0 +1,72 @@
+"""
+Unit tests for snapshot_store module.
+"""
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch, MagicMock
+
+from common.utils_methods.snapshot_store import (
+    DynamoDBSnapshotStore,
+    FileSnapshotStore,
+    snapshot_store,
+)
+
+
+class TestFileSnapshotStore:
+
+    def test_put_get_delete(self, tmp_path):
+        """Test values round-trip as JSON and delete is idempotent."""
+        store = FileSnapshotStore(str(tmp_path / "snapshots"))
+        key = "connect-listing#us-east-1#arn:aws:connect:instance/abc#list_queues"
+
+        assert store.get(key) is None
+        store.put(key, {"items": [1, 2], "at": datetime(2024, 1, 1, tzinfo=timezone.utc)})
+
+        assert store.get(key) == {"items": [1, 2], "at": "2024-01-01T00:00:00+00:00"}
+        assert len(list((tmp_path / "snapshots").iterdir())) == 1
+
+        store.delete(key)
+        store.delete(key)
+        assert store.get(key) is None
+
+
+class TestDynamoDBSnapshotStore:
+
+    @patch('common.utils_methods.snapshot_store.dynamoDB_resource')
+    def test_put_get_delete(self, mock_resource):
+        """Test values are stored as a JSON payload under the partition key."""
+        table = MagicMock()
+        mock_resource.return_value.Table.return_value = table
+        store = DynamoDBSnapshotStore("us-east-1", "snapshots")
+
+        store.put("key-1", {"items": [1]})
+        item = table.put_item.call_args.kwargs["Item"]
+        assert item["pk"] == "key-1"
+        assert json.loads(item["payload"]) == {"items": [1]}
+
+        table.get_item.return_value = {"Item": item}
+        assert store.get("key-1") == {"items": [1]}
+        table.get_item.assert_called_with(Key={"pk": "key-1"}, ConsistentRead=True)
+
+        table.get_item.return_value = {}
+        assert store.get("key-2") is None
+
+        store.delete("key-1")
+        table.delete_item.assert_called_once_with(Key={"pk": "key-1"})
+        mock_resource.return_value.Table.assert_called_once_with("snapshots")
+
+
+class TestSnapshotStoreFactory:
+
+    @patch('common.utils_methods.snapshot_store.dynamoDB_resource')
+    def test_locations(self, mock_resource):
+        """Test the location setting selects the store."""
+        assert snapshot_store(None, "us-east-1") is None
+        assert snapshot_store("  ", "us-east-1") is None
+        assert snapshot_store("/tmp/snapshots", "us-east-1").directory == "/tmp/snapshots"
+        assert snapshot_store("file:///tmp/snapshots", "us-east-1").directory == "/tmp/snapshots"
+
+        store = snapshot_store("dynamodb://snapshots", "eu-west-2")
+        assert isinstance(store, DynamoDBSnapshotStore)
+        assert store.table_name == "snapshots"
+        mock_resource.assert_called_once_with("eu-west-2")
@@ -35,7 +35,7 @@ class TestTranscribeUtils:
         result = utils.check_transcription_status("test-job")
         
         assert result == "COMPLETED"
-        mock_client.get_transcription_job.assert_called_once_with("test-job")
+        mock_client.get_transcription_job.assert_called_once_with(TranscriptionJobName="test-job")
     
     @patch('common.utils_methods.transcribe_utils.transcribe_client')
     def test_check_transcription_status_failed(self, mock_transcribe_client):
@@ -52,7 +52,7 @@ class TestTranscribeUtils:
         result = utils.check_transcription_status("test-job")
         
         assert result == "FAILED"
-        mock_client.get_transcription_job.assert_called_once_with("test-job")
+        mock_client.get_transcription_job.assert_called_once_with(TranscriptionJobName="test-job")
     
     @patch('common.utils_methods.transcribe_utils.transcribe_client')
     def test_check_transcription_status_unknown(self, mock_transcribe_client):
@@ -69,7 +69,7 @@ class TestTranscribeUtils:
         result = utils.check_transcription_status("test-job")
         
         assert result == "UNKNOWN"
-        mock_client.get_transcription_job.assert_called_once_with("test-job")
+        mock_client.get_transcription_job.assert_called_once_with(TranscriptionJobName="test-job")
     
     @patch('common.utils_methods.transcribe_utils.transcribe_client')
     def test_check_transcription_status_error(self, mock_transcribe_client):
@@ -80,4 +80,37 @@ class TestTranscribeUtils:
         
         utils = TranscribeUtils('us-east-1')
         with pytest.raises(Exception, match="Test error"):
-            utils.check_transcription_status("test-job")
\ No newline at end of file
+            utils.check_transcription_status("test-job")
+
+    @patch('common.utils_methods.transcribe_utils.transcribe_client')
+    def test_start_transcription_job_redacts_pii(self, mock_transcribe_client):
+        """Test the job is started with PII redaction in a request botocore accepts."""
+        import boto3
+        from botocore.stub import Stubber
+
+        client = boto3.client(
+            "transcribe",
+            region_name="us-east-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        mock_transcribe_client.return_value = client
+
+        with Stubber(client) as stubber:
+            stubber.add_response(
+                "start_transcription_job",
+                {"TranscriptionJob": {"TranscriptionJobStatus": "IN_PROGRESS"}},
+                {
+                    "TranscriptionJobName": "job-1",
+                    "Media": {"MediaFileUri": "s3://bucket/call.wav"},
+                    "LanguageCode": "en-US",
+                    "OutputBucketName": "redacted-bucket",
+                    "ContentRedaction": {"RedactionType": "PII", "RedactionOutput": "redacted"},
+                },
+            )
+            result = TranscribeUtils('us-east-1').start_transcription_job(
+                "job-1", "s3://bucket/call.wav", "redacted-bucket"
+            )
+            stubber.assert_no_pending_responses()
+
+        assert result["TranscriptionJob"]["TranscriptionJobStatus"] == "IN_PROGRESS"
@@ -10,6 +10,38 @@ import pytest
 src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, src_path)
 
+from common.client_record.client_registry import reset_clients  # noqa: E402
+from common.models.default_strategy import reset_warm_state  # noqa: E402
+from common.models.invocation_deadline import InvocationDeadline  # noqa: E402
+from common.utils_methods.connect_utils import (  # noqa: E402
+    invalidate_listing_cache,
+    reset_connect_api_metrics,
+    reset_rate_limiters,
+)
+from common.utils_methods.dynamodb_utils_resource import reset_table_utils  # noqa: E402
+
+
+def _reset_process_state():
+    reset_clients()
+    reset_warm_state()
+    reset_table_utils()
+    reset_rate_limiters()
+    reset_connect_api_metrics()
+    invalidate_listing_cache()
+    InvocationDeadline.set(None)
+
+
+@pytest.fixture(autouse=True)
+def reset_process_state():
+    """
+    Drop state kept across warm invocations between tests: boto3 clients,
+    strategy warm state, DynamoDB table utilities, Connect rate limiters and
+    listings, and the invocation deadline.
+    """
+    _reset_process_state()
+    yield
+    _reset_process_state()
+
 @pytest.fixture
 def mock_env_vars(monkeypatch):
     """Fixture to mock AWS environment variables."""
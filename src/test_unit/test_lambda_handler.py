@@ -1,6 +1,7 @@
 """
 Unit tests for lambda_handler module.
 """
+import json
 import pytest
 from unittest.mock import patch, MagicMock
 from lambda_handler import lambda_handler
@@ -106,4 +107,241 @@ class TestLambdaHandler:
         
         assert isinstance(result, dict)
         assert result["statusCode"] == 400
-        assert result["result"] == "error"
\ No newline at end of file
+        assert result["result"] == "error"
+
+    @patch('lambda_handler.LOGGER')
+    @patch('lambda_handler.TraceId')
+    def test_lambda_handler_flushes_logger(self, mock_trace_id, mock_logger, mock_context, sample_event):
+        """Test buffered log records are flushed at the end of every invocation."""
+        mock_trace_id.init.side_effect = Exception("Trace ID error")
+        
+        result = lambda_handler(sample_event, mock_context)
+        
+        assert result["statusCode"] == 400
+        mock_logger.flush.assert_called_once()
+
+    @patch('lambda_handler.LOGGER')
+    def test_lambda_handler_sets_trace_id_before_logging(self, mock_logger, mock_context, sample_event):
+        """Test the first log record already sees this invocation's trace id."""
+        from common.models.trace_id import TraceId
+
+        trace_ids = []
+        mock_logger.info.side_effect = lambda *args, **kwargs: trace_ids.append(TraceId.get())
+        TraceId.set("previous-invocation")
+
+        lambda_handler(sample_event, mock_context)
+
+        assert trace_ids[0] == mock_context.aws_request_id
+
+    @patch('lambda_handler.StrategyFactory')
+    @patch('lambda_handler.TraceId')
+    def test_lambda_handler_logs_event_summary(self, mock_trace_id, mock_strategy_factory, mock_context):
+        """Test only the read keys of the lazy event are sanitized for logging at INFO."""
+        from lambda_handler import LOGGER
+
+        mock_strategy_factory.return_value.execute.return_value = {}
+        event = {"request_type": "StatusCheckerConnect", "data": {"password": "secret"}}
+
+        with patch.object(LOGGER, "debug") as mock_debug:
+            lambda_handler(event, mock_context)
+
+        view = mock_strategy_factory.call_args.args[0]
+        assert list(view._cache) == ["request_type"]
+        assert LOGGER._metadata["request_type"] == "StatusCheckerConnect"
+        assert "event" not in LOGGER._metadata
+        mock_debug.assert_not_called()
+
+    @patch('lambda_handler.TraceId')
+    def test_lambda_handler_sqs_batch(self, mock_trace_id, mock_context):
+        """Test SQS batches run per message and return only the failed message ids."""
+        event = {
+            "Records": [
+                {"messageId": "m1", "eventSource": "aws:sqs", "body": '{"request_type": "StatusCheckerSQS"}'},
+                {"messageId": "m2", "eventSource": "aws:sqs", "body": '{"request_type": "Unknown"}'},
+                {"messageId": "m3", "eventSource": "aws:sqs", "body": "not json"},
+            ]
+        }
+        
+        result = lambda_handler(event, mock_context)
+        
+        assert result == {
+            "batchItemFailures": [{"itemIdentifier": "m2"}, {"itemIdentifier": "m3"}]
+        }
+
+    @patch('lambda_handler.TraceId')
+    def test_lambda_handler_sqs_runs_strategy(self, mock_trace_id, mock_context):
+        """Test SQS messages run the direct invoke strategies."""
+        event = {
+            "Records": [
+                {"messageId": "m1", "eventSource": "aws:sqs",
+                 "body": '{"request_type": "PhoneNumberFormat", "phone_number": "14155552671"}'},
+                {"messageId": "m2", "eventSource": "aws:sqs",
+                 "body": '{"request_type": "PhoneNumberFormat"}'},
+            ]
+        }
+
+        result = lambda_handler(event, mock_context)
+
+        assert result == {"batchItemFailures": [{"itemIdentifier": "m2"}]}
+
+    @patch('lambda_handler.TraceId')
+    def test_lambda_handler_direct_invoke_batch(self, mock_trace_id, mock_context):
+        """Test a direct invoke batch runs every item and returns per-item results."""
+        event = {
+            "batch": [
+                {"request_type": "PhoneNumberFormat", "phone_number": "14155552671"},
+                {"request_type": "PhoneNumberFormat"},
+                {"request_type": "StatusCheckerConnect"},
+            ]
+        }
+        
+        result = lambda_handler(event, mock_context)
+        
+        assert result["statusCode"] == 200
+        results = json.loads(result["body"])["data"]["results"]
+        assert [r["item"] for r in results] == [0, 1, 2]
+        assert [r["result"] for r in results] == ["success", "error", "error"]
+        assert results[0]["data"]["validationResult"] == "Valid"
+
+    @patch('lambda_handler.TraceId')
+    def test_lambda_handler_kinesis_checkpoint(self, mock_trace_id, mock_context):
+        """Test a failed Kinesis record reports its sequence number and every later one."""
+        import base64
+
+        def record(sequence_number, payload):
+            data = base64.b64encode(json.dumps(payload).encode()).decode()
+            return {"eventSource": "aws:kinesis",
+                    "kinesis": {"sequenceNumber": sequence_number, "data": data}}
+
+        event = {
+            "Records": [
+                record("1", {"request_type": "StatusCheckerKinesis"}),
+                record("2", {"request_type": "Unknown"}),
+                record("3", {"request_type": "StatusCheckerKinesis"}),
+            ]
+        }
+        
+        result = lambda_handler(event, mock_context)
+        
+        assert result == {
+            "batchItemFailures": [{"itemIdentifier": "2"}, {"itemIdentifier": "3"}]
+        }
+
+    @patch('lambda_handler.TraceId')
+    def test_lambda_handler_dynamodb_streams(self, mock_trace_id, mock_context):
+        """Test DynamoDB Streams records run through their strategy."""
+        event = {
+            "Records": [
+                {"eventSource": "aws:dynamodb", "dynamodb": {
+                    "SequenceNumber": "100",
+                    "NewImage": {"request_type": {"S": "StatusCheckerDynamoDBStreams"}, "Id": {"N": "1"}}}},
+            ]
+        }
+        
+        assert lambda_handler(event, mock_context) == {"batchItemFailures": []}
+
+    @staticmethod
+    def _contact_trace_record_event():
+        """Kinesis event carrying a real Amazon Connect contact trace record."""
+        import base64
+        import os
+
+        path = os.path.join(
+            os.path.dirname(__file__), "..", "test_data", "kinesis", "contact_trace_record.json"
+        )
+        with open(path, "rb") as ctr_file:
+            data = base64.b64encode(ctr_file.read()).decode()
+        return {
+            "Records": [
+                {"eventSource": "aws:kinesis", "kinesis": {"sequenceNumber": "1", "data": data}},
+            ]
+        }
+
+    @patch.dict('os.environ', {'STREAM_REQUEST_TYPE': 'StatusCheckerKinesis'})
+    @patch('lambda_handler.TraceId')
+    def test_lambda_handler_kinesis_contact_trace_record(self, mock_trace_id, mock_context):
+        """Test a Connect CTR stream runs a strategy that accepts the record as is."""
+        from workflow.kinesis.status_checker_kinesis import StatusCheckerKinesis
+
+        with patch.object(
+            StatusCheckerKinesis, "do_operation", autospec=True, side_effect=lambda self: dict(self.event)
+        ) as mock_operation:
+            result = lambda_handler(self._contact_trace_record_event(), mock_context)
+
+        assert result == {"batchItemFailures": []}
+        record = mock_operation.call_args.args[0].event
+        assert record["ContactId"] == "aaaaaaaa-bbbb-cccc-dddd-444444444444"
+        assert record["request_type"] == "StatusCheckerKinesis"
+
+    @patch.dict('os.environ', {'STREAM_REQUEST_TYPE': 'DynamoDBStoreAttributes'})
+    @patch('lambda_handler.TraceId')
+    def test_lambda_handler_kinesis_contact_trace_record_not_store_input(self, mock_trace_id, mock_context):
+        """Test a CTR is not DynamoDBStoreAttributes input: the record fails and is reported."""
+        result = lambda_handler(self._contact_trace_record_event(), mock_context)
+
+        assert result == {"batchItemFailures": [{"itemIdentifier": "1"}]}
+
+    @patch('lambda_handler.TraceId')
+    def test_lambda_handler_dynamodb_streams_skips_remove(self, mock_trace_id, mock_context):
+        """Test REMOVE records are skipped instead of running the strategy on the old image."""
+        from workflow.dynamodb_streams.status_checker_dynamodb_streams import StatusCheckerDynamoDBStreams
+
+        event = {
+            "Records": [
+                {"eventSource": "aws:dynamodb", "eventName": "REMOVE", "dynamodb": {
+                    "SequenceNumber": "100",
+                    "OldImage": {"request_type": {"S": "StatusCheckerDynamoDBStreams"}}}},
+                {"eventSource": "aws:dynamodb", "eventName": "MODIFY", "dynamodb": {
+                    "SequenceNumber": "200",
+                    "NewImage": {"request_type": {"S": "StatusCheckerDynamoDBStreams"}}}},
+            ]
+        }
+
+        with patch.object(StatusCheckerDynamoDBStreams, "do_operation", autospec=True, return_value={}) as mock_op:
+            assert lambda_handler(event, mock_context) == {"batchItemFailures": []}
+
+        assert [call.args[0].event["eventName"] for call in mock_op.call_args_list] == ["MODIFY"]
+
+    @patch.dict('os.environ', {'STREAM_REQUEST_TYPE': 'DynamoDBStoreAttributes'})
+    @patch('common.utils_methods.dynamodb_utils_resource.dynamoDB_resource')
+    @patch('lambda_handler.TraceId')
+    def test_lambda_handler_streams_store_attributes(self, mock_trace_id, mock_resource, mock_context):
+        """Test Kinesis and DynamoDB Streams records run DynamoDBStoreAttributes end to end."""
+        import base64
+
+        table = mock_resource.return_value.Table.return_value
+        payload = {
+            "TABLE_NAME": "contacts",
+            "KEY_NAME": "pk",
+            "KEY_VALUE": "contact-1",
+            "detail": {"contactData": {"status": "CONNECTED", "direction": "INBOUND"}},
+        }
+        kinesis_event = {
+            "Records": [
+                {"eventSource": "aws:kinesis", "kinesis": {
+                    "sequenceNumber": "1",
+                    "data": base64.b64encode(json.dumps(payload).encode()).decode()}},
+            ]
+        }
+        streams_event = {
+            "Records": [
+                {"eventSource": "aws:dynamodb", "dynamodb": {
+                    "SequenceNumber": "100",
+                    "NewImage": {
+                        "TABLE_NAME": {"S": "contacts"},
+                        "KEY_NAME": {"S": "pk"},
+                        "KEY_VALUE": {"S": "contact-2"},
+                        "detail": {"M": {"contactData": {"M": {"status": {"S": "ENDED"}}}}},
+                    }}},
+            ]
+        }
+
+        assert lambda_handler(kinesis_event, mock_context) == {"batchItemFailures": []}
+        assert lambda_handler(streams_event, mock_context) == {"batchItemFailures": []}
+
+        stored = [call.kwargs["Item"] for call in table.put_item.call_args_list]
+        assert [(item["pk"], item["status"]) for item in stored] == [
+            ("contact-1", "CONNECTED"),
+            ("contact-2", "ENDED"),
+        ]
+        assert stored[0]["direction"] == "INBOUND"
@@ -3,8 +3,9 @@ Unit tests for auto_clean_up_active_contacts module.
 """
 import pytest
 from unittest.mock import patch, MagicMock, Mock
-from datetime import datetime, timezone
-from workflow.amazon_connect.auto_clean_up_active_contacts import AutoCleanUpActiveContacts
+import json
+from datetime import datetime, timedelta, timezone
+from workflow.amazon_connect.auto_clean_up_active_contacts import AutoCleanUpActiveContacts, LOGGER
 
 
 class TestAutoCleanUpActiveContacts:
@@ -65,17 +66,11 @@ class TestAutoCleanUpActiveContacts:
         event = {"test": "data"}
         instance = AutoCleanUpActiveContacts(event)
         
-        # Mock paginator
-        mock_paginator = MagicMock()
-        mock_paginator.paginate.return_value = [
-            {
-                "RoutingProfileSummaryList": [
-                    {"Arn": "arn:aws:connect:us-east-1:123456789012:instance/test/routing-profile/rp1"},
-                    {"Arn": "arn:aws:connect:us-east-1:123456789012:instance/test/routing-profile/rp2"}
-                ]
-            }
+        # Mock the (cached) routing profile listing
+        instance.connect_utils.list_routing_profile.return_value = [
+            {"Arn": "arn:aws:connect:us-east-1:123456789012:instance/test/routing-profile/rp1"},
+            {"Arn": "arn:aws:connect:us-east-1:123456789012:instance/test/routing-profile/rp2"}
         ]
-        instance.connect_utils._get_paginator.return_value = mock_paginator
         
         result = instance._routing_profile_arn()
         
@@ -90,9 +85,8 @@ class TestAutoCleanUpActiveContacts:
         event = {"test": "data"}
         instance = AutoCleanUpActiveContacts(event)
         
-        # Mock get_current_user_data response
-        mock_response = {
-            "UserDataList": [
+        # Mock the streamed get_current_user_data users
+        mock_users = [
                 {
                     "Contacts": [
                         {
@@ -102,15 +96,14 @@ class TestAutoCleanUpActiveContacts:
                         }
                     ]
                 }
-            ]
-        }
-        instance.connect_utils.get_current_user_data.return_value = mock_response
+        ]
+        instance.connect_utils.iter_current_user_data.return_value = iter(mock_users)
         
         routing_profile_arns = ["arn:aws:connect:us-east-1:123456789012:instance/test/routing-profile/rp1"]
         result = instance._active_contact_ids(routing_profile_arns)
         
         assert len(result) >= 0  # May be 0 or 1 depending on time threshold
-        instance.connect_utils.get_current_user_data.assert_called_once()
+        instance.connect_utils.iter_current_user_data.assert_called_once()
     
     @patch.dict('os.environ', {'INSTANCE_ID': 'test-instance-id', 'REGION': 'us-east-1'})
     @patch('workflow.amazon_connect.auto_clean_up_active_contacts.ConnectUtils')
@@ -206,3 +199,214 @@ class TestAutoCleanUpActiveContacts:
         assert result["status"] == "Success"
         assert result["summary"]["total_contacts_processed"] == 1
         assert result["summary"]["disconnected"] == 1
+    
+    @patch.dict('os.environ', {'INSTANCE_ID': 'test-instance-id', 'REGION': 'us-east-1'})
+    @patch('workflow.amazon_connect.auto_clean_up_active_contacts.ConnectUtils')
+    def test_active_contact_ids_tempdata_emits_no_extra_lines(self, mock_connect_utils):
+        """Test tempdata rides on the next record instead of adding ERROR lines."""
+        instance = AutoCleanUpActiveContacts({"test": "data"})
+        instance.connect_utils.iter_current_user_data.return_value = iter([
+            {
+                "Contacts": [
+                    {
+                        "ContactId": "contact-1",
+                        "AgentContactState": "CONNECTED",
+                        "ConnectedToAgentTimestamp": (
+                            datetime.now(timezone.utc) - timedelta(hours=3)
+                        ).isoformat(),
+                    }
+                ]
+            }
+        ])
+        
+        with patch.object(LOGGER.logger, 'log') as mock_log:
+            result = instance._active_contact_ids(["rp-arn-1"])
+        
+        entries = [json.loads(call[0][1]) for call in mock_log.call_args_list]
+        assert result == ["contact-1"]
+        # 3 info lines; previously each add_tempdata call added an ERROR line
+        assert len(entries) == 3
+        assert all(entry["level"] == "INFO" for entry in entries)
+        assert entries[-1]["users_checked"] == 1
+        assert entries[-1]["contacts_checked"] == 1
+        assert entries[-1]["active_contact_ids"] == ["contact-1"]
+
+    @patch.dict('os.environ', {'INSTANCE_ID': 'test-instance-id', 'REGION': 'us-east-1', 'CLEANUP_MAX_WORKERS': '4'})
+    @patch('workflow.amazon_connect.auto_clean_up_active_contacts.ConnectUtils')
+    def test_do_operation_concurrent_keeps_summary(self, mock_connect_utils):
+        """Test contacts run on the worker pool with the same per-status counts and order."""
+        import threading
+
+        instance = AutoCleanUpActiveContacts({"test": "data"})
+        instance._routing_profile_arn = MagicMock(return_value=["rp-arn-1"])
+        contact_ids = [f"contact-{i}" for i in range(12)]
+        instance._active_contact_ids = MagicMock(return_value=contact_ids)
+        threads = set()
+
+        def process(contact_id):
+            threads.add(threading.get_ident())
+            i = int(contact_id.split("-")[1])
+            if i % 4 == 0:
+                raise Exception("describe failed")
+            if i % 4 == 1:
+                return None
+            status = "Disconnected" if i % 4 == 2 else "Already_Disconnected"
+            return {"status": status, "LastUpdateTimestamp": "ts", "contact_id": contact_id}
+
+        instance._process_contact_validation_and_disconnect = process
+
+        result = instance.do_operation()
+
+        assert instance.max_workers == 4
+        assert threading.get_ident() not in threads
+        assert result["summary"] == {
+            "total_contacts_processed": 12,
+            "disconnected": 3,
+            "in_progress": 0,
+            "already_disconnected": 3,
+            "failed": 6,
+        }
+        assert [c["contact_id"] for c in result["contact_details"]] == [
+            "contact-2", "contact-3", "contact-6", "contact-7", "contact-10", "contact-11"
+        ]
+
+    @patch.dict('os.environ', {'INSTANCE_ID': 'test-instance-id', 'REGION': 'us-east-1', 'CLEANUP_MAX_WORKERS': 'invalid'})
+    @patch('workflow.amazon_connect.auto_clean_up_active_contacts.ConnectUtils')
+    def test_max_workers_invalid_falls_back(self, mock_connect_utils):
+        """Test an invalid CLEANUP_MAX_WORKERS uses the default."""
+        instance = AutoCleanUpActiveContacts({"test": "data"})
+
+        assert instance.max_workers == 4
+
+
+def _disconnected(contact_id):
+    return {"status": "Disconnected", "LastUpdateTimestamp": "ts", "contact_id": contact_id}
+
+
+class TestAutoCleanUpCheckpoint:
+
+    @patch('workflow.amazon_connect.auto_clean_up_active_contacts.ConnectUtils')
+    def test_pauses_between_batches_and_resumes(self, mock_connect_utils, tmp_path, monkeypatch):
+        """Test running out of time saves the remaining batches and the next run resumes from them."""
+        monkeypatch.setenv("INSTANCE_ID", "test-instance-id")
+        monkeypatch.setenv("REGION", "us-east-1")
+        monkeypatch.setenv("CLEANUP_CHECKPOINT_STORE", str(tmp_path))
+        monkeypatch.setattr(
+            "workflow.amazon_connect.auto_clean_up_active_contacts.RP_ARN_LIMITS", 2
+        )
+
+        first = AutoCleanUpActiveContacts({"test": "data"})
+        first._routing_profile_arn = MagicMock(return_value=["rp1", "rp2", "rp3", "rp4", "rp5"])
+        first._active_contact_ids = MagicMock(return_value=["contact-1"])
+        first._process_contact_validation_and_disconnect = MagicMock()
+        # time for the first routing profile batch only
+        first._out_of_time = MagicMock(side_effect=[False, True])
+
+        paused = first.do_operation()
+
+        assert paused["checkpoint"] == {"saved": True, "routing_profile_batches": 2, "contact_ids": 1}
+        assert paused["summary"]["total_contacts_processed"] == 0
+        first._process_contact_validation_and_disconnect.assert_not_called()
+
+        second = AutoCleanUpActiveContacts({"test": "data"})
+        second._routing_profile_arn = MagicMock()
+        second._active_contact_ids = MagicMock(side_effect=[["contact-2"], []])
+        second._process_contact_validation_and_disconnect = MagicMock(side_effect=_disconnected)
+
+        completed = second.do_operation()
+
+        second._routing_profile_arn.assert_not_called()
+        assert [call.args[0] for call in second._active_contact_ids.call_args_list] == [
+            ["rp3", "rp4"], ["rp5"]
+        ]
+        assert "checkpoint" not in completed
+        assert completed["summary"]["disconnected"] == 2
+        assert [c["contact_id"] for c in completed["contact_details"]] == ["contact-1", "contact-2"]
+        assert list(tmp_path.iterdir()) == []
+
+    @patch.dict('os.environ', {'INSTANCE_ID': 'test-instance-id', 'REGION': 'us-east-1', 'CLEANUP_MAX_WORKERS': '1'})
+    @patch('workflow.amazon_connect.auto_clean_up_active_contacts.ConnectUtils')
+    def test_pauses_between_contact_slices(self, mock_connect_utils):
+        """Test contacts are handed out in slices and the unstarted ones are checkpointed."""
+        instance = AutoCleanUpActiveContacts({"test": "data"})
+        instance.checkpoint_store = MagicMock()
+        instance.checkpoint_store.get.return_value = None
+        instance._routing_profile_arn = MagicMock(return_value=["rp1"])
+        contact_ids = [f"contact-{i}" for i in range(10)]
+        instance._active_contact_ids = MagicMock(return_value=contact_ids)
+        instance._process_contact_validation_and_disconnect = MagicMock(side_effect=_disconnected)
+        # routing profile batch, first contact slice (1 worker x 4), then out of time
+        instance._out_of_time = MagicMock(side_effect=[False, False, True])
+
+        result = instance.do_operation()
+
+        assert result["summary"]["total_contacts_processed"] == 4
+        assert result["checkpoint"] == {"saved": True, "routing_profile_batches": 0, "contact_ids": 6}
+        saved = instance.checkpoint_store.put.call_args.args[1]
+        assert saved["routing_profile_batches"] == []
+        assert saved["contact_ids"] == contact_ids[4:]
+
+    @patch.dict('os.environ', {'INSTANCE_ID': 'test-instance-id', 'REGION': 'us-east-1'})
+    @patch('workflow.amazon_connect.auto_clean_up_active_contacts.ConnectUtils')
+    def test_stale_checkpoint_is_ignored(self, mock_connect_utils):
+        """Test a checkpoint older than the max age starts a new sweep."""
+        instance = AutoCleanUpActiveContacts({"test": "data"})
+        instance.checkpoint_store = MagicMock()
+        instance.checkpoint_store.get.return_value = {
+            "saved_at": 0,
+            "routing_profile_batches": [["old-rp"]],
+            "contact_ids": ["old-contact"],
+        }
+        instance._routing_profile_arn = MagicMock(return_value=["rp1"])
+        instance._active_contact_ids = MagicMock(return_value=[])
+
+        result = instance.do_operation()
+
+        instance._active_contact_ids.assert_called_once_with(["rp1"])
+        assert result["summary"]["total_contacts_processed"] == 0
+        instance.checkpoint_store.delete.assert_called_once()
+
+    @patch.dict('os.environ', {'INSTANCE_ID': 'test-instance-id', 'REGION': 'us-east-1', 'CLEANUP_TIME_RESERVE_SECONDS': '30'})
+    @patch('workflow.amazon_connect.auto_clean_up_active_contacts.ConnectUtils')
+    def test_pauses_without_store_when_deadline_is_near(self, mock_connect_utils):
+        """Test the Lambda deadline stops the sweep even when no checkpoint can be saved."""
+        from common.models.invocation_deadline import InvocationDeadline
+
+        instance = AutoCleanUpActiveContacts({"test": "data"})
+        instance._routing_profile_arn = MagicMock(
+            return_value=[f"rp{i}" for i in range(150)]
+        )
+        # the first batch uses up the time left
+        instance._active_contact_ids = MagicMock(
+            side_effect=lambda arns: InvocationDeadline.set(1) or []
+        )
+        assert instance.checkpoint_store is None
+        assert instance._out_of_time() is False
+
+        InvocationDeadline.set(100)
+        result = instance.do_operation()
+
+        instance._active_contact_ids.assert_called_once()
+        assert result["checkpoint"] == {"saved": False, "routing_profile_batches": 1, "contact_ids": 0}
+
+    @patch.dict('os.environ', {'INSTANCE_ID': 'test-instance-id', 'REGION': 'us-east-1', 'CLEANUP_TIME_RESERVE_SECONDS': '30'})
+    @patch('workflow.amazon_connect.auto_clean_up_active_contacts.ConnectUtils')
+    def test_timeout_below_reserve_still_makes_progress(self, mock_connect_utils):
+        """Test a timeout shorter than the reserve still queries routing profiles and contacts."""
+        from common.models.invocation_deadline import InvocationDeadline
+
+        instance = AutoCleanUpActiveContacts({"test": "data"})
+        instance._routing_profile_arn = MagicMock(return_value=["rp1"])
+        instance._active_contact_ids = MagicMock(return_value=["c1"])
+        instance._process_contacts = MagicMock(
+            return_value=iter([("c1", {"status": "In Progress"}, None)])
+        )
+
+        InvocationDeadline.set(10)
+        result = instance.do_operation()
+
+        instance._active_contact_ids.assert_called_once_with(["rp1"])
+        instance._process_contacts.assert_called_once_with(["c1"])
+        assert "checkpoint" not in result
+        assert result["summary"]["total_contacts_processed"] == 1
+        assert instance.time_reserve == 30
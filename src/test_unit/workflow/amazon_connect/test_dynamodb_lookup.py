@@ -9,7 +9,7 @@ from workflow.amazon_connect.dynamodb_lookup import DynamodbLookup
 class TestDynamodbLookup:
     
     @patch('workflow.amazon_connect.dynamodb_lookup.REGION', 'us-east-1')
-    @patch('workflow.amazon_connect.dynamodb_lookup.DynamoDBUtilsResource')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
     def test_init_success(self, mock_dynamodb_utils):
         """Test successful initialization."""
         event = {
@@ -24,7 +24,7 @@ class TestDynamodbLookup:
         mock_dynamodb_utils.assert_called_once_with('us-east-1', 'test-table')
     
     @patch.dict('os.environ', {'REGION': 'us-east-1'})
-    @patch('workflow.amazon_connect.dynamodb_lookup.DynamoDBUtilsResource')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
     def test_init_missing_table_name(self, mock_dynamodb_utils):
         """Test initialization with missing TABLE_NAME."""
         event = {
@@ -36,7 +36,7 @@ class TestDynamodbLookup:
             DynamodbLookup(event)
     
     @patch.dict('os.environ', {'REGION': 'us-east-1'})
-    @patch('workflow.amazon_connect.dynamodb_lookup.DynamoDBUtilsResource')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
     def test_do_validate_success(self, mock_dynamodb_utils):
         """Test successful validation."""
         event = {
@@ -52,7 +52,7 @@ class TestDynamodbLookup:
         assert error is None
     
     @patch.dict('os.environ', {'REGION': 'us-east-1'})
-    @patch('workflow.amazon_connect.dynamodb_lookup.DynamoDBUtilsResource')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
     def test_do_validate_missing_table_name(self, mock_dynamodb_utils):
         """Test validation with missing TABLE_NAME."""
         event = {
@@ -69,7 +69,7 @@ class TestDynamodbLookup:
         assert "TABLE_NAME" in str(error)
     
     @patch.dict('os.environ', {'REGION': 'us-east-1'})
-    @patch('workflow.amazon_connect.dynamodb_lookup.DynamoDBUtilsResource')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
     def test_do_validate_missing_key_name(self, mock_dynamodb_utils):
         """Test validation with missing KEY_NAME."""
         event = {
@@ -84,7 +84,7 @@ class TestDynamodbLookup:
         assert "KEY_NAME" in str(error)
     
     @patch.dict('os.environ', {'REGION': 'us-east-1'})
-    @patch('workflow.amazon_connect.dynamodb_lookup.DynamoDBUtilsResource')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
     def test_do_validate_missing_key_value(self, mock_dynamodb_utils):
         """Test validation with missing KEY_VALUE."""
         event = {
@@ -99,7 +99,7 @@ class TestDynamodbLookup:
         assert "KEY_VALUE" in str(error)
     
     @patch.dict('os.environ', {'REGION': 'us-east-1'})
-    @patch('workflow.amazon_connect.dynamodb_lookup.DynamoDBUtilsResource')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
     def test_do_operation_success(self, mock_dynamodb_utils):
         """Test successful do_operation."""
         event = {
@@ -119,7 +119,7 @@ class TestDynamodbLookup:
         mock_utils_instance.get_single_item_by_pk.assert_called_once_with("id", "123")
     
     @patch.dict('os.environ', {'REGION': 'us-east-1'})
-    @patch('workflow.amazon_connect.dynamodb_lookup.DynamoDBUtilsResource')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
     def test_do_operation_exception(self, mock_dynamodb_utils):
         """Test do_operation with exception."""
         event = {
@@ -136,3 +136,15 @@ class TestDynamodbLookup:
         
         with pytest.raises(Exception, match="DynamoDB error"):
             instance.do_operation()
+
+    @patch('workflow.amazon_connect.dynamodb_lookup.REGION', 'us-east-1')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
+    def test_table_utils_reused_across_invocations(self, mock_dynamodb_utils):
+        """Test the table resource built for one invocation is reused by the next."""
+        first = DynamodbLookup({"TABLE_NAME": "test-table"})
+        second = DynamodbLookup({"TABLE_NAME": "test-table"})
+        other = DynamodbLookup({"TABLE_NAME": "other-table"})
+        
+        assert first.DynamoDB_Utils_Resource is second.DynamoDB_Utils_Resource
+        assert other.DynamoDB_Utils_Resource is not None
+        assert mock_dynamodb_utils.call_count == 2
@@ -9,7 +9,7 @@ from workflow.amazon_connect.dynamodb_lookup_check import DynamoDBLookupCheck
 class TestDynamoDBLookupCheck:
     
     @patch.dict('os.environ', {'REGION': 'us-east-1'})
-    @patch('workflow.amazon_connect.dynamodb_lookup.DynamoDBUtilsResource')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
     def test_init(self, mock_dynamodb_utils):
         """Test DynamoDBLookupCheck initialization."""
         event = {
@@ -23,7 +23,7 @@ class TestDynamoDBLookupCheck:
         assert instance.event == event
     
     @patch.dict('os.environ', {'REGION': 'us-east-1'})
-    @patch('workflow.amazon_connect.dynamodb_lookup.DynamoDBUtilsResource')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
     def test_do_operation_item_found(self, mock_dynamodb_utils):
         """Test do_operation when item is found."""
         event = {
@@ -44,7 +44,7 @@ class TestDynamoDBLookupCheck:
         assert result["item"] == {"id": "123", "name": "test"}
     
     @patch.dict('os.environ', {'REGION': 'us-east-1'})
-    @patch('workflow.amazon_connect.dynamodb_lookup.DynamoDBUtilsResource')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
     def test_do_operation_item_not_found(self, mock_dynamodb_utils):
         """Test do_operation when item is not found."""
         event = {
@@ -65,7 +65,7 @@ class TestDynamoDBLookupCheck:
         assert result["item"] is None
     
     @patch.dict('os.environ', {'REGION': 'us-east-1'})
-    @patch('workflow.amazon_connect.dynamodb_lookup.DynamoDBUtilsResource')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
     def test_do_operation_exception(self, mock_dynamodb_utils):
         """Test do_operation with exception."""
         event = {
@@ -84,7 +84,7 @@ class TestDynamoDBLookupCheck:
             instance.do_operation()
     
     @patch.dict('os.environ', {'REGION': 'us-east-1'})
-    @patch('workflow.amazon_connect.dynamodb_lookup.DynamoDBUtilsResource')
+    @patch('common.utils_methods.dynamodb_utils_resource.DynamoDBUtilsResource')
     def test_do_operation_empty_item(self, mock_dynamodb_utils):
         """Test do_operation when item is empty dict."""
         event = {
@@ -0,0 +1,48 @@
+"""
+Unit tests for status_checker_dynamodb_streams module.
+"""
+import pytest
+from workflow.dynamodb_streams.status_checker_dynamodb_streams import StatusCheckerDynamoDBStreams
+
+
+class TestStatusCheckerDynamoDBStreams:
+    
+    def test_init(self):
+        """Test StatusCheckerDynamoDBStreams initialization."""
+        event = {"test": "data"}
+        checker = StatusCheckerDynamoDBStreams(event)
+        assert checker.event == event
+    
+    def test_do_validate_returns_true(self):
+        """Test do_validate always returns True."""
+        event = {"test": "data"}
+        checker = StatusCheckerDynamoDBStreams(event)
+        assert checker.do_validate() == (True, None)
+    
+    def test_do_operation_success(self):
+        """Test successful do_operation execution."""
+        event = {"test": "data"}
+        checker = StatusCheckerDynamoDBStreams(event)
+        
+        result = checker.do_operation()
+        
+        assert result['statusCode'] == 200
+        assert result['message'] == 'Status check successful'
+        assert result['service'] == 'dynamodb-streams'
+        assert result['status'] == 'healthy'
+    
+    def test_do_operation_with_different_events(self):
+        """Test do_operation with different event data."""
+        events = [
+            {},
+            {"key": "value"},
+            {"complex": {"nested": "data"}}
+        ]
+        
+        for event in events:
+            checker = StatusCheckerDynamoDBStreams(event)
+            result = checker.do_operation()
+            
+            assert result['statusCode'] == 200
+            assert result['service'] == 'dynamodb-streams'
+            assert result['status'] == 'healthy'
\ No newline at end of file
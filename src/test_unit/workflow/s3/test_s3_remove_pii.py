@@ -0,0 +1,159 @@
+"""
+Unit tests for s3_remove_pii module.
+"""
+import json
+import threading
+import pytest
+from unittest.mock import patch, MagicMock
+from workflow.s3.s3_remove_pii import S3RemovePii
+
+
+def _s3_record(bucket, key, version_id=None):
+    s3_object = {"key": key}
+    if version_id:
+        s3_object["versionId"] = version_id
+    return {"eventSource": "aws:s3", "s3": {"bucket": {"name": bucket}, "object": s3_object}}
+
+
+class TestS3RemovePii:
+
+    @pytest.fixture
+    def strategy(self, monkeypatch):
+        """Build the strategy for an event, with the transcription job mocked."""
+        monkeypatch.setenv("S3_MAX_WORKERS", "4")
+
+        def build(event):
+            strategy = S3RemovePii(event)
+            strategy._start_transcription_job = MagicMock(
+                return_value={"TranscriptionJob": {"TranscriptionJobStatus": "COMPLETED"}}
+            )
+            return strategy
+
+        return build
+
+    def test_every_record_is_processed_once(self, strategy):
+        """Test all records are processed and duplicates are dropped."""
+        strategy = strategy({
+            "Records": [
+                _s3_record("bucket", "calls/a.wav"),
+                _s3_record("bucket", "calls/b+c.wav"),
+                _s3_record("bucket", "calls/a.wav"),
+                _s3_record("bucket", "calls/a.wav", version_id="v2"),
+            ]
+        })
+
+        result = strategy.do_operation()
+
+        assert result["statusCode"] == 200
+        assert [r["media_file_uri"] for r in result["results"]] == [
+            "s3://bucket/calls/a.wav",
+            "s3://bucket/calls/b c.wav",
+            "s3://bucket/calls/a.wav",
+        ]
+        assert strategy._start_transcription_job.call_count == 3
+
+    def test_objects_run_on_worker_pool(self, strategy):
+        """Test objects are processed concurrently and keep event order."""
+        threads = set()
+
+        def start(job_name, media_file_uri, output_bucket):
+            threads.add(threading.get_ident())
+            status = "FAILED" if media_file_uri.endswith("1.wav") else "COMPLETED"
+            return {"TranscriptionJob": {"TranscriptionJobStatus": status}}
+
+        strategy = strategy({"Records": [_s3_record("bucket", f"{i}.wav") for i in range(3)]})
+        strategy._start_transcription_job = start
+
+        result = strategy.do_operation()
+
+        assert result["statusCode"] == 207
+        assert [r["statusCode"] for r in result["results"]] == [200, 400, 200]
+        assert threading.get_ident() not in threads
+
+    def test_failure_is_reported_per_object(self, strategy):
+        """Test an exception fails only its own object."""
+        strategy = strategy({"Records": [_s3_record("bucket", "a.wav"), _s3_record("bucket", "b.wav")]})
+        strategy._start_transcription_job.side_effect = [
+            Exception("boom"),
+            {"TranscriptionJob": {"TranscriptionJobStatus": "COMPLETED"}},
+        ]
+        strategy.max_workers = 1
+
+        result = strategy.do_operation()
+
+        assert result["results"][0]["error"] == "boom"
+        assert result["results"][1]["Status"] == "COMPLETED"
+
+    def test_s3_event_from_sqs(self, strategy):
+        """Test S3 notifications wrapped in SQS bodies are processed."""
+        body = json.dumps({"Records": [_s3_record("bucket", "a.wav"), _s3_record("bucket", "b.wav")]})
+        strategy = strategy({"Records": [{"eventSource": "aws:sqs", "body": body}]})
+
+        result = strategy.do_operation()
+
+        assert len(result["results"]) == 2
+
+    def test_no_objects(self, strategy):
+        """Test an event without S3 objects fails validation."""
+        strategy = strategy({"Records": []})
+
+        assert strategy.do_validate() == (False, "No S3 objects found in event")
+        assert strategy.do_operation()["statusCode"] == 400
+
+    def test_transcription_job_redacts_to_target_bucket(self, monkeypatch):
+        """Test the job goes to TranscribeUtils with the target bucket and language."""
+        monkeypatch.setenv("TARGET_OUTPUT_BUCKET", "redacted")
+        monkeypatch.setenv("TRANSCRIBE_LANGUAGE_CODE", "en-GB")
+        strategy = S3RemovePii({"Records": [_s3_record("bucket", "a.wav")]})
+        strategy.transcribe_utils = MagicMock()
+        strategy.transcribe_utils.start_transcription_job.return_value = {
+            "TranscriptionJob": {"TranscriptionJobStatus": "COMPLETED"}
+        }
+
+        result = strategy.do_operation()
+
+        assert result["statusCode"] == 200
+        job_name, media_file_uri, bucket, language = (
+            strategy.transcribe_utils.start_transcription_job.call_args.args
+        )
+        assert job_name.startswith("Transcription_Job_Name-")
+        assert (media_file_uri, bucket, language) == ("s3://bucket/a.wav", "redacted", "en-GB")
+
+    @patch.dict('os.environ', {'S3_REQUEST_TYPE': 'S3RemovePii'})
+    @patch('common.utils_methods.transcribe_utils.transcribe_client')
+    def test_lambda_handler_dispatches_s3_events(self, mock_transcribe_client):
+        """Test an S3 notification reaches the strategy through lambda_handler."""
+        from lambda_handler import lambda_handler
+
+        mock_transcribe_client.return_value.start_transcription_job.return_value = {
+            "TranscriptionJob": {"TranscriptionJobStatus": "COMPLETED"}
+        }
+        event = {"Records": [_s3_record("bucket", "a.wav"), _s3_record("bucket", "b.wav")]}
+
+        response = lambda_handler(event, {"aws_request_id": "test-request-id"})
+
+        assert response["statusCode"] == 200
+        data = json.loads(response["body"])["data"]
+        assert [r["media_file_uri"] for r in data["results"]] == ["s3://bucket/a.wav", "s3://bucket/b.wav"]
+        assert mock_transcribe_client.return_value.start_transcription_job.call_count == 2
+
+    @patch.dict('os.environ', {'S3_REQUEST_TYPE': 'S3RemovePii'})
+    @patch('common.utils_methods.transcribe_utils.transcribe_client')
+    def test_lambda_handler_keeps_object_keys_unmasked(self, mock_transcribe_client):
+        """Test keys that look like card numbers or secrets reach Transcribe unchanged."""
+        from lambda_handler import lambda_handler
+
+        start = mock_transcribe_client.return_value.start_transcription_job
+        start.return_value = {"TranscriptionJob": {"TranscriptionJobStatus": "COMPLETED"}}
+        keys = [
+            "recordings/4111111111111111.wav",
+            "recordings/wJalrXUtnFEMI/K7MDENG/bPxRfiCYEXAMPLEKEY/call.wav",
+        ]
+        event = {"Records": [_s3_record("bucket-123-45-6789", key) for key in keys]}
+
+        response = lambda_handler(event, {"aws_request_id": "test-request-id"})
+
+        assert response["statusCode"] == 200
+        media_file_uris = [call.kwargs["Media"]["MediaFileUri"] for call in start.call_args_list]
+        assert media_file_uris == [f"s3://bucket-123-45-6789/{key}" for key in keys]
+
@@ -1,7 +1,16 @@
-from common.utils_methods.connect_utils import ConnectUtils
+from common.utils_methods.connect_utils import (
+    ConnectUtils,
+    connect_api_metrics,
+    reset_connect_api_metrics,
+)
+from common.utils_methods.snapshot_store import snapshot_store
 from common.models.default_strategy import DefaultStrategy
+from common.models.invocation_deadline import InvocationDeadline
+from common.models.strategy_registry import register_strategy
 from common.models.logger import Logger
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 LOGGER = Logger(__name__)
@@ -10,17 +19,77 @@ LOGGER = Logger(__name__)
 MAX_CONTACT_ACTIVE_TIME = 2  # hours
 RP_ARN_LIMITS = 100
 
-
+# contacts validated / disconnected concurrently; each worker makes one
+# describe_contact and at most one stop_contact call at a time, so keep this
+# within the Connect API rate limits of the instance
+CLEANUP_MAX_WORKERS_ENV = "CLEANUP_MAX_WORKERS"
+DEFAULT_CLEANUP_MAX_WORKERS = 4
+# contacts handed to the worker pool between two remaining-time checks, per worker
+CONTACT_SLICE_PER_WORKER = 4
+
+# the sweep stops starting new work when fewer than CLEANUP_TIME_RESERVE_SECONDS
+# are left before the Lambda timeout and saves what is left to the checkpoint
+# store ("dynamodb://<table>" or a directory), which the next run resumes from
+CLEANUP_CHECKPOINT_STORE_ENV = "CLEANUP_CHECKPOINT_STORE"
+CLEANUP_TIME_RESERVE_ENV = "CLEANUP_TIME_RESERVE_SECONDS"
+DEFAULT_CLEANUP_TIME_RESERVE = 30.0
+# the reserve is at most this fraction of the time left when the sweep starts,
+# so a function whose timeout is below the reserve still makes progress
+MAX_TIME_RESERVE_FRACTION = 0.5
+CLEANUP_CHECKPOINT_MAX_AGE_ENV = "CLEANUP_CHECKPOINT_MAX_AGE_SECONDS"
+DEFAULT_CLEANUP_CHECKPOINT_MAX_AGE = 3600.0
+
+
+def _env_seconds(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+@register_strategy("AMAZON_CONNECT")
 class AutoCleanUpActiveContacts(DefaultStrategy):
     def __init__(self, event):
         self.event = event
         self.instance_id = os.environ.get("INSTANCE_ID")
         self.region = os.environ.get("REGION")
-        self.connect_utils = ConnectUtils(self.region, self.instance_id)
+        self.connect_utils = self._connect_utils(self.region, self.instance_id)
+        try:
+            self.max_workers = max(
+                1,
+                int(
+                    os.environ.get(CLEANUP_MAX_WORKERS_ENV, DEFAULT_CLEANUP_MAX_WORKERS)
+                ),
+            )
+        except ValueError:
+            self.max_workers = DEFAULT_CLEANUP_MAX_WORKERS
+        self.time_reserve = _env_seconds(
+            CLEANUP_TIME_RESERVE_ENV, DEFAULT_CLEANUP_TIME_RESERVE
+        )
+        self._sweep_time_reserve = self.time_reserve
+        self.checkpoint_max_age = _env_seconds(
+            CLEANUP_CHECKPOINT_MAX_AGE_ENV, DEFAULT_CLEANUP_CHECKPOINT_MAX_AGE
+        )
+        self.checkpoint_store = snapshot_store(
+            os.environ.get(CLEANUP_CHECKPOINT_STORE_ENV), self.region
+        )
         LOGGER.info(
-            f"Initializing AutoCleanUpActiveContacts for instance: {self.instance_id}"
+            "Initializing AutoCleanUpActiveContacts for instance: %s", self.instance_id
         )
 
+    @classmethod
+    def warm_init(cls) -> dict:
+        # (region, instance id) -> ConnectUtils, reused by warm invocations
+        return {"connect_utils": {}}
+
+    @classmethod
+    def _connect_utils(cls, region: str, instance_id: str) -> ConnectUtils:
+        connect_utils = cls.warm_state()["connect_utils"]
+        key = (region, instance_id)
+        if key not in connect_utils:
+            connect_utils[key] = ConnectUtils(region, instance_id)
+        return connect_utils[key]
+
     def do_validate(self):
         LOGGER.info("Starting validation process")
 
@@ -48,19 +117,18 @@ class AutoCleanUpActiveContacts(DefaultStrategy):
         total API calls, improves lookup performance, and avoids unnecessary
         iteration over all users / queues.
         """
-        LOGGER.info(f"Fetching routing profiles for instance: {self.instance_id}")
+        LOGGER.info("Fetching routing profiles for instance: %s", self.instance_id)
 
         try:
-            rp_paginator = self.connect_utils._get_paginator("list_routing_profiles")
-            routing_profile_arns = []
-
-            for page in rp_paginator.paginate(InstanceId=self.instance_id):
-                arns = [rp["Arn"] for rp in page.get("RoutingProfileSummaryList", [])]
-                routing_profile_arns.extend(arns)
+            # cached by ConnectUtils for CONNECT_LISTING_CACHE_TTL seconds
+            routing_profile_arns = [
+                rp["Arn"] for rp in self.connect_utils.list_routing_profile()
+            ]
 
             LOGGER.add_tempdata("routing_profile_count", len(routing_profile_arns))
             LOGGER.info(
-                f"Successfully retrieved {len(routing_profile_arns)} routing profile ARNs"
+                "Successfully retrieved %s routing profile ARNs",
+                len(routing_profile_arns),
             )
 
             return routing_profile_arns
@@ -69,7 +137,9 @@ class AutoCleanUpActiveContacts(DefaultStrategy):
             LOGGER.add_tempdata("error", str(e))
             LOGGER.add_tempdata("instance_id", self.instance_id)
             LOGGER.error(
-                f"Failed to retrieve routing profile ARNs for instance {self.instance_id}: {str(e)}"
+                "Failed to retrieve routing profile ARNs for instance %s: %s",
+                self.instance_id,
+                e,
             )
             raise
 
@@ -78,34 +148,35 @@ class AutoCleanUpActiveContacts(DefaultStrategy):
         Returns the currently active contacts for the given Routing Profile.
         """
         LOGGER.info(
-            f"Fetching active contacts for {len(routing_profile_arn)} routing profiles"
+            "Fetching active contacts for %s routing profiles", len(routing_profile_arn)
         )
 
         try:
             active_contact_ids_list = []
             filter_params = {
                 "RoutingProfiles": routing_profile_arn,
-                "ContactStates": ["CONNECTED"],
+                "ContactFilter": {"ContactStates": ["CONNECTED"]},
             }
 
             LOGGER.add_tempdata("filter_params", filter_params)
 
-            response = self.connect_utils.get_current_user_data(filter_params)
-            user_data_list = response.get("UserDataList", [])
-
-            LOGGER.info(f"Processing {len(user_data_list)} users for active contacts")
+            # users are streamed page by page (NextToken) into the threshold check
+            users = self.connect_utils.iter_current_user_data(filter_params)
 
+            users_checked = 0
             contacts_checked = 0
             contacts_exceeding_threshold = 0
 
-            for user in user_data_list:
+            for user in users:
+                users_checked += 1
                 for contact in user.get("Contacts", []):
                     contacts_checked += 1
                     ts = contact.get("ConnectedToAgentTimestamp")
 
                     if not ts:
                         LOGGER.warning(
-                            f"Contact {contact.get('ContactId')} missing ConnectedToAgentTimestamp"
+                            "Contact %s missing ConnectedToAgentTimestamp",
+                            contact.get("ContactId"),
                         )
                         continue
 
@@ -124,16 +195,22 @@ class AutoCleanUpActiveContacts(DefaultStrategy):
                         active_contact_ids_list.append(contact_id)
                         contacts_exceeding_threshold += 1
                         LOGGER.info(
-                            f"Contact {contact_id} exceeds threshold: {duration_hours:.2f} hours active"
+                            "Contact %s exceeds threshold: %.2f hours active",
+                            contact_id,
+                            duration_hours,
                         )
 
+            LOGGER.add_tempdata("users_checked", users_checked)
             LOGGER.add_tempdata("contacts_checked", contacts_checked)
             LOGGER.add_tempdata(
                 "contacts_exceeding_threshold", contacts_exceeding_threshold
             )
             LOGGER.add_tempdata("active_contact_ids", active_contact_ids_list)
             LOGGER.info(
-                f"Found {len(active_contact_ids_list)} contacts exceeding {MAX_CONTACT_ACTIVE_TIME} hour threshold out of {contacts_checked} checked"
+                "Found %s contacts exceeding %s hour threshold out of %s checked",
+                len(active_contact_ids_list),
+                MAX_CONTACT_ACTIVE_TIME,
+                contacts_checked,
             )
 
             return active_contact_ids_list
@@ -141,21 +218,23 @@ class AutoCleanUpActiveContacts(DefaultStrategy):
         except Exception as e:
             LOGGER.add_tempdata("error", str(e))
             LOGGER.add_tempdata("routing_profile_count", len(routing_profile_arn))
-            LOGGER.error(f"Failed to retrieve active contact IDs: {str(e)}")
+            LOGGER.error("Failed to retrieve active contact IDs: %s", e)
             raise
 
     def _process_contact_validation_and_disconnect(self, contact_id):
         """
         Validates and disconnects a contact if it exceeds the active time threshold.
         """
-        LOGGER.info(f"Processing contact validation for contact_id: {contact_id}")
+        LOGGER.info("Processing contact validation for contact_id: %s", contact_id)
 
         try:
             response = self.connect_utils.describe_contact(contact_id)
             contact = response.get("Contact")
 
             if not contact:
-                LOGGER.warning(f"No contact details found for contact_id: {contact_id}")
+                LOGGER.warning(
+                    "No contact details found for contact_id: %s", contact_id
+                )
                 return None
 
             # Check if already disconnected
@@ -163,7 +242,9 @@ class AutoCleanUpActiveContacts(DefaultStrategy):
                 disconnect_ts = contact.get("DisconnectTimestamp")
                 LOGGER.add_tempdata("already_disconnected_contact_id", contact_id)
                 LOGGER.info(
-                    f"Contact {contact_id} is already disconnected at {disconnect_ts}"
+                    "Contact %s is already disconnected at %s",
+                    contact_id,
+                    disconnect_ts,
                 )
                 return {
                     "status": "Already_Disconnected",
@@ -174,7 +255,7 @@ class AutoCleanUpActiveContacts(DefaultStrategy):
             # Process active contact
             ts = contact.get("LastUpdateTimestamp")
             if not ts:
-                LOGGER.warning(f"Contact {contact_id} missing LastUpdateTimestamp")
+                LOGGER.warning("Contact %s missing LastUpdateTimestamp", contact_id)
                 return None
 
             last_update_timestamp = (
@@ -188,11 +269,13 @@ class AutoCleanUpActiveContacts(DefaultStrategy):
 
             if duration_hours >= MAX_CONTACT_ACTIVE_TIME:
                 LOGGER.info(
-                    f"Attempting to disconnect contact {contact_id} (active for {duration_hours:.2f} hours)"
+                    "Attempting to disconnect contact %s (active for %.2f hours)",
+                    contact_id,
+                    duration_hours,
                 )
                 self.connect_utils.stop_contact(contact_id)
                 LOGGER.add_tempdata("disconnected_contact_id", contact_id)
-                LOGGER.info(f"Successfully disconnected contact {contact_id}")
+                LOGGER.info("Successfully disconnected contact %s", contact_id)
 
                 return {
                     "status": "Disconnected",
@@ -203,7 +286,10 @@ class AutoCleanUpActiveContacts(DefaultStrategy):
             else:
                 LOGGER.add_tempdata("in_progress_contact_id", contact_id)
                 LOGGER.info(
-                    f"Contact {contact_id} not disconnected: active for {duration_hours:.2f} hours (threshold: {MAX_CONTACT_ACTIVE_TIME} hours)"
+                    "Contact %s not disconnected: active for %.2f hours (threshold: %s hours)",
+                    contact_id,
+                    duration_hours,
+                    MAX_CONTACT_ACTIVE_TIME,
                 )
 
                 return {
@@ -216,17 +302,227 @@ class AutoCleanUpActiveContacts(DefaultStrategy):
         except Exception as e:
             LOGGER.add_tempdata("error", str(e))
             LOGGER.add_tempdata("failed_contact_id", contact_id)
-            LOGGER.error(f"Failed to process contact {contact_id}: {str(e)}")
+            LOGGER.error("Failed to process contact %s: %s", contact_id, e)
             raise
 
+    def _process_contacts(self, contact_ids: list):
+        """
+        Validate and disconnect contacts on a pool of max_workers threads.
+
+        Yields (contact_id, status dict or None, exception or None) in the order
+        of contact_ids, so counting and reporting stay sequential.
+        """
+        total = len(contact_ids)
+
+        def process(indexed_contact):
+            idx, contact_id = indexed_contact
+            LOGGER.info("Processing contact %s/%s: %s", idx, total, contact_id)
+            try:
+                return (
+                    contact_id,
+                    self._process_contact_validation_and_disconnect(contact_id),
+                    None,
+                )
+            except Exception as contact_error:
+                return contact_id, None, contact_error
+
+        indexed_contacts = enumerate(contact_ids, 1)
+        if self.max_workers == 1 or total <= 1:
+            yield from map(process, indexed_contacts)
+            return
+
+        LOGGER.info("Processing %s contacts with %s workers", total, self.max_workers)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, total)) as executor:
+            yield from executor.map(process, indexed_contacts)
+
+    def _process_contacts_in_time(self, contact_ids: list, unprocessed: list):
+        """
+        _process_contacts in slices of max_workers * CONTACT_SLICE_PER_WORKER.
+
+        Before each slice the remaining invocation time is checked; when it is
+        below the reserve, the contacts not started yet are added to
+        unprocessed and the generator stops.
+        """
+        slice_size = self.max_workers * CONTACT_SLICE_PER_WORKER
+        for start in range(0, len(contact_ids), slice_size):
+            if self._out_of_time():
+                unprocessed.extend(contact_ids[start:])
+                return
+            end = start + slice_size
+            yield from self._process_contacts(contact_ids[start:end])
+
+    def _clamp_time_reserve(self):
+        """
+        Sets the reserve used by this sweep to time_reserve, capped at
+        MAX_TIME_RESERVE_FRACTION of the time left now.
+        """
+        self._sweep_time_reserve = self.time_reserve
+        remaining = InvocationDeadline.remaining_seconds()
+        if remaining is not None:
+            self._sweep_time_reserve = min(
+                self.time_reserve, remaining * MAX_TIME_RESERVE_FRACTION
+            )
+
+    def _out_of_time(self) -> bool:
+        remaining = InvocationDeadline.remaining_seconds()
+        return remaining is not None and remaining < self._sweep_time_reserve
+
+    def _checkpoint_key(self) -> str:
+        return f"cleanup-checkpoint#{self.region}#{self.instance_id}"
+
+    def _load_checkpoint(self):
+        """
+        Returns the checkpoint saved by a previous run, None if there is none,
+        it is older than CLEANUP_CHECKPOINT_MAX_AGE_SECONDS or cannot be read.
+        """
+        if self.checkpoint_store is None:
+            return None
+        try:
+            checkpoint = self.checkpoint_store.get(self._checkpoint_key())
+        except Exception as e:
+            LOGGER.warning("Could not read cleanup checkpoint: %s", e)
+            return None
+        if not checkpoint:
+            return None
+
+        age = time.time() - checkpoint.get("saved_at", 0)
+        if age > self.checkpoint_max_age:
+            LOGGER.warning("Ignoring cleanup checkpoint saved %.0fs ago", age)
+            return None
+        return checkpoint
+
+    def _save_checkpoint(self, routing_profile_batches: list, contact_ids: list):
+        """
+        Saves the work left for the next run; returns whether it was saved.
+        """
+        if self.checkpoint_store is None:
+            LOGGER.warning(
+                "Stopping before the timeout without %s set; the next run starts over",
+                CLEANUP_CHECKPOINT_STORE_ENV,
+            )
+            return False
+        try:
+            self.checkpoint_store.put(
+                self._checkpoint_key(),
+                {
+                    "saved_at": time.time(),
+                    "routing_profile_batches": routing_profile_batches,
+                    "contact_ids": contact_ids,
+                },
+            )
+        except Exception as e:
+            LOGGER.error("Could not save cleanup checkpoint: %s", e)
+            return False
+        LOGGER.info(
+            "Saved cleanup checkpoint: %s routing profile batches, %s contacts left",
+            len(routing_profile_batches),
+            len(contact_ids),
+        )
+        return True
+
+    def _clear_checkpoint(self):
+        if self.checkpoint_store is None:
+            return
+        try:
+            self.checkpoint_store.delete(self._checkpoint_key())
+        except Exception as e:
+            LOGGER.warning("Could not delete cleanup checkpoint: %s", e)
+
+    def _start_sweep(self):
+        """
+        Resumes the sweep a previous run stopped before its timeout, or starts a
+        new one from the routing profiles.
+
+        Returns (routing profile ARN batches still to query, contact ids found
+        so far).
+        """
+        checkpoint = self._load_checkpoint()
+        LOGGER.add_tempdata("resumed_from_checkpoint", bool(checkpoint))
+        if checkpoint:
+            LOGGER.info(
+                "Resuming from checkpoint: %s routing profile batches, %s contacts",
+                len(checkpoint["routing_profile_batches"]),
+                len(checkpoint["contact_ids"]),
+            )
+            return checkpoint["routing_profile_batches"], checkpoint["contact_ids"]
+
+        rp_arn_list = self._routing_profile_arn()
+        LOGGER.info(
+            "Processing %s routing profiles in batches of %s",
+            len(rp_arn_list),
+            RP_ARN_LIMITS,
+        )
+        rp_arn_batches = []
+        for start in range(0, len(rp_arn_list), RP_ARN_LIMITS):
+            end = start + RP_ARN_LIMITS
+            rp_arn_batches.append(rp_arn_list[start:end])
+        return rp_arn_batches, []
+
+    def _collect_active_contacts(self, rp_arn_batches: list, contact_ids: list):
+        """
+        Adds the active contacts of each routing profile batch to contact_ids.
+
+        Returns the batches not queried before the time reserve was reached.
+        """
+        for batch_index, batch_arns in enumerate(rp_arn_batches):
+            if self._out_of_time():
+                return rp_arn_batches[batch_index:]
+            LOGGER.info(
+                "Processing batch %s: %s routing profiles",
+                batch_index + 1,
+                len(batch_arns),
+            )
+            contact_ids.extend(self._active_contact_ids(batch_arns))
+        return []
+
+    def _end_sweep(
+        self,
+        remaining_batches: list,
+        unprocessed_contacts: list,
+        summary: dict,
+        contact_result: list,
+    ) -> dict:
+        """
+        Clears the checkpoint once the sweep is complete, or saves the work left
+        for the next run, and builds the operation response.
+        """
+        if not remaining_batches and not unprocessed_contacts:
+            self._clear_checkpoint()
+            LOGGER.info("Contact cleanup operation completed: %s", summary)
+            return {
+                "status": "Success",
+                "message": "Contact cleanup job completed successfully",
+                "summary": summary,
+                "contact_details": contact_result,
+            }
+
+        checkpoint_saved = self._save_checkpoint(
+            remaining_batches, unprocessed_contacts
+        )
+        LOGGER.info("Contact cleanup operation paused: %s", summary)
+        return {
+            "status": "Success",
+            "message": "Contact cleanup job paused before the Lambda timeout",
+            "summary": summary,
+            "contact_details": contact_result,
+            "checkpoint": {
+                "saved": checkpoint_saved,
+                "routing_profile_batches": len(remaining_batches),
+                "contact_ids": len(unprocessed_contacts),
+            },
+        }
+
     def do_operation(self):
         """
         Main operation to clean up active contacts that exceed the time threshold.
         """
         LOGGER.info(
-            f"Starting contact cleanup operation with {MAX_CONTACT_ACTIVE_TIME} hour threshold"
+            "Starting contact cleanup operation with %s hour threshold",
+            MAX_CONTACT_ACTIVE_TIME,
         )
 
+        reset_connect_api_metrics()
+        self._clamp_time_reserve()
         try:
             contact_result = []
             disconnected_count = 0
@@ -234,100 +530,96 @@ class AutoCleanUpActiveContacts(DefaultStrategy):
             already_disconnected_count = 0
             failed_count = 0
 
-            # Get routing profiles
-            rp_arn_list = self._routing_profile_arn()
-            LOGGER.info(
-                f"Processing {len(rp_arn_list)} routing profiles in batches of {RP_ARN_LIMITS}"
+            rp_arn_batches, all_active_contacts = self._start_sweep()
+            remaining_batches = self._collect_active_contacts(
+                rp_arn_batches, all_active_contacts
             )
 
-            # Get active contacts in batches
-            all_active_contacts = []
-            for i in range(0, len(rp_arn_list), RP_ARN_LIMITS):
-                batch_arns = rp_arn_list[i : i + RP_ARN_LIMITS]
-                LOGGER.info(
-                    f"Processing batch {i//RP_ARN_LIMITS + 1}: {len(batch_arns)} routing profiles"
-                )
-                batch_contacts = self._active_contact_ids(batch_arns)
-                all_active_contacts.extend(batch_contacts)
-
             LOGGER.add_tempdata("total_active_contacts", len(all_active_contacts))
-            LOGGER.info(f"Total active contacts found: {len(all_active_contacts)}")
-
-            # Process each contact
-            for idx, contact_id in enumerate(all_active_contacts, 1):
-                LOGGER.info(
-                    f"Processing contact {idx}/{len(all_active_contacts)}: {contact_id}"
+            LOGGER.info("Total active contacts found: %s", len(all_active_contacts))
+
+            # Validate / disconnect contacts on the worker pool; results come
+            # back in contact order and are counted here, on one thread.
+            # Contacts not started before the time reserve go to the checkpoint.
+            unprocessed_contacts = []
+            if remaining_batches:
+                unprocessed_contacts = all_active_contacts
+                contact_results = iter(())
+            else:
+                contact_results = self._process_contacts_in_time(
+                    all_active_contacts, unprocessed_contacts
                 )
-
-                try:
-                    contact_disconnect_status = (
-                        self._process_contact_validation_and_disconnect(contact_id)
-                    )
-
-                    if not contact_disconnect_status:
-                        failed_count += 1
-                        continue
-
-                    status = contact_disconnect_status.get("status")
-
-                    if status == "Disconnected":
-                        disconnected_count += 1
-                        contact_result.append(
-                            {
-                                "Contact_status": "Disconnected",
-                                "LastUpdateTimestamp": str(
-                                    contact_disconnect_status.get("LastUpdateTimestamp")
-                                ),
-                                "contact_id": contact_id,
-                                "duration_hours": contact_disconnect_status.get(
-                                    "duration_hours"
-                                ),
-                            }
-                        )
-                        LOGGER.add_tempdata("disconnected_contact_id", contact_id)
-                        LOGGER.info(f"Contact {contact_id} successfully disconnected")
-
-                    elif status == "In_Progress":
-                        in_progress_count += 1
-                        contact_result.append(
-                            {
-                                "Contact_status": "In_Progress",
-                                "LastUpdateTimestamp": str(
-                                    contact_disconnect_status.get("LastUpdateTimestamp")
-                                ),
-                                "contact_id": contact_id,
-                                "duration_hours": contact_disconnect_status.get(
-                                    "duration_hours"
-                                ),
-                            }
-                        )
-                        LOGGER.add_tempdata("in_progress_contact_id", contact_id)
-                        LOGGER.info(
-                            f"Contact {contact_id} still in progress (below threshold)"
-                        )
-
-                    elif status == "Already_Disconnected":
-                        already_disconnected_count += 1
-                        contact_result.append(
-                            {
-                                "Contact_status": "Already_Disconnected",
-                                "LastUpdateTimestamp": str(
-                                    contact_disconnect_status.get("LastUpdateTimestamp")
-                                ),
-                                "contact_id": contact_id,
-                            }
-                        )
-
-                except Exception as contact_error:
+            for (
+                contact_id,
+                contact_disconnect_status,
+                contact_error,
+            ) in contact_results:
+                if contact_error is not None:
                     failed_count += 1
                     LOGGER.add_tempdata("error", str(contact_error))
                     LOGGER.error(
-                        f"Failed to process contact {contact_id}: {str(contact_error)}"
+                        "Failed to process contact %s: %s", contact_id, contact_error
+                    )
+                    continue
+
+                if not contact_disconnect_status:
+                    failed_count += 1
+                    continue
+
+                status = contact_disconnect_status.get("status")
+
+                if status == "Disconnected":
+                    disconnected_count += 1
+                    contact_result.append(
+                        {
+                            "Contact_status": "Disconnected",
+                            "LastUpdateTimestamp": str(
+                                contact_disconnect_status.get("LastUpdateTimestamp")
+                            ),
+                            "contact_id": contact_id,
+                            "duration_hours": contact_disconnect_status.get(
+                                "duration_hours"
+                            ),
+                        }
+                    )
+                    LOGGER.add_tempdata("disconnected_contact_id", contact_id)
+                    LOGGER.info("Contact %s successfully disconnected", contact_id)
+
+                elif status == "In_Progress":
+                    in_progress_count += 1
+                    contact_result.append(
+                        {
+                            "Contact_status": "In_Progress",
+                            "LastUpdateTimestamp": str(
+                                contact_disconnect_status.get("LastUpdateTimestamp")
+                            ),
+                            "contact_id": contact_id,
+                            "duration_hours": contact_disconnect_status.get(
+                                "duration_hours"
+                            ),
+                        }
+                    )
+                    LOGGER.add_tempdata("in_progress_contact_id", contact_id)
+                    LOGGER.info(
+                        "Contact %s still in progress (below threshold)", contact_id
+                    )
+
+                elif status == "Already_Disconnected":
+                    already_disconnected_count += 1
+                    contact_result.append(
+                        {
+                            "Contact_status": "Already_Disconnected",
+                            "LastUpdateTimestamp": str(
+                                contact_disconnect_status.get("LastUpdateTimestamp")
+                            ),
+                            "contact_id": contact_id,
+                        }
                     )
 
             # Summary logging
             summary = {
-                "total_contacts_processed": len(all_active_contacts),
+                "total_contacts_processed": len(all_active_contacts)
+                - len(unprocessed_contacts),
                 "disconnected": disconnected_count,
                 "in_progress": in_progress_count,
                 "already_disconnected": already_disconnected_count,
@@ -335,16 +627,14 @@ class AutoCleanUpActiveContacts(DefaultStrategy):
             }
 
             LOGGER.add_tempdata("operation_summary", summary)
-            LOGGER.info(f"Contact cleanup operation completed: {summary}")
+            # calls, throttles and rate limiter / backoff wait per Connect API
+            LOGGER.add_tempdata("connect_api_metrics", connect_api_metrics())
 
-            return {
-                "status": "Success",
-                "message": "Contact cleanup job completed successfully",
-                "summary": summary,
-                "contact_details": contact_result,
-            }
+            return self._end_sweep(
+                remaining_batches, unprocessed_contacts, summary, contact_result
+            )
 
         except Exception as e:
             LOGGER.add_tempdata("error", str(e))
-            LOGGER.error(f"Contact cleanup operation failed: {str(e)}")
+            LOGGER.error("Contact cleanup operation failed: %s", e)
             raise
@@ -1,10 +1,11 @@
 from common.utils_methods.dynamodb_utils_resource import (
-    DynamoDBUtilsResource,
+    table_utils,
     TABLE_NAME,
     KEY_NAME,
     KEY_VALUE,
 )
 from common.models.default_strategy import DefaultStrategy
+from common.models.strategy_registry import register_strategy
 from common.models.logger import Logger
 import os
 
@@ -13,6 +14,9 @@ LOGGER = Logger(__name__)
 REGION = os.environ.get("REGION")
 
 
+@register_strategy(
+    "AMAZON_CONNECT", "DIRECT_INVOKE", "SQS", "KINESIS", "DYNAMODB_STREAMS"
+)
 class DynamodbLookup(DefaultStrategy):
     def __init__(self, event):
         self.event = event
@@ -20,7 +24,7 @@ class DynamodbLookup(DefaultStrategy):
         if not table_name:
             raise ValueError("TABLE_NAME must be provided in event")
 
-        self.DynamoDB_Utils_Resource = DynamoDBUtilsResource(REGION, table_name)
+        self.DynamoDB_Utils_Resource = table_utils(REGION, table_name)
 
     def do_validate(self):
         error = []
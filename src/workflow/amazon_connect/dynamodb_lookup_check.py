@@ -1,9 +1,13 @@
 from workflow.amazon_connect.dynamodb_lookup import DynamodbLookup
 from common.models.logger import Logger
+from common.models.strategy_registry import register_strategy
 
 LOGGER = Logger(__name__)
 
 
+@register_strategy(
+    "AMAZON_CONNECT", "DIRECT_INVOKE", "SQS", "KINESIS", "DYNAMODB_STREAMS"
+)
 class DynamoDBLookupCheck(DynamodbLookup):
 
     def do_operation(self):
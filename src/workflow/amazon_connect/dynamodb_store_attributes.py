@@ -1,5 +1,6 @@
-from common.utils_methods.dynamodb_utils_resource import DynamoDBUtilsResource
+from common.utils_methods.dynamodb_utils_resource import table_utils
 from common.models.default_strategy import DefaultStrategy
+from common.models.strategy_registry import register_strategy
 from common.models.logger import Logger
 import os
 
@@ -7,6 +8,7 @@ LOGGER = Logger(__name__)
 REGION = os.environ.get("REGION")
 
 
+@register_strategy("AMAZON_CONNECT", "KINESIS", "DYNAMODB_STREAMS")
 class DynamoDBStoreAttributes(DefaultStrategy):
     """
     Strategy: Store Amazon Connect Contact Event details into DynamoDB.
@@ -26,7 +28,7 @@ class DynamoDBStoreAttributes(DefaultStrategy):
         if not table_name:
             raise ValueError("TABLE_NAME must be provided in event")
 
-        self.dynamodb_resource = DynamoDBUtilsResource(REGION, table_name)
+        self.dynamodb_resource = table_utils(REGION, table_name)
 
     def _customise_data_from_connect_event(self, event: dict) -> dict:
         """
@@ -1,19 +1,9 @@
-from workflow.amazon_connect.status_checker_connect import StatusCheckerConnect
-from workflow.amazon_connect.auto_clean_up_active_contacts import (
-    AutoCleanUpActiveContacts,
-)
-from workflow.amazon_connect.phone_number_format import PhoneNumberFormat
-from workflow.amazon_connect.dynamodb_lookup import DynamodbLookup
-from workflow.amazon_connect.dynamodb_lookup_check import DynamoDBLookupCheck
-from workflow.amazon_connect.dynamodb_store_attributes import DynamoDBStoreAttributes
-
-
-# invocation source class
-AMAZON_CONNECT = [
-    "StatusCheckerConnect",
-    "AutoCleanUpActiveContacts",
-    "PhoneNumberFormat",
-    "DynamodbLookup",
-    "DynamoDBLookupCheck",
-    "DynamoDBStoreAttributes",
-]
+# invocation source class -> module defining it, imported on first use
+AMAZON_CONNECT = {
+    "StatusCheckerConnect": "workflow.amazon_connect.status_checker_connect",
+    "AutoCleanUpActiveContacts": "workflow.amazon_connect.auto_clean_up_active_contacts",
+    "PhoneNumberFormat": "workflow.amazon_connect.phone_number_format",
+    "DynamodbLookup": "workflow.amazon_connect.dynamodb_lookup",
+    "DynamoDBLookupCheck": "workflow.amazon_connect.dynamodb_lookup_check",
+    "DynamoDBStoreAttributes": "workflow.amazon_connect.dynamodb_store_attributes",
+}
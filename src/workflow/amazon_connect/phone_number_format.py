@@ -2,12 +2,16 @@ import phonenumbers
 from phonenumbers import ValidationResult
 from common.models.default_strategy import DefaultStrategy
 from common.models.logger import Logger
+from common.models.strategy_registry import register_strategy
 
 LOGGER = Logger(__name__)
 
 PLUS_SIGN = "+"
 
 
+@register_strategy(
+    "AMAZON_CONNECT", "DIRECT_INVOKE", "SQS", "KINESIS", "DYNAMODB_STREAMS"
+)
 class PhoneNumberFormat(DefaultStrategy):
     def __init__(self, event):
         self.event = event
@@ -1,6 +1,8 @@
 from common.models.default_strategy import DefaultStrategy
+from common.models.strategy_registry import register_strategy
 
 
+@register_strategy("AMAZON_CONNECT")
 class StatusCheckerConnect(DefaultStrategy):
     def __init__(self, event):
         self.event = event
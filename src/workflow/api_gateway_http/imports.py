@@ -1,7 +1,4 @@
-from workflow.api_gateway_http.status_checker_api_gateway_http import StatusCheckerAPIGateWayHTTP
-
-
-
-
-#invocation source class
-API_GATEWAY_HTTP=["StatusCheckerAPIGateWayHTTP"]
\ No newline at end of file
+# invocation source class -> module defining it, imported on first use
+API_GATEWAY_HTTP = {
+    "StatusCheckerAPIGateWayHTTP": "workflow.api_gateway_http.status_checker_api_gateway_http",
+}
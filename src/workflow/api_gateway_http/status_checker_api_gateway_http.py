@@ -1,4 +1,9 @@
-class StatusCheckerAPIGateWayHTTP:
+from common.models.default_strategy import DefaultStrategy
+from common.models.strategy_registry import register_strategy
+
+
+@register_strategy("API_GATEWAY_HTTP")
+class StatusCheckerAPIGateWayHTTP(DefaultStrategy):
     def __init__(self, event):
         self.event = event
 
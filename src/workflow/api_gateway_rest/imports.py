@@ -1,7 +1,4 @@
-from workflow.api_gateway_rest.status_checker_api_gateway_rest import StatusCheckerAPIGateWayRest
-
-
-
-
-#invocation source class
-API_GATEWAY_REST=["StatusCheckerAPIGateWayRest"]
\ No newline at end of file
+# invocation source class -> module defining it, imported on first use
+API_GATEWAY_REST = {
+    "StatusCheckerAPIGateWayRest": "workflow.api_gateway_rest.status_checker_api_gateway_rest",
+}
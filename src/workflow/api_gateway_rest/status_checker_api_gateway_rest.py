@@ -1,4 +1,9 @@
-class StatusCheckerAPIGateWayRest:
+from common.models.default_strategy import DefaultStrategy
+from common.models.strategy_registry import register_strategy
+
+
+@register_strategy("API_GATEWAY_REST")
+class StatusCheckerAPIGateWayRest(DefaultStrategy):
     def __init__(self, event):
         self.event = event
 
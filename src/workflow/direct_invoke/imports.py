@@ -0,0 +1,6 @@
+# invocation source class -> module defining it, imported on first use
+DIRECT_INVOKE = {
+    "PhoneNumberFormat": "workflow.amazon_connect.phone_number_format",
+    "DynamodbLookup": "workflow.amazon_connect.dynamodb_lookup",
+    "DynamoDBLookupCheck": "workflow.amazon_connect.dynamodb_lookup_check",
+}
@@ -1,4 +1,4 @@
-from workflow.functional_url.status_checker_functional_url import StatusCheckerFunctionalUrl
-
-
-FUNCTION_URL=["StatusCheckerFunctionalUrl"]
\ No newline at end of file
+# invocation source class -> module defining it, imported on first use
+FUNCTION_URL = {
+    "StatusCheckerFunctionalUrl": "workflow.functional_url.status_checker_functional_url",
+}
@@ -1,4 +1,9 @@
-class StatusCheckerFunctionalUrl:
+from common.models.default_strategy import DefaultStrategy
+from common.models.strategy_registry import register_strategy
+
+
+@register_strategy("FUNCTION_URL")
+class StatusCheckerFunctionalUrl(DefaultStrategy):
     def __init__(self, event):
         self.event = event
 
@@ -0,0 +1,8 @@
+# invocation source class -> module defining it, imported on first use
+KINESIS = {
+    "StatusCheckerKinesis": "workflow.kinesis.status_checker_kinesis",
+    "PhoneNumberFormat": "workflow.amazon_connect.phone_number_format",
+    "DynamodbLookup": "workflow.amazon_connect.dynamodb_lookup",
+    "DynamoDBLookupCheck": "workflow.amazon_connect.dynamodb_lookup_check",
+    "DynamoDBStoreAttributes": "workflow.amazon_connect.dynamodb_store_attributes",
+}
@@ -0,0 +1,23 @@
+from common.models.default_strategy import DefaultStrategy
+from common.models.strategy_registry import register_strategy
+
+
+@register_strategy("KINESIS")
+class StatusCheckerKinesis(DefaultStrategy):
+    def __init__(self, event):
+        self.event = event
+
+    def do_validate(self):
+        return (True, None)
+
+    def do_operation(self):
+        """
+        Handle status check request for a Kinesis record.
+        """
+        return {
+            "statusCode": 200,
+            "message": "Status check successful",
+            "service": "kinesis",
+            "status": "healthy",
+            "event": self.event,
+        }
@@ -1,5 +1,5 @@
-from workflow.s3.status_checker_s3 import StatusCheckerS3
-
-
-#invocation source class
-S3=["StatusCheckerS3"]
\ No newline at end of file
+# invocation source class -> module defining it, imported on first use
+S3 = {
+    "StatusCheckerS3": "workflow.s3.status_checker_s3",
+    "S3RemovePii": "workflow.s3.s3_remove_pii",
+}
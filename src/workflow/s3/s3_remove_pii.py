@@ -3,25 +3,49 @@ s3_remove_pii.py: Lambda handler for removing PII from S3 audio files using AWS
 
 This handler uses S3 and Transcribe utility classes from the utils/ folder for all AWS operations.
 It demonstrates OOP, logging, and robust error handling.
+
+Every object of the notification is processed: all S3 `Records`, S3 events
+delivered through SQS/SNS and EventBridge S3 events. Objects are deduplicated
+by bucket/key/version and run on a bounded thread pool (S3_MAX_WORKERS), and
+one result is returned per object.
+
+Registered for S3 notifications; set S3_REQUEST_TYPE=S3RemovePii so S3 events
+are dispatched to it. Each object gets a Transcribe job with PII redaction
+writing the redacted transcript to TARGET_OUTPUT_BUCKET.
 """
 import uuid
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
 
+from common.models.default_strategy import DefaultStrategy
 from common.models.logger import Logger
+from common.models.strategy_registry import register_strategy
+
+from common.utils_methods.transcribe_utils import TranscribeUtils
+from common.utils_methods.s3_utils import iter_event_objects
 
-from common.utils_methods.transcribe_utils import check_transcription_status
-from common.utils_methods.s3_utils import get_object, put_object, delete_object, list_objects, create_presigned_url
+S3_MAX_WORKERS_ENV = 'S3_MAX_WORKERS'
+DEFAULT_S3_MAX_WORKERS = 4
 
 
-class S3RemovePii:
+@register_strategy("S3")
+class S3RemovePii(DefaultStrategy):
     """
     Handler for removing PII from S3 audio files using AWS Transcribe.
     Uses utility functions directly.
     """
-    def __init__(self):
+    def __init__(self, event):
+        self.event = event
         self.logger = Logger(__name__)
         self.target_output_bucket = os.environ.get('TARGET_OUTPUT_BUCKET', 'new-recording-with-pii')
+        self.region_name = os.environ.get('AWS_REGION', 'us-east-1')
+        self.language_code = os.environ.get('TRANSCRIBE_LANGUAGE_CODE', 'en-US')
+        self.transcribe_utils = TranscribeUtils(self.region_name)
+        try:
+            self.max_workers = max(1, int(os.environ.get(S3_MAX_WORKERS_ENV, DEFAULT_S3_MAX_WORKERS)))
+        except ValueError:
+            self.max_workers = DEFAULT_S3_MAX_WORKERS
 
     def _generate_random_id(self):
         """Generate a random UUID string."""
@@ -33,38 +57,70 @@ class S3RemovePii:
             raise e
 
     def _start_transcription_job(self, transcription_job_name, media_file_uri, target_output_bucket):
-        # Placeholder for actual implementation
-        # You should implement this function or import it from the correct utils module
-        raise NotImplementedError("start_transcription_job must be implemented or imported.")
+        """Start the PII redaction transcription job of one object."""
+        return self.transcribe_utils.start_transcription_job(
+            transcription_job_name, media_file_uri, target_output_bucket, self.language_code)
+
+    def do_validate(self):
+        if next(iter_event_objects(self.event), None) is None:
+            self.logger.error("No S3 objects found in event")
+            return False, "No S3 objects found in event"
+        return True, None
 
-    def do_operation(self, event, context):
+    def do_operation(self):
         """
-        Lambda entry point for removing PII from S3 audio files.
-        Args:
-            event (dict): Lambda event payload.
-            context: Lambda context object.
+        Remove PII from every S3 audio file of the event.
         Returns:
-            dict: Lambda response with status and message.
+            dict: status, message and one result per object.
         """
         self.logger.info('Lambda handler function')
-        source_bucket = event['Records'][0]['s3']['bucket']['name']
-        source_key = event['Records'][0]['s3']['object']['key']
+        objects = list(iter_event_objects(self.event))
+        if not objects:
+            self.logger.error("No S3 objects found in event")
+            return {
+                'statusCode': 400,
+                'message': 'No S3 objects found in event',
+                'results': [],
+            }
+
+        if len(objects) == 1 or self.max_workers == 1:
+            results = [self._process_object(s3_object) for s3_object in objects]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(objects))) as executor:
+                results = list(executor.map(self._process_object, objects))
+
+        failed = sum(1 for result in results if result['statusCode'] != 200)
+        self.logger.info(f"Processed {len(results)} objects, {failed} failed")
+        return {
+            'statusCode': 200 if not failed else 207,
+            'message': f"Processed {len(results)} objects, {failed} failed",
+            'results': results,
+        }
+
+    def _process_object(self, s3_object):
+        """
+        Start and follow the PII redaction transcription job of one object.
+        Args:
+            s3_object (dict): {"bucket", "key", "version_id"} from iter_event_objects.
+        Returns:
+            dict: result of the object with status and media file uri.
+        """
+        source_bucket = s3_object['bucket']
+        source_key = s3_object['key']
         media_file_uri = f"s3://{source_bucket}/{source_key}"
-        transcription_job_name = f"Transcription_Job_Name-{self.generate_random_id()}"
         try:
-            # Example usage of utility function:
-            # obj = get_object(source_bucket, source_key, os.environ.get('AWS_REGION', 'us-east-1'))
-            transcription_start = self.start_transcription_job(
+            transcription_job_name = f"Transcription_Job_Name-{self._generate_random_id()}"
+            transcription_start = self._start_transcription_job(
                 transcription_job_name, media_file_uri, self.target_output_bucket)
             transcription_start_status = transcription_start['TranscriptionJob']['TranscriptionJobStatus']
             if transcription_start_status in ['IN_PROGRESS', 'QUEUED']:
                 time.sleep(5)
-                check_status = check_transcription_status(transcription_job_name, os.environ.get('AWS_REGION', 'us-east-1'))
+                check_status = self.transcribe_utils.check_transcription_status(transcription_job_name)
                 self.logger.info(f"Transcription job processing completed with status: {check_status}")
                 return {
                     'statusCode': 200,
                     'message': 'Transcription job processing completed',
-                    'media_file_uri': f"s3://{source_bucket}/{source_key}",
+                    'media_file_uri': media_file_uri,
                     'Status': check_status
                 }
             elif transcription_start_status in ['COMPLETED']:
@@ -72,7 +128,7 @@ class S3RemovePii:
                 return {
                     'statusCode': 200,
                     'message': 'Transcription job processing completed',
-                    'media_file_uri': f"s3://{source_bucket}/{source_key}",
+                    'media_file_uri': media_file_uri,
                     'Status': transcription_start_status
                 }
             elif transcription_start_status in ['FAILED']:
@@ -80,7 +136,7 @@ class S3RemovePii:
                 return {
                     'statusCode': 400,
                     'message': 'Transcription job processing failed',
-                    'media_file_uri': f"s3://{source_bucket}/{source_key}",
+                    'media_file_uri': media_file_uri,
                     'Status': transcription_start_status
                 }
             else:
@@ -88,7 +144,7 @@ class S3RemovePii:
                 return {
                     'statusCode': 400,
                     'message': 'Transcription job processing not found',
-                    'media_file_uri': f"s3://{source_bucket}/{source_key}",
+                    'media_file_uri': media_file_uri,
                     'Status': 'UNKNOWN'
                 }
         except Exception as e:
@@ -97,6 +153,5 @@ class S3RemovePii:
                 'statusCode': 400,
                 'message': 'Error processing file',
                 'error': str(e),
-                'media_file_uri': f"s3://{source_bucket}/{source_key}",
+                'media_file_uri': media_file_uri,
             }
-
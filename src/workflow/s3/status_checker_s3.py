@@ -1,4 +1,9 @@
-class StatusCheckerS3:
+from common.models.default_strategy import DefaultStrategy
+from common.models.strategy_registry import register_strategy
+
+
+@register_strategy("S3")
+class StatusCheckerS3(DefaultStrategy):
     def __init__(self, event):
         self.event = event
 
@@ -0,0 +1,7 @@
+# invocation source class -> module defining it, imported on first use
+SQS = {
+    "StatusCheckerSQS": "workflow.sqs.status_checker_sqs",
+    "PhoneNumberFormat": "workflow.amazon_connect.phone_number_format",
+    "DynamodbLookup": "workflow.amazon_connect.dynamodb_lookup",
+    "DynamoDBLookupCheck": "workflow.amazon_connect.dynamodb_lookup_check",
+}